@@ -1,5 +1,6 @@
 import appdirs  # type: ignore
 import configparser  # noqa
+import os  # noqa
 import pathlib  # noqa
 import pyximport  # type: ignore
 
@@ -28,8 +29,13 @@ if not config_path.exists():
 with config_path.open() as file_pointer:
     config.read_file(file_pointer)
 
+lazy_imports = os.environ.get(
+    "SUPRIYA_LAZY_IMPORTS", config.get("core", "lazy_imports", fallback="")
+).lower() in ("1", "on", "true", "yes")
+
 del appdirs
 del configparser
+del os
 del pathlib
 del pyximport
 
@@ -82,7 +88,7 @@ def import_structured_package(path, namespace, remove=True, verbose=False):
     # Delete this function from the namespace
     this_name = inspect.currentframe().f_code.co_name
     if remove and this_name in namespace:
-        del (namespace[this_name])
+        del namespace[this_name]
 
 
 from supriya.enums import AddAction, CalculationRate  # noqa
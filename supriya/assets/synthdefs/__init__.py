@@ -1,7 +1,32 @@
-from .clap import clap  # noqa
-from .default import default  # noqa
-from .kick import kick  # noqa
-from .multiband_compressor import multiband_compressor  # noqa
-from .sweep_filter import sweep_filter  # noqa
-from .system_synthdefs import *  # noqa
-from .test import test  # noqa
+from supriya.system.LazyPackage import LazyPackage
+
+if not LazyPackage.install(
+    __name__,
+    lazy_names=dict(
+        [
+            (name, name)
+            for name in (
+                "clap",
+                "default",
+                "kick",
+                "multiband_compressor",
+                "sweep_filter",
+                "test",
+            )
+        ]
+        + [
+            ("system_link_{}_{}".format(rate, channel_count), "system_synthdefs")
+            for rate in ("audio", "control")
+            for channel_count in range(1, 17)
+        ]
+    ),
+):
+    from .clap import clap  # noqa
+    from .default import default  # noqa
+    from .kick import kick  # noqa
+    from .multiband_compressor import multiband_compressor  # noqa
+    from .sweep_filter import sweep_filter  # noqa
+    from .system_synthdefs import *  # noqa
+    from .test import test  # noqa
+
+del LazyPackage
@@ -1,8 +1,13 @@
 import abc
 import collections
+import concurrent.futures
+import contextlib
 import inspect
+import io
+import multiprocessing
 import os
 import sys
+import time
 import traceback
 
 import uqbar.io
@@ -30,6 +35,67 @@ class ProjectSectionScript(ProjectPackageScript):
                 server_options.pop(key)
         return server_options
 
+    def _build_session_renderer(self, session, **kwargs):
+        import supriya.nonrealtime
+
+        renderer_keys = (
+            "header_format",
+            "print_transcript",
+            "sample_format",
+            "sample_rate",
+            "transcript_prefix",
+        )
+        renderer = supriya.nonrealtime.SessionRenderer(
+            session=session,
+            render_directory_path=self._renders_path,
+            **{key: kwargs.pop(key) for key in renderer_keys if key in kwargs},
+        )
+        return renderer, kwargs
+
+    @contextlib.contextmanager
+    def _claim_session(self, renderer, directory_path, session_claims):
+        """
+        Claims `renderer`'s session render hash for the duration of the
+        context, so parallel jobs never render identical sessions at once.
+
+        Jobs whose session is already claimed wait for the claimant to finish,
+        then find its output already rendered. The session is compiled once,
+        here. Yields the session hash, or None if compiling failed, so callers
+        know whether `renderer` can render the compiled session as-is.
+        """
+        claims, lock = session_claims
+        session = renderer.session
+        try:
+            renderer._collect_prerender_tuples(session, duration=session.duration)
+            renderable = renderer.prerender_tuples[-1][0]
+            session_hash = renderer.renderable_prefixes[renderable].name
+        except Exception:
+            # Let the render itself surface the error.
+            renderer._reset()
+            yield None
+            return
+        claimant_path = str(directory_path.relative_to(self.inner_project_path.parent))
+        waiting = False
+        while True:
+            with lock:
+                claimant = claims.get(session_hash)
+                if claimant is None:
+                    claims[session_hash] = claimant_path
+                    break
+            if not waiting:
+                print(
+                    "    Waiting for {} from {}{} ...".format(
+                        session_hash, claimant, os.path.sep
+                    )
+                )
+                waiting = True
+            time.sleep(0.1)
+        try:
+            yield session_hash
+        finally:
+            with lock:
+                claims.pop(session_hash, None)
+
     def _handle_copy(self, source_name, target_name, force=False):
         self._copy_package(source_name, target_name, self._section_plural, force=force)
 
@@ -80,7 +146,7 @@ class ProjectSectionScript(ProjectPackageScript):
             source_name, target_name, self._section_plural, force=force
         )
 
-    def _handle_render(self, names, force=False):
+    def _handle_render(self, names, force=False, jobs=1):
         globbable_names = self._collect_globbable_names(names)
         print("Render candidates: {!r} ...".format(" ".join(globbable_names)))
         matching_paths = self._collect_matching_paths(
@@ -90,6 +156,9 @@ class ProjectSectionScript(ProjectPackageScript):
             print("    No matching {}.".format(self._section_plural))
             self._handle_list()
             sys.exit(1)
+        if 1 < jobs and 1 < len(matching_paths):
+            self._render_objects_in_parallel(matching_paths, jobs)
+            return
         for path in matching_paths:
             self._render_object(path, self._section_singular)
             print(
@@ -138,9 +207,9 @@ class ProjectSectionScript(ProjectPackageScript):
         if args.delete is not None:
             self._handle_delete(name=args.delete)
         if args.render is not None:
-            self._handle_render(force=args.force, names=args.render)
+            self._handle_render(force=args.force, jobs=args.jobs, names=args.render)
 
-    def _render_object(self, directory_path, section_singular):
+    def _render_object(self, directory_path, section_singular, session_claims=None):
         import supriya.nonrealtime
         from supriya import render
 
@@ -168,15 +237,33 @@ class ProjectSectionScript(ProjectPackageScript):
                         "print_transcript": True,
                         "transcript_prefix": "    ",
                         "build_render_yml": True,
+                        "render_cache": supriya.nonrealtime.RenderCache.from_config(),
                     }
                 )
+            if session_claims is not None and isinstance(
+                object_, supriya.nonrealtime.Session
+            ):
+                kwargs["progress"] = False
+                renderer, kwargs = self._build_session_renderer(object_, **kwargs)
+                claim = self._claim_session(renderer, directory_path, session_claims)
+            else:
+                renderer, claim = None, contextlib.ExitStack()
             try:
-                render(
-                    object_,
-                    output_file_path=output_file_path,
-                    render_directory_path=self._renders_path,
-                    **kwargs,
-                )
+                with claim as session_hash:
+                    if renderer is not None:
+                        renderer.render(
+                            output_file_path,
+                            duration=object_.duration,
+                            _precompiled=session_hash is not None,
+                            **kwargs,
+                        )
+                    else:
+                        render(
+                            object_,
+                            output_file_path=output_file_path,
+                            render_directory_path=self._renders_path,
+                            **kwargs,
+                        )
             except (NonrealtimeRenderError, NonrealtimeOutputMissing):
                 self._report_time(timer, prefix="Python/SC runtime")
                 print("    Render failed. Exiting.")
@@ -187,6 +274,83 @@ class ProjectSectionScript(ProjectPackageScript):
             self._report_time(timer, prefix="Python/SC runtime")
         return output_file_path
 
+    @classmethod
+    def _render_object_in_subprocess(cls, project_path, directory_path, session_claims):
+        script = cls()
+        script._setup_paths(project_path)
+        string_io = io.StringIO()
+        exit_code = 0
+        with uqbar.io.Timer() as timer:
+            with uqbar.io.RedirectedStreams(stdout=string_io), uqbar.io.DirectoryChange(
+                str(script.outer_project_path)
+            ):
+                try:
+                    script._render_object(
+                        directory_path,
+                        script._section_singular,
+                        session_claims=session_claims,
+                    )
+                    print(
+                        "    Rendered {path!s}{sep}".format(
+                            path=directory_path.relative_to(
+                                script.inner_project_path.parent
+                            ),
+                            sep=os.path.sep,
+                        )
+                    )
+                except SystemExit as exception:
+                    exit_code = exception.code
+        return exit_code, string_io.getvalue(), timer.elapsed_time
+
+    def _render_objects_in_parallel(self, paths, jobs):
+        """
+        Renders `paths` in a pool of `jobs` processes.
+
+        Each object's transcript is captured by its job and printed whole, in
+        the order `paths` were matched, as soon as every earlier transcript
+        has been printed.
+        """
+        elapsed_times = []
+        with uqbar.io.Timer() as timer:
+            with multiprocessing.Manager() as manager:
+                session_claims = (manager.dict(), manager.Lock())
+                with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+                    futures = [
+                        executor.submit(
+                            type(self)._render_object_in_subprocess,
+                            str(self.inner_project_path),
+                            path,
+                            session_claims,
+                        )
+                        for path in paths
+                    ]
+                    for future in futures:
+                        exit_code, transcript, elapsed_time = future.result()
+                        sys.stdout.write(transcript)
+                        sys.stdout.flush()
+                        if exit_code:
+                            for pending in futures:
+                                pending.cancel()
+                            sys.exit(exit_code)
+                        elapsed_times.append(elapsed_time)
+        relative_paths = [
+            "{}{}".format(path.relative_to(self.inner_project_path.parent), os.path.sep)
+            for path in paths
+        ]
+        width = max(len(path) for path in relative_paths)
+        print("Render times ({} jobs):".format(jobs))
+        for relative_path, elapsed_time in zip(relative_paths, elapsed_times):
+            print(
+                "    {}  {:8.2f} seconds".format(
+                    relative_path.ljust(width), elapsed_time
+                )
+            )
+        print(
+            "    {}  {:8.2f} seconds ({:.2f} seconds elapsed)".format(
+                "Total".ljust(width), sum(elapsed_times), timer.elapsed_time
+            )
+        )
+
     def _setup_argument_parser(self, parser):
         action_group = parser.add_argument_group("actions")
         action_group = action_group.add_mutually_exclusive_group(required=True)
@@ -250,6 +414,14 @@ class ProjectSectionScript(ProjectPackageScript):
         common_group.add_argument(
             "--profile", action="store_true", help="display profiler info"
         )
+        common_group.add_argument(
+            "--jobs",
+            "-j",
+            default=1,
+            help="render with N parallel jobs",
+            metavar="N",
+            type=int,
+        )
 
     ### PRIVATE PROPERTIES ###
 
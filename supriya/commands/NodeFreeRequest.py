@@ -58,16 +58,18 @@ class NodeFreeRequest(Request):
             node._set_parent(None)
             node._unregister_with_local_server()
 
-    ### PUBLIC METHODS ###
-
-    def to_osc(self, with_request_name=False):
+    def _get_osc_address_and_contents(self, with_request_name=False):
         if with_request_name:
             request_id = self.request_name
         else:
             request_id = int(self.request_id)
-        contents = [request_id]
-        contents.extend(self.node_ids)
-        message = supriya.osc.OscMessage(*contents)
+        return request_id, self.node_ids
+
+    ### PUBLIC METHODS ###
+
+    def to_osc(self, with_request_name=False):
+        address, contents = self._get_osc_address_and_contents(with_request_name)
+        message = supriya.osc.OscMessage(address, *contents)
         return message
 
     ### PUBLIC PROPERTIES ###
@@ -57,19 +57,24 @@ class NodeSetRequest(Request):
             return self._kwargs[name]
         return object.__getattr__(self, name)
 
-    ### PUBLIC METHODS ###
+    ### PRIVATE METHODS ###
 
-    def to_osc(self, with_request_name=False):
+    def _get_osc_address_and_contents(self, with_request_name=False):
         if with_request_name:
             request_id = self.request_name
         else:
             request_id = int(self.request_id)
-        node_id = int(self.node_id)
-        contents = [request_id, node_id]
+        contents = [int(self.node_id)]
         for key, value in sorted(self._kwargs.items()):
             contents.append(key)
             contents.append(value)
-        message = supriya.osc.OscMessage(*contents)
+        return request_id, contents
+
+    ### PUBLIC METHODS ###
+
+    def to_osc(self, with_request_name=False):
+        address, contents = self._get_osc_address_and_contents(with_request_name)
+        message = supriya.osc.OscMessage(address, *contents)
         return message
 
     ### PUBLIC PROPERTIES ###
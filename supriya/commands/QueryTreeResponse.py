@@ -5,7 +5,7 @@ class QueryTreeResponse(Response):
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("_node_id", "_query_tree_group")
+    __slots__ = ("_node_id", "_query_tree_group", "_query_tree_snapshot")
 
     ### INITIALIZER ###
 
@@ -13,11 +13,12 @@ class QueryTreeResponse(Response):
         Response.__init__(self, osc_message=osc_message)
         self._node_id = node_id
         self._query_tree_group = query_tree_group
+        self._query_tree_snapshot = None
 
     ### SPECIAL METHODS ###
 
     def __str__(self):
-        return str(self._query_tree_group)
+        return str(self.query_tree_group)
 
     ### PUBLIC METHODS ###
 
@@ -68,44 +69,11 @@ class QueryTreeResponse(Response):
 
         """
 
-        def recurse(contents, control_flag):
-            node_id = contents.pop(0)
-            child_count = contents.pop(0)
-            if child_count == -1:
-                controls = []
-                synthdef_name = contents.pop(0)
-                if control_flag:
-                    control_count = contents.pop(0)
-                    for i in range(control_count):
-                        control_name_or_index = contents.pop(0)
-                        control_value = contents.pop(0)
-                        control = supriya.commands.QueryTreeControl(
-                            control_name_or_index=control_name_or_index,
-                            control_value=control_value,
-                        )
-                        controls.append(control)
-                controls = tuple(controls)
-                result = supriya.commands.QueryTreeSynth(
-                    node_id=node_id, synthdef_name=synthdef_name, controls=controls
-                )
-            else:
-                children = []
-                for i in range(child_count):
-                    children.append(recurse(contents, control_flag))
-                children = tuple(children)
-                result = supriya.commands.QueryTreeGroup(
-                    node_id=node_id, children=children
-                )
-            return result
-
         import supriya.commands
 
-        contents = list(osc_message.contents)
-        control_flag = bool(contents.pop(0))
-        query_tree_group = recurse(contents, control_flag)
-        response = cls(
-            node_id=query_tree_group.node_id, query_tree_group=query_tree_group
-        )
+        snapshot = supriya.commands.QueryTreeSnapshot.from_osc_message(osc_message)
+        response = cls(node_id=snapshot.node_ids[0])
+        response._query_tree_snapshot = snapshot
         return response
 
     def to_dict(self, flat=False):
@@ -728,4 +696,18 @@ class QueryTreeResponse(Response):
 
     @property
     def query_tree_group(self):
+        """
+        Gets the response's query-tree group, building it on demand when the
+        response was parsed from an OSC message.
+        """
+        if self._query_tree_group is None and self._query_tree_snapshot is not None:
+            self._query_tree_group = self._query_tree_snapshot.to_query_tree_group()
         return self._query_tree_group
+
+    @property
+    def query_tree_snapshot(self):
+        """
+        Gets the response's compact query-tree snapshot, if the response was
+        parsed from an OSC message.
+        """
+        return self._query_tree_snapshot
@@ -0,0 +1,243 @@
+import array
+
+from supriya.system.SupriyaObject import SupriyaObject
+
+
+class QueryTreeSnapshot(SupriyaObject):
+    """
+    A compact snapshot of a ``/g_queryTree.reply``.
+
+    Nodes are stored depth-first in flat parallel arrays, with O(1) lookup by
+    node ID. Query-tree objects are only built on demand.
+
+    ::
+
+        >>> message = supriya.osc.OscMessage(
+        ...     '/g_queryTree.reply', 1, 0, 2,
+        ...     1000, -1, 'default', 2, 'amplitude', 0.1, 'frequency', 440.0,
+        ...     1001, 0,
+        ...     )
+        >>> snapshot = supriya.commands.QueryTreeSnapshot.from_osc_message(message)
+        >>> len(snapshot)
+        3
+
+    ::
+
+        >>> 1000 in snapshot, 1002 in snapshot
+        (True, False)
+
+    ::
+
+        >>> snapshot.get_parent_id(1000), snapshot.get_parent_id(0)
+        (0, None)
+
+    ::
+
+        >>> snapshot.get_synthdef_name(1000), snapshot.get_synthdef_name(1001)
+        ('default', None)
+
+    ::
+
+        >>> snapshot.get_controls(1000)
+        {'amplitude': 0.1, 'frequency': 440.0}
+
+    ::
+
+        >>> print(snapshot.to_query_tree_group())
+        NODE TREE 0 group
+            1000 default
+                amplitude: 0.1, frequency: 440.0
+            1001 group
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_child_counts",
+        "_control_names",
+        "_control_offsets",
+        "_control_values",
+        "_include_controls",
+        "_indices",
+        "_node_ids",
+        "_parent_indices",
+        "_synthdef_names",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, include_controls=False):
+        self._child_counts = array.array("l")
+        self._control_names = []
+        self._control_offsets = array.array("l", [0])
+        self._control_values = []
+        self._include_controls = bool(include_controls)
+        self._indices = {}
+        self._node_ids = array.array("l")
+        self._parent_indices = array.array("l")
+        self._synthdef_names = []
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, node_id):
+        return node_id in self._indices
+
+    def __iter__(self):
+        return iter(self._node_ids)
+
+    def __len__(self):
+        return len(self._node_ids)
+
+    ### PRIVATE METHODS ###
+
+    def _get_next_sibling_index(self, index):
+        # Skips over the subtree rooted at `index`.
+        remaining = 1
+        while remaining:
+            remaining += max(self._child_counts[index], 0) - 1
+            index += 1
+        return index
+
+    ### PUBLIC METHODS ###
+
+    @classmethod
+    def from_osc_message(cls, osc_message):
+        """
+        Parses `osc_message` into a snapshot in a single pass.
+        """
+        contents = osc_message.contents
+        snapshot = cls(include_controls=contents[0])
+        child_counts = snapshot._child_counts
+        control_names = snapshot._control_names
+        control_offsets = snapshot._control_offsets
+        control_values = snapshot._control_values
+        node_ids = snapshot._node_ids
+        parent_indices = snapshot._parent_indices
+        synthdef_names = snapshot._synthdef_names
+        # Each entry is a [node index, remaining child count] pair.
+        stack = []
+        cursor = 1
+        while True:
+            node_id, child_count = contents[cursor], contents[cursor + 1]
+            cursor += 2
+            if stack:
+                parent_indices.append(stack[-1][0])
+                stack[-1][1] -= 1
+            else:
+                parent_indices.append(-1)
+            node_index = len(node_ids)
+            node_ids.append(node_id)
+            child_counts.append(child_count)
+            if child_count == -1:
+                synthdef_names.append(contents[cursor])
+                cursor += 1
+                if snapshot._include_controls:
+                    stop = cursor + 1 + contents[cursor] * 2
+                    control_names.extend(contents[cursor + 1 : stop : 2])
+                    control_values.extend(contents[cursor + 2 : stop : 2])
+                    cursor = stop
+            else:
+                synthdef_names.append(None)
+            control_offsets.append(len(control_names))
+            if 0 < child_count:
+                stack.append([node_index, child_count])
+            while stack and not stack[-1][1]:
+                stack.pop()
+            if not stack:
+                break
+        snapshot._indices = {node_id: i for i, node_id in enumerate(node_ids)}
+        return snapshot
+
+    def get_children_ids(self, node_id):
+        """
+        Gets the IDs of `node_id`'s children, in order.
+        """
+        index = self._indices[node_id]
+        child_count = self._child_counts[index]
+        children_ids = []
+        child_index = index + 1
+        while len(children_ids) < child_count:
+            children_ids.append(self._node_ids[child_index])
+            child_index = self._get_next_sibling_index(child_index)
+        return tuple(children_ids)
+
+    def get_controls(self, node_id):
+        """
+        Gets `node_id`'s controls as a dictionary.
+        """
+        index = self._indices[node_id]
+        start, stop = self._control_offsets[index], self._control_offsets[index + 1]
+        return dict(
+            zip(self._control_names[start:stop], self._control_values[start:stop])
+        )
+
+    def get_parent_id(self, node_id):
+        """
+        Gets `node_id`'s parent's ID, or none.
+        """
+        parent_index = self._parent_indices[self._indices[node_id]]
+        if parent_index == -1:
+            return None
+        return self._node_ids[parent_index]
+
+    def get_synthdef_name(self, node_id):
+        """
+        Gets `node_id`'s SynthDef name, or none if `node_id` is a group.
+        """
+        return self._synthdef_names[self._indices[node_id]]
+
+    def to_query_tree_group(self):
+        """
+        Builds query-tree objects from this snapshot.
+        """
+        import supriya.commands
+
+        children = [[] for _ in self._node_ids]
+        node = None
+        for index in reversed(range(len(self._node_ids))):
+            node_id = self._node_ids[index]
+            if self._child_counts[index] == -1:
+                start = self._control_offsets[index]
+                stop = self._control_offsets[index + 1]
+                controls = tuple(
+                    supriya.commands.QueryTreeControl(
+                        control_name_or_index=control_name_or_index,
+                        control_value=control_value,
+                    )
+                    for control_name_or_index, control_value in zip(
+                        self._control_names[start:stop],
+                        self._control_values[start:stop],
+                    )
+                )
+                node = supriya.commands.QueryTreeSynth(
+                    node_id=node_id,
+                    synthdef_name=self._synthdef_names[index],
+                    controls=controls,
+                )
+            else:
+                node = supriya.commands.QueryTreeGroup(
+                    node_id=node_id, children=tuple(reversed(children[index]))
+                )
+            parent_index = self._parent_indices[index]
+            if parent_index != -1:
+                children[parent_index].append(node)
+        return node
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def include_controls(self):
+        return self._include_controls
+
+    @property
+    def node_ids(self):
+        return self._node_ids
+
+    @property
+    def parent_indices(self):
+        return self._parent_indices
+
+    @property
+    def synthdef_names(self):
+        return self._synthdef_names
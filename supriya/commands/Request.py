@@ -16,6 +16,10 @@ class Request(Requestable):
     def _apply_local(self, server):
         pass
 
+    def _get_osc_address_and_contents(self, with_request_name=False):
+        message = self.to_osc(with_request_name=with_request_name)
+        return message.address, message.contents
+
     def _get_response_pattern_and_message(self, server):
         response_pattern = self.response_patterns[0]
         message = self.to_osc()
@@ -23,8 +27,7 @@ class Request(Requestable):
 
     def _handle_async(self, sync, server):
         if not sync or not self.response_patterns:
-            message = self.to_osc()
-            server.send_message(message)
+            server.send_message(self)
             return True
 
     def _linearize(self):
@@ -37,7 +40,11 @@ class Request(Requestable):
     ### PUBLIC METHODS ###
 
     def to_datagram(self):
-        return self.to_osc().to_datagram()
+        import supriya.osc
+
+        return supriya.osc.OscCodec.encode_message(
+            *self._get_osc_address_and_contents()
+        )
 
     def to_list(self, with_request_name=False):
         return self.to_osc(with_request_name=with_request_name).to_list()
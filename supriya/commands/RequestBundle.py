@@ -1,4 +1,3 @@
-import threading
 import time
 
 import supriya.osc
@@ -53,7 +52,7 @@ class RequestBundle(Requestable):
     def __init__(self, timestamp=None, contents=None):
         import supriya.commands
 
-        self._condition = threading.Condition()
+        self._condition = None
         self._timestamp = timestamp
         if contents is not None:
             prototype = (supriya.commands.Request, type(self))
@@ -76,8 +75,7 @@ class RequestBundle(Requestable):
 
     def _handle_async(self, sync, server):
         if not sync:
-            message = self.to_osc()
-            server.send_message(message)
+            server.send_message(self)
             return True
 
     def _linearize(self):
@@ -96,9 +94,9 @@ class RequestBundle(Requestable):
             if apply_local:
                 for request in self._linearize():
                     request._apply_local(server)
+        server.control_outbox.flush()
         if not sync:
-            message = self.to_osc()
-            server.send_message(message)
+            server.send_message(self)
             return None
         sync_id = server.next_sync_id
         contents = list(self.contents)
@@ -127,8 +125,8 @@ class RequestBundle(Requestable):
             return None
         return self._response
 
-    def to_datagram(self):
-        return self.to_osc().to_datagram()
+    def to_datagram(self, realtime=True):
+        return supriya.osc.OscCodec.encode_bundle(self, realtime=realtime)
 
     def to_list(self, with_request_name=False):
         return self.to_osc(with_request_name).to_list()
@@ -145,10 +143,6 @@ class RequestBundle(Requestable):
 
     ### PUBLIC PROPERTIES ###
 
-    @property
-    def condition(self):
-        return self._condition
-
     @property
     def contents(self):
         return self._contents
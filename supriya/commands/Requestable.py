@@ -10,10 +10,12 @@ class Requestable(SupriyaValueObject):
 
     __slots__ = ("_condition", "_response")
 
+    _condition_lock = threading.Lock()
+
     ### INITIALIZER ###
 
     def __init__(self):
-        self._condition = threading.Condition()
+        self._condition = None
         self._response = None
 
     ### PRIVATE METHODS ###
@@ -34,6 +36,52 @@ class Requestable(SupriyaValueObject):
 
     ### PUBLIC METHODS ###
 
+    async def async_communicate(
+        self, server=None, sync=True, timeout=1.0, apply_local=True
+    ):
+        """
+        Communicates with `server` without blocking the event loop.
+
+        Returns an awaitable resolving to the response. The response is
+        matched by the request's response pattern, so many requests can be
+        in flight at once, e.g. via ``asyncio.gather()``.
+        """
+        import asyncio
+        import supriya.realtime
+
+        server = server or supriya.realtime.Server.get_default_server()
+        assert isinstance(server, supriya.realtime.Server)
+        assert server.is_running
+        with server._lock:
+            if apply_local:
+                for request in self._linearize():
+                    request._apply_local(server)
+        server.control_outbox.flush()
+        if self._handle_async(sync, server):
+            return
+        response_pattern, message = self._get_response_pattern_and_message(server)
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+
+        def resolve(response):
+            if not future.done():
+                self._response = response
+                future.set_result(response)
+
+        callback = server.osc_io.register(
+            pattern=response_pattern,
+            procedure=lambda response: loop.call_soon_threadsafe(resolve, response),
+            once=True,
+            parse_response=True,
+        )
+        server.send_message(message)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            server.osc_io.unregister(callback)
+            print("TIMED OUT:", repr(self))
+            return None
+
     def communicate(self, server=None, sync=True, timeout=1.0, apply_local=True):
         import supriya.realtime
 
@@ -44,6 +92,7 @@ class Requestable(SupriyaValueObject):
             if apply_local:
                 for request in self._linearize():
                     request._apply_local(server)
+        server.control_outbox.flush()
         # handle non-sync
         if self._handle_async(sync, server):
             return
@@ -74,6 +123,12 @@ class Requestable(SupriyaValueObject):
 
     @property
     def condition(self):
+        # Most requests are sent without waiting for a response, so their
+        # conditions are only created once something waits on them.
+        if self._condition is None:
+            with self._condition_lock:
+                if self._condition is None:
+                    self._condition = threading.Condition()
         return self._condition
 
     @property
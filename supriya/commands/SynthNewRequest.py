@@ -92,9 +92,7 @@ class SynthNewRequest(Request):
         )
         target_node._move_node(add_action=self.add_action, node=synth)
 
-    ### PUBLIC METHODS ###
-
-    def to_osc(self, with_request_name=False):
+    def _get_osc_address_and_contents(self, with_request_name=False):
         import supriya.synthdefs
 
         if with_request_name:
@@ -107,11 +105,19 @@ class SynthNewRequest(Request):
         node_id = int(self.node_id)
         add_action = int(self.add_action)
         target_node_id = int(self.target_node_id)
-        contents = [request_id, synthdef, node_id, add_action, target_node_id]
+        contents = [synthdef, node_id, add_action, target_node_id]
         for key, value in self._kwargs:
             contents.append(key)
             contents.append(value)
-        message = supriya.osc.OscMessage(*contents)
+        return request_id, contents
+
+    ### PUBLIC METHODS ###
+
+    def to_osc(self, with_request_name=False):
+        import supriya.osc
+
+        address, contents = self._get_osc_address_and_contents(with_request_name)
+        message = supriya.osc.OscMessage(address, *contents)
         return message
 
     ### PUBLIC PROPERTIES ###
@@ -71,6 +71,7 @@ from .ParallelGroupNewRequest import ParallelGroupNewRequest  # noqa
 from .QueryTreeControl import QueryTreeControl  # noqa
 from .QueryTreeGroup import QueryTreeGroup  # noqa
 from .QueryTreeResponse import QueryTreeResponse  # noqa
+from .QueryTreeSnapshot import QueryTreeSnapshot  # noqa
 from .QueryTreeSynth import QueryTreeSynth  # noqa
 from .QuitRequest import QuitRequest  # noqa
 from .Request import Request  # noqa
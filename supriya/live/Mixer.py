@@ -48,43 +48,22 @@ class Mixer:
     ### PRIVATE METHODS ###
 
     def _handle_input_levels(self, message):
-        node_id = message.contents[0]
-        levels = message.contents[2:]
-        track = self._levels_mapping.get(node_id)
+        track = self._levels_mapping.get(message.contents[0])
         if track is None:
             return
-        peak, rms, = [], []
-        for index in range(0, len(levels), 2):
-            peak.append(levels[index])
-            rms.append(levels[index + 1])
-        levels = dict(peak=tuple(peak), rms=tuple(rms))
-        track._input_levels = levels
+        track._input_levels = self._record_levels(track, "input", message)
 
     def _handle_prefader_levels(self, message):
-        node_id = message.contents[0]
-        levels = message.contents[2:]
-        track = self._levels_mapping.get(node_id)
+        track = self._levels_mapping.get(message.contents[0])
         if track is None:
             return
-        peak, rms, = [], []
-        for index in range(0, len(levels), 2):
-            peak.append(levels[index])
-            rms.append(levels[index + 1])
-        levels = dict(peak=tuple(peak), rms=tuple(rms))
-        track._prefader_levels = levels
+        track._prefader_levels = self._record_levels(track, "prefader", message)
 
     def _handle_postfader_levels(self, message):
-        node_id = message.contents[0]
-        levels = message.contents[2:]
-        track = self._levels_mapping.get(node_id)
+        track = self._levels_mapping.get(message.contents[0])
         if track is None:
             return
-        peak, rms, = [], []
-        for index in range(0, len(levels), 2):
-            peak.append(levels[index])
-            rms.append(levels[index + 1])
-        levels = dict(peak=tuple(peak), rms=tuple(rms))
-        track._postfader_levels = levels
+        track._postfader_levels = self._record_levels(track, "postfader", message)
 
     @staticmethod
     def _is_power_of_two(integer):
@@ -93,6 +72,12 @@ class Mixer:
             return not bool(integer & (integer - 1))
         return False
 
+    @staticmethod
+    def _record_levels(track, kind, message):
+        levels = message.contents[2:]
+        track._level_histories[kind].append(levels)
+        return dict(peak=levels[::2], rms=levels[1::2])
+
     def _setup_master_track(self):
         track = Track(self, name="master", channel_count=self._channel_count)
         mapping = [(i, i) for i in range(self._channel_count)]
@@ -111,13 +96,19 @@ class Mixer:
     def _allocate_osc_callbacks(self):
         self._callbacks = [
             self.server.osc_io.register(
-                pattern="/levels/input", procedure=self._handle_input_levels
+                pattern="/levels/input",
+                procedure=self._handle_input_levels,
+                droppable=True,
             ),
             self.server.osc_io.register(
-                pattern="/levels/prefader", procedure=self._handle_prefader_levels
+                pattern="/levels/prefader",
+                procedure=self._handle_prefader_levels,
+                droppable=True,
             ),
             self.server.osc_io.register(
-                pattern="/levels/postfader", procedure=self._handle_postfader_levels
+                pattern="/levels/postfader",
+                procedure=self._handle_postfader_levels,
+                droppable=True,
             ),
         ]
 
@@ -35,7 +35,7 @@ class SynthSlot(Slot):
         for key in tuple(kwargs):
             if key in ("in_", "out", "gate"):
                 kwargs.pop(key)
-            elif key not in self._synthdef.parameter_names:
+            elif key not in self._synthdef.metadata.parameter_names:
                 kwargs.pop(key)
         return BindableNamespace(**kwargs)
 
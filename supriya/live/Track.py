@@ -41,6 +41,10 @@ class Track:
         self._input_levels = None
         self._prefader_levels = None
         self._postfader_levels = None
+        self._level_histories = {
+            kind: supriya.system.RingBuffer(width=self.channel_count * 2)
+            for kind in ("input", "prefader", "postfader")
+        }
         self._slots = []
         self._slots_by_name = {}
 
@@ -286,6 +290,17 @@ class Track:
         name = "mixer/output/{}".format(channel_count)
         return synthdef_builder.build(name=name)
 
+    def get_level_history(self, kind="postfader", count=None):
+        """
+        Gets up to `count` of the latest `input`, `prefader` or `postfader`
+        levels, oldest first.
+
+        Returns NumPy arrays of peak and RMS levels, each of shape `(count,
+        channels)`.
+        """
+        levels = self._level_histories[kind].latest(count)
+        return levels[:, 0::2], levels[:, 1::2]
+
     def remove_send(self, target_name):
         assert target_name in self._outgoing_sends
         send = self._outgoing_sends.pop(target_name)
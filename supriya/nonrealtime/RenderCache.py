@@ -0,0 +1,256 @@
+import contextlib
+import json
+import os
+import pathlib
+import shutil
+import threading
+import time
+import uuid
+from typing import NamedTuple
+
+import supriya
+from supriya.system.SupriyaObject import SupriyaObject
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+
+class RenderCache(SupriyaObject):
+    """
+    A content-addressed cache of non-realtime render outputs.
+
+    Session renderers name their outputs after a hash of each session's
+    datagram and render settings, e.g. ``session-<md5>.aiff``. The render
+    cache stores those outputs under a shared root directory, so identical
+    sessions rendered from different render directories, or different
+    projects, are only rendered once. Outputs of sessions with an input
+    soundfile are keyed by that name plus a hash of the input's contents.
+
+    The cache keeps a JSON index of each entry's size and last access time,
+    and evicts least-recently-used entries when it grows past
+    `maximum_size` bytes or `maximum_entry_count` entries.
+
+    ::
+
+        >>> import tempfile
+        >>> with tempfile.TemporaryDirectory() as temp_directory:
+        ...     render_cache = supriya.nonrealtime.RenderCache(temp_directory)
+        ...     "session-0123.aiff" in render_cache
+        ...
+        False
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    class Statistics(NamedTuple):
+        hit_count: int
+        miss_count: int
+        store_count: int
+        eviction_count: int
+        entry_count: int
+        total_size: int
+
+    __documentation_section__ = "Session Internals"
+
+    __slots__ = (
+        "_eviction_count",
+        "_hit_count",
+        "_lock",
+        "_maximum_entry_count",
+        "_maximum_size",
+        "_miss_count",
+        "_root_path",
+        "_store_count",
+    )
+
+    _index_file_name = "index.json"
+
+    _lock_file_name = "index.lock"
+
+    ### INITIALIZER ###
+
+    def __init__(self, root_path=None, maximum_size=None, maximum_entry_count=None):
+        if root_path is None:
+            root_path = pathlib.Path(supriya.output_path) / "render-cache"
+        self._root_path = pathlib.Path(root_path).expanduser().absolute()
+        self._root_path.mkdir(parents=True, exist_ok=True)
+        if maximum_size is not None:
+            maximum_size = int(maximum_size)
+        self._maximum_size = maximum_size
+        if maximum_entry_count is not None:
+            maximum_entry_count = int(maximum_entry_count)
+        self._maximum_entry_count = maximum_entry_count
+        self._lock = threading.RLock()
+        self._eviction_count = 0
+        self._hit_count = 0
+        self._miss_count = 0
+        self._store_count = 0
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, key):
+        with self._locked():
+            entry = self._read_index().get(key)
+        return entry is not None and (self.root_path / key).exists()
+
+    def __len__(self):
+        with self._locked():
+            return len(self._read_index())
+
+    ### PRIVATE METHODS ###
+
+    def _copy_atomically(self, source_path, target_path):
+        temporary_path = target_path.with_name(
+            ".{}.{}".format(target_path.name, uuid.uuid4().hex)
+        )
+        try:
+            # Copy rather than hard-link, so entries never share storage with
+            # files outside the cache.
+            shutil.copyfile(str(source_path), str(temporary_path))
+            os.replace(str(temporary_path), str(target_path))
+        finally:
+            if temporary_path.exists():
+                temporary_path.unlink()
+
+    def _evict(self, index):
+        entries = sorted(index.items(), key=lambda x: x[1]["last_access"])
+        total_size = sum(entry["size"] for _, entry in entries)
+        for key, entry in entries:
+            if (self.maximum_size is None or total_size <= self.maximum_size) and (
+                self.maximum_entry_count is None
+                or len(index) <= self.maximum_entry_count
+            ):
+                break
+            del index[key]
+            total_size -= entry["size"]
+            file_path = self.root_path / key
+            if file_path.exists():
+                file_path.unlink()
+            self._eviction_count += 1
+
+    @contextlib.contextmanager
+    def _locked(self):
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(str(self.root_path / self._lock_file_name), "a") as file_pointer:
+                fcntl.flock(file_pointer, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(file_pointer, fcntl.LOCK_UN)
+
+    def _read_index(self):
+        try:
+            with open(str(self.root_path / self._index_file_name)) as file_pointer:
+                return json.load(file_pointer)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write_index(self, index):
+        index_file_path = self.root_path / self._index_file_name
+        temporary_path = index_file_path.with_name(
+            ".{}.{}".format(index_file_path.name, uuid.uuid4().hex)
+        )
+        with open(str(temporary_path), "w") as file_pointer:
+            json.dump(index, file_pointer, indent=1, sort_keys=True)
+        os.replace(str(temporary_path), str(index_file_path))
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        """
+        Removes every entry from the render cache.
+        """
+        with self._locked():
+            for key in self._read_index():
+                file_path = self.root_path / key
+                if file_path.exists():
+                    file_path.unlink()
+            self._write_index({})
+
+    def fetch(self, key, target_path):
+        """
+        Copies the entry stored under `key` to `target_path`.
+
+        Returns true on a cache hit, otherwise false.
+        """
+        target_path = pathlib.Path(target_path)
+        with self._locked():
+            index = self._read_index()
+            file_path = self.root_path / key
+            if key not in index or not file_path.exists():
+                if index.pop(key, None) is not None:
+                    self._write_index(index)
+                self._miss_count += 1
+                return False
+            self._copy_atomically(file_path, target_path)
+            index[key]["last_access"] = time.time()
+            self._write_index(index)
+            self._hit_count += 1
+        return True
+
+    @classmethod
+    def from_config(cls):
+        """
+        Makes a render cache from the ``render_cache`` setting in the
+        ``core`` section of Supriya's config file, if set.
+
+        ``render_cache_size`` optionally caps the cache's size, in bytes.
+        """
+        root_path = supriya.config.get("core", "render_cache", fallback=None)
+        if not root_path:
+            return None
+        maximum_size = supriya.config.get("core", "render_cache_size", fallback=None)
+        return cls(root_path=root_path, maximum_size=maximum_size or None)
+
+    def store(self, key, source_path):
+        """
+        Stores `source_path` in the render cache under `key`.
+        """
+        source_path = pathlib.Path(source_path)
+        with self._locked():
+            index = self._read_index()
+            self._copy_atomically(source_path, self.root_path / key)
+            index[key] = {
+                "last_access": time.time(),
+                "size": source_path.stat().st_size,
+            }
+            self._evict(index)
+            self._write_index(index)
+            self._store_count += 1
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def maximum_entry_count(self):
+        return self._maximum_entry_count
+
+    @property
+    def maximum_size(self):
+        return self._maximum_size
+
+    @property
+    def root_path(self):
+        return self._root_path
+
+    @property
+    def statistics(self):
+        """
+        Gets hit, miss, store and eviction counts for this render cache,
+        along with its current entry count and total size in bytes.
+        """
+        with self._locked():
+            index = self._read_index()
+        return self.Statistics(
+            hit_count=self._hit_count,
+            miss_count=self._miss_count,
+            store_count=self._store_count,
+            eviction_count=self._eviction_count,
+            entry_count=len(index),
+            total_size=sum(entry["size"] for entry in index.values()),
+        )
@@ -1,8 +1,8 @@
 import bisect
 import collections
+import heapq
 import os
 import pathlib
-from queue import PriorityQueue
 
 import uqbar.io
 
@@ -367,47 +367,41 @@ class Session:
         old_state = self._find_state_before(offset)
         state = old_state._clone(offset)
         self.states[offset] = state
-        self.offsets.insert(self.offsets.index(old_state.offset) + 1, offset)
+        bisect.insort(self.offsets, offset)
         return state
 
     def _apply_transitions(self, offsets, chain=True):
+        """
+        Re-derives the node trees of the states at `offsets` from their
+        predecessors' node trees.
+
+        When `chain` is true, any state whose node tree changed propagates to
+        the next state, and propagation stops at the first state whose node
+        tree is unchanged.
+        """
         import supriya.nonrealtime
 
         if supriya.nonrealtime.DoNotPropagate._stack:
             return
-        queue = PriorityQueue()
         try:
-            for offset in offsets:
-                queue.put(offset)
+            queue = sorted(set(offsets))
         except TypeError:
-            queue.put(offsets)
-        previous_offset = None
-        while not queue.empty():
-            offset = queue.get()
-            if offset == previous_offset:
-                continue
-            previous_offset = offset
-            state = self._find_state_at(offset, clone_if_missing=False)
+            queue = [offsets]
+        queued_offsets = set(queue)
+        while queue:
+            offset = heapq.heappop(queue)
+            state = self.states.get(offset)
             if state is None:
                 continue
             previous_state = self._find_state_before(offset, with_node_tree=True)
             assert previous_state is not None
-            result = supriya.nonrealtime.State._apply_transitions(
-                state.transitions,
-                previous_state.nodes_to_children,
-                previous_state.nodes_to_parents,
-                state.stop_nodes,
-            )
-            nodes_to_children, nodes_to_parents = result
-            changed = False
-            if nodes_to_children != state.nodes_to_children:
-                state._nodes_to_children = nodes_to_children
-                state._nodes_to_parents = nodes_to_parents
-                changed = True
-            if changed and chain:
-                next_state = self._find_state_after(offset, with_node_tree=True)
-                if next_state is not None:
-                    queue.put(next_state.offset)
+            changed = state._propagate(previous_state)
+            if not (changed and chain):
+                continue
+            next_state = self._find_state_after(offset, with_node_tree=True)
+            if next_state is not None and next_state.offset not in queued_offsets:
+                queued_offsets.add(next_state.offset)
+                heapq.heappush(queue, next_state.offset)
 
     def _build_id_mapping(self):
         id_mapping = {}
@@ -698,7 +692,7 @@ class Session:
                     synth_kwargs = source.synth_kwargs
                     if source in node_settings:
                         synth_kwargs.update(node_settings.pop(source))
-                    if "duration" in source.synthdef.parameter_names:
+                    if "duration" in source.synthdef.metadata.parameter_names:
                         # need to propagate in session rendering timespan
                         # as many nodes have "infinite" duration
                         node_duration = source.duration
@@ -721,10 +715,7 @@ class Session:
             free_ids, gate_ids = [], []
             for node in stop_nodes:
                 node_id = id_mapping[node]
-                if (
-                    hasattr(node, "synthdef")
-                    and "gate" in node.synthdef.parameter_names
-                ):
+                if hasattr(node, "synthdef") and node.synthdef.metadata.has_gate:
                     gate_ids.append(node_id)
                 elif node.duration:
                     free_ids.append(node_id)
@@ -902,7 +893,7 @@ class Session:
             old_state = self._find_state_before(offset, with_node_tree=True)
             state = old_state._clone(offset)
             self.states[offset] = state
-            self.offsets.insert(self.offsets.index(old_state.offset) + 1, offset)
+            bisect.insort(self.offsets, offset)
         return state
 
     def _find_state_before(self, offset, with_node_tree=None):
@@ -977,7 +968,11 @@ class Session:
         del (self.states[offset])
         return state
 
-    def _to_non_xrefd_osc_bundles(self, duration=None):
+    def _iterate_non_xrefd_osc_bundles(self, duration=None):
+        """
+        Yields the session's OSC bundles offset by offset, with references to
+        other sessions unresolved.
+        """
         id_mapping = self._build_id_mapping()
         if self.duration == float("inf"):
             assert duration is not None and 0 < duration < float("inf")
@@ -989,7 +984,6 @@ class Session:
         buffer_settings = self._collect_buffer_settings(id_mapping)
         bus_settings = self._collect_bus_settings(id_mapping)
         is_last_offset = False
-        osc_bundles = []
         buffer_open_states = {}
         visited_synthdefs = set()
         for offset in offsets:
@@ -1010,13 +1004,14 @@ class Session:
             if is_last_offset:
                 osc_messages.append(supriya.osc.OscMessage(0))
             if osc_messages:
-                osc_bundle = supriya.osc.OscBundle(
+                yield supriya.osc.OscBundle(
                     timestamp=float(offset), contents=osc_messages
                 )
-                osc_bundles.append(osc_bundle)
             if is_last_offset:
                 break
-        return osc_bundles
+
+    def _to_non_xrefd_osc_bundles(self, duration=None):
+        return list(self._iterate_non_xrefd_osc_bundles(duration))
 
     ### PUBLIC METHODS ###
 
@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import os
 import pathlib
@@ -5,6 +6,8 @@ import shutil
 import struct
 import subprocess
 import sys
+import tempfile
+import threading
 
 import tqdm  # type: ignore
 import uqbar.containers
@@ -34,15 +37,19 @@ class SessionRenderer(SupriyaObject):
         "_header_format",
         "_prerender_tuples",
         "_print_transcript",
+        "_render_cache",
         "_render_directory_path",
         "_sample_format",
         "_sample_rate",
         "_session",
         "_session_input_paths",
         "_renderable_prefixes",
+        "_stream",
+        "_streamed_file_paths",
         "_transcript",
         "_transcript_prefix",
         "_dependency_graph",
+        "_local",
         "_sessionables_to_sessions",
     )
 
@@ -81,25 +88,26 @@ class SessionRenderer(SupriyaObject):
             transcript_prefix = str(transcript_prefix)
         self._transcript_prefix = transcript_prefix
 
+        self._local = threading.local()
+
+        self._render_cache = None
+
+        self._stream = False
+
         self._reset()
 
     ### PRIVATE METHODS ###
 
     def _build_datagram(self, osc_bundles):
-        datagrams = []
-        for osc_bundle in osc_bundles:
-            datagram = osc_bundle.to_datagram(realtime=False)
-            size = len(datagram)
-            size = struct.pack(">i", size)
-            datagrams.append(size)
-            datagrams.append(datagram)
-        datagram = b"".join(datagrams)
-        return datagram
+        return b"".join(self._iterate_datagram(osc_bundles))
 
     def _build_file_path(self, datagram, input_file_path, session):
         # print('BUILDING FILE PATH')
         md5 = hashlib.md5()
         md5.update(datagram)
+        return self._build_file_path_from_md5(md5, input_file_path, session)
+
+    def _build_file_path_from_md5(self, md5, input_file_path, session):
         hash_values = []
         if input_file_path is not None:
             hash_values.append(input_file_path)
@@ -120,6 +128,22 @@ class SessionRenderer(SupriyaObject):
         file_path = "session-{}.osc".format(md5)
         return pathlib.Path(file_path)
 
+    def _build_render_cache_key(self, input_file_path, output_file_path):
+        # Outputs are named after their input file's path, not its contents,
+        # so fold a hash of those contents into the render cache key.
+        if not input_file_path:
+            return output_file_path.name
+        md5 = hashlib.md5()
+        try:
+            with open(str(input_file_path), "rb") as file_pointer:
+                for chunk in iter(lambda: file_pointer.read(1 << 20), b""):
+                    md5.update(chunk)
+        except OSError:
+            return None
+        return "{}-{}{}".format(
+            output_file_path.stem, md5.hexdigest(), output_file_path.suffix
+        )
+
     def _build_render_command(
         self,
         input_file_path,
@@ -162,23 +186,7 @@ class SessionRenderer(SupriyaObject):
         return render_yaml
 
     def _build_xrefd_bundles(self, osc_bundles):
-        extension = ".{}".format(self.header_format.name.lower())
-        for osc_bundle in osc_bundles:
-            for osc_message in osc_bundle.contents:
-                contents = list(osc_message.contents)
-                for i, x in enumerate(contents):
-                    x = self._sessionable_to_session(x)
-                    try:
-                        if x not in self.renderable_prefixes:
-                            continue
-                    except TypeError:
-                        continue
-                    renderable_file_path = self.renderable_prefixes[x].with_suffix(
-                        extension
-                    )
-                    contents[i] = str(renderable_file_path)
-                osc_message._contents = tuple(contents)
-        return osc_bundles
+        return list(self._iterate_xrefd_bundles(osc_bundles))
 
     def _build_dependency_graph_and_nonxrefd_osc_bundles_conditionally(
         self, expr, parent
@@ -198,8 +206,16 @@ class SessionRenderer(SupriyaObject):
         if isinstance(input_, str):
             input_ = pathlib.Path(input_)
         input_ = self._sessionable_to_session(input_)
-        non_xrefd_bundles = session._to_non_xrefd_osc_bundles(duration)
-        self.compiled_sessions[session] = input_, non_xrefd_bundles
+        non_xrefd_bundles = session._iterate_non_xrefd_osc_bundles(duration)
+        if self._stream:
+            # Keep the means to regenerate the bundles, not the bundles.
+            self.compiled_sessions[session] = (
+                input_,
+                functools.partial(session._iterate_non_xrefd_osc_bundles, duration),
+            )
+        else:
+            non_xrefd_bundles = list(non_xrefd_bundles)
+            self.compiled_sessions[session] = input_, non_xrefd_bundles
         if session is self.session:
             self.dependency_graph.add(session)
         self._build_dependency_graph_and_nonxrefd_osc_bundles_conditionally(
@@ -215,14 +231,18 @@ class SessionRenderer(SupriyaObject):
     def _call_subprocess(self, command):
         return subprocess.call(command, shell=True)
 
-    def _stream_subprocess(self, command, session_duration):
+    def _stream_subprocess(self, command, session_duration, progress=True):
         process = subprocess.Popen(
             command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
         )
         previous_value = 0
         progress_bar = tqdm.tqdm(
-            bar_format=(), total=int(session_duration * 1000), unit="ms"
+            bar_format=(),
+            disable=not progress,
+            total=int(session_duration * 1000),
+            unit="ms",
         )
+        write = progress_bar.write if progress else self._report
         with progress_bar:
             while True:
                 output = process.stdout.readline()
@@ -239,11 +259,11 @@ class SessionRenderer(SupriyaObject):
                 elif output.startswith("FAILURE"):
                     if output.startswith("FAILURE IN SERVER /n_free Node"):
                         continue
-                    progress_bar.write(output)
+                    write(output)
                 elif output.startswith("start time 0"):
                     continue
                 else:
-                    progress_bar.write("WARNING: {}".format(output))
+                    write("WARNING: {}".format(output))
         return process.poll()
 
     def _collect_prerender_tuples(self, session, duration=None):
@@ -271,7 +291,6 @@ class SessionRenderer(SupriyaObject):
 
     def _collect_session_prerender_tuple(self, session, extension):
         input_, non_xrefd_bundles = self.compiled_sessions[session]
-        osc_bundles = self._build_xrefd_bundles(non_xrefd_bundles)
         input_file_path = input_
         if input_ and input_ in self.renderable_prefixes:
             input_file_path = self.renderable_prefixes[input_]
@@ -281,18 +300,58 @@ class SessionRenderer(SupriyaObject):
                 input_file_path, self.render_directory_path
             )
             self.session_input_paths[session] = input_file_path
+        if self._stream:
+            osc_bundles = self._iterate_xrefd_bundles(non_xrefd_bundles())
+            datagram, md5 = self._stream_datagram(osc_bundles)
+            renderable_prefix = self._build_file_path_from_md5(
+                md5, input_file_path, session
+            ).with_suffix("")
+            return (session, datagram, input_, None), renderable_prefix
+        osc_bundles = self._build_xrefd_bundles(non_xrefd_bundles)
         datagram = self._build_datagram(osc_bundles)
         renderable_prefix = self._build_file_path(
             datagram, input_file_path, session
         ).with_suffix("")
         return (session, datagram, input_, osc_bundles), renderable_prefix
 
+    def _get_relative_file_path(self, file_path):
+        cwd = pathlib.Path.cwd()
+        if file_path.is_absolute() and cwd in file_path.parents:
+            return file_path.relative_to(cwd)
+        return file_path
+
+    def _iterate_datagram(self, osc_bundles):
+        for osc_bundle in osc_bundles:
+            datagram = osc_bundle.to_datagram(realtime=False)
+            yield struct.pack(">i", len(datagram))
+            yield datagram
+
+    def _iterate_xrefd_bundles(self, osc_bundles):
+        extension = ".{}".format(self.header_format.name.lower())
+        for osc_bundle in osc_bundles:
+            for osc_message in osc_bundle.contents:
+                contents = list(osc_message.contents)
+                for i, x in enumerate(contents):
+                    x = self._sessionable_to_session(x)
+                    try:
+                        if x not in self.renderable_prefixes:
+                            continue
+                    except TypeError:
+                        continue
+                    renderable_file_path = self.renderable_prefixes[x].with_suffix(
+                        extension
+                    )
+                    contents[i] = str(renderable_file_path)
+                osc_message._contents = tuple(contents)
+            yield osc_bundle
+
     def _render_datagram(
         self,
         session,
         input_file_path,
         output_file_path,
         session_osc_file_path,
+        progress=True,
         **kwargs,
     ):
         relative_session_osc_file_path = session_osc_file_path
@@ -308,6 +367,20 @@ class SessionRenderer(SupriyaObject):
                 )
             )
             return 0
+        render_cache_key = None
+        if self._render_cache is not None:
+            render_cache_key = self._build_render_cache_key(
+                input_file_path, output_file_path
+            )
+        if render_cache_key is not None and self._render_cache.fetch(
+            render_cache_key, output_file_path
+        ):
+            self._report(
+                "    Skipped {}. Output found in render cache.".format(
+                    relative_session_osc_file_path
+                )
+            )
+            return 0
         server_options = session._options
         server_options = utils.new(server_options, **kwargs)
         memory_size = server_options.memory_size
@@ -319,7 +392,9 @@ class SessionRenderer(SupriyaObject):
                 server_options=server_options,
             )
             self._report("    Command: {}".format(command))
-            exit_code = self._stream_subprocess(command, session.duration)
+            exit_code = self._stream_subprocess(
+                command, session.duration, progress=progress
+            )
             server_options = utils.new(
                 server_options, memory_size=memory_size * (2 ** factor)
             )
@@ -336,8 +411,115 @@ class SessionRenderer(SupriyaObject):
                     )
                 )
                 break
+        if render_cache_key is not None and not exit_code and output_file_path.exists():
+            self._render_cache.store(render_cache_key, output_file_path)
         return exit_code
 
+    def _render_prerender_tuple(
+        self, prerender_tuple, extension, progress=True, **kwargs
+    ):
+        import supriya.nonrealtime
+
+        renderable = prerender_tuple[0]
+        renderable_prefix = self.renderable_prefixes[renderable]
+        output_file_path = renderable_prefix.with_suffix(extension)
+        if not isinstance(renderable, supriya.nonrealtime.Session):
+            renderable.__render__(
+                output_file_path=output_file_path,
+                print_transcript=self.print_transcript,
+            )
+            return 0
+        (session, datagram, input_, _) = prerender_tuple
+        osc_file_path = renderable_prefix.with_suffix(".osc")
+        input_file_path = self.session_input_paths.get(session)
+        self._write_datagram(osc_file_path, datagram)
+        try:
+            return self._render_datagram(
+                session,
+                input_file_path,
+                output_file_path,
+                osc_file_path,
+                progress=progress,
+                **kwargs,
+            )
+        except Exception:
+            output_file_path.unlink()
+            sys.exit(1)
+
+    def _render_prerender_tuple_buffered(self, prerender_tuple, extension, **kwargs):
+        self._local.transcript = transcript = []
+        try:
+            exit_code = self._render_prerender_tuple(
+                prerender_tuple, extension, progress=False, **kwargs
+            )
+        finally:
+            self._local.transcript = None
+        return exit_code, transcript
+
+    def _render_prerender_tuples_in_parallel(self, concurrency, extension, **kwargs):
+        import concurrent.futures
+
+        renderables = [prerender_tuple[0] for prerender_tuple in self.prerender_tuples]
+        prerender_tuples = dict(zip(renderables, self.prerender_tuples))
+        dependencies = {
+            renderable: set(self.dependency_graph.children(renderable))
+            for renderable in renderables
+        }
+        results, failed_exit_code, flushed_count = {}, None, 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {}
+            ready = [x for x in renderables if not dependencies[x]]
+            while ready or futures:
+                for renderable in ready:
+                    future = executor.submit(
+                        self._render_prerender_tuple_buffered,
+                        prerender_tuples[renderable],
+                        extension,
+                        **kwargs,
+                    )
+                    futures[future] = renderable
+                ready = []
+                done, _ = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    renderable = futures.pop(future)
+                    results[renderable] = exit_code, _ = future.result()
+                    if exit_code:
+                        failed_exit_code = failed_exit_code or exit_code
+                    if failed_exit_code:
+                        continue
+                    for dependent in self.dependency_graph.parents(renderable):
+                        dependencies[dependent].discard(renderable)
+                        if not dependencies[dependent]:
+                            ready.append(dependent)
+                # Merge transcripts in render order, as soon as possible.
+                while (
+                    flushed_count < len(renderables)
+                    and renderables[flushed_count] in results
+                ):
+                    exit_code, transcript = results[renderables[flushed_count]]
+                    for message in transcript:
+                        if self.print_transcript:
+                            print(message)
+                        self.transcript.append(message)
+                    if exit_code:
+                        self._report("    SuperCollider errored!")
+                    flushed_count += 1
+        for renderable in renderables[flushed_count:]:
+            if renderable not in results:
+                continue
+            exit_code, transcript = results[renderable]
+            for message in transcript:
+                if self.print_transcript:
+                    print(message)
+                self.transcript.append(message)
+            if exit_code:
+                self._report("    SuperCollider errored!")
+        if failed_exit_code:
+            raise NonrealtimeRenderError(failed_exit_code)
+        return results[renderables[-1]][0]
+
     def _read(self, file_path, mode=""):
         try:
             with open(str(file_path), "r" + mode) as file_pointer:
@@ -348,10 +530,22 @@ class SessionRenderer(SupriyaObject):
     def _report(self, message):
         if self.transcript_prefix:
             message = "{}{}".format(self.transcript_prefix, message)
+        # Parallel render jobs buffer their messages until they can be
+        # merged into the transcript in render order.
+        buffered_transcript = getattr(self._local, "transcript", None)
+        if buffered_transcript is not None:
+            buffered_transcript.append(message)
+            return
         if self.print_transcript:
             print(message)
         self.transcript.append(message)
 
+    def _remove_streamed_files(self):
+        for file_path in self._streamed_file_paths:
+            if file_path.exists():
+                file_path.unlink()
+        self._streamed_file_paths[:] = []
+
     def _reset(self):
         self._compiled_sessions = {}
         self._prerender_tuples = []
@@ -359,6 +553,7 @@ class SessionRenderer(SupriyaObject):
         self._renderable_prefixes = {}
         self._dependency_graph = uqbar.containers.DependencyGraph()
         self._session_input_paths = {}
+        self._streamed_file_paths = []
         self._sessionables_to_sessions = {}
 
     def _sessionable_to_session(self, expr):
@@ -368,17 +563,49 @@ class SessionRenderer(SupriyaObject):
             return self._sessionables_to_sessions[expr]
         return expr
 
+    def _stream_datagram(self, osc_bundles):
+        # Encodes each bundle straight into a temporary score file, hashing
+        # as it goes, so only one bundle is ever held in memory.
+        md5 = hashlib.md5()
+        self.render_directory_path.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=str(self.render_directory_path),
+            prefix=".session-",
+            suffix=".osc",
+            delete=False,
+        ) as file_pointer:
+            file_path = pathlib.Path(file_pointer.name)
+            self._streamed_file_paths.append(file_path)
+            for datagram in self._iterate_datagram(osc_bundles):
+                md5.update(datagram)
+                file_pointer.write(datagram)
+        return file_path, md5
+
     def _write_datagram(self, file_path, new_contents):
-        self._write(file_path, new_contents, mode="b")
+        if isinstance(new_contents, pathlib.Path):
+            self._write_streamed_datagram(file_path, new_contents)
+        else:
+            self._write(file_path, new_contents, mode="b")
+
+    def _write_streamed_datagram(self, file_path, streamed_file_path):
+        # Streamed scores are named by their hash, so an existing file has
+        # the same contents.
+        relative_file_path = self._get_relative_file_path(file_path)
+        self._report("Writing {}.".format(relative_file_path))
+        if file_path.exists():
+            self._report(
+                "    Skipped {}. File already exists.".format(relative_file_path)
+            )
+            streamed_file_path.unlink()
+        else:
+            shutil.move(str(streamed_file_path), str(file_path))
+            self._report("    Wrote {}.".format(relative_file_path))
 
     def _write_render_yml(self, file_path, render_yaml):
         self._write(file_path, render_yaml)
 
     def _write(self, file_path, new_contents, mode=""):
-        cwd = pathlib.Path.cwd()
-        relative_file_path = file_path
-        if file_path.is_absolute() and cwd in file_path.parents:
-            relative_file_path = file_path.relative_to(cwd)
+        relative_file_path = self._get_relative_file_path(file_path)
         self._report("Writing {}.".format(relative_file_path))
         old_contents = self._read(file_path, mode=mode)
         if old_contents == new_contents:
@@ -428,50 +655,69 @@ class SessionRenderer(SupriyaObject):
         debug=None,
         duration=None,
         build_render_yml=None,
+        concurrency=None,
+        render_cache=None,
+        stream=None,
+        _precompiled=False,
         **kwargs,
     ):
+        """
+        Renders the session.
+
+        Pass `concurrency` greater than one to render independent sessions
+        in the dependency graph in parallel, running up to `concurrency`
+        scsynth processes at once. Transcripts are merged in the same order
+        as when rendering serially.
+
+        Pass a ``RenderCache`` as `render_cache`, or true for the default
+        one, to look up and store session outputs in a shared render cache.
+
+        Pass `stream` true to encode each session's score straight into its
+        ``.osc`` file, one bundle at a time, rather than building the whole
+        score in memory. Each session is compiled twice: once to discover its
+        dependencies, and once to write its score.
+        """
         import supriya.nonrealtime
 
+        if render_cache is True:
+            render_cache = supriya.nonrealtime.RenderCache()
+        elif render_cache is False:
+            render_cache = None
+        self._render_cache = render_cache
         extension = ".{}".format(self.header_format.name.lower())
         if output_file_path is not None:
             output_file_path = pathlib.Path(output_file_path)
             output_file_path = output_file_path.expanduser().absolute()
         original_output_file_path = output_file_path
-        self._collect_prerender_tuples(self.session, duration=duration)
-        assert self.prerender_tuples, self.prerender_tuples
-        visited_renderable_prefixes = []
-        with uqbar.io.DirectoryChange(directory=str(self.render_directory_path)):
-            for prerender_tuple in self.prerender_tuples:
-                renderable = prerender_tuple[0]
-                renderable_prefix = self.renderable_prefixes[renderable]
-                visited_renderable_prefixes.append(
-                    renderable_prefix.with_suffix("").name
-                )
-                output_file_path = renderable_prefix.with_suffix(extension)
-                if isinstance(renderable, supriya.nonrealtime.Session):
-                    (session, datagram, input_, _) = prerender_tuple
-                    osc_file_path = renderable_prefix.with_suffix(".osc")
-                    input_file_path = self.session_input_paths.get(session)
-                    self._write_datagram(osc_file_path, datagram)
-                    try:
-                        exit_code = self._render_datagram(
-                            session,
-                            input_file_path,
-                            output_file_path,
-                            osc_file_path,
-                            **kwargs,
-                        )
-                    except Exception:
-                        output_file_path.unlink()
-                        sys.exit(1)
-                    if exit_code:
-                        self._report("    SuperCollider errored!")
-                        raise NonrealtimeRenderError(exit_code)
-                else:
-                    renderable.__render__(
-                        output_file_path=output_file_path,
-                        print_transcript=self.print_transcript,
+        try:
+            # Callers that already compiled the session, e.g. to claim its
+            # render hash, pass _precompiled to render exactly that compilation.
+            if not _precompiled:
+                self._reset()
+                self._stream = bool(stream)
+                self._collect_prerender_tuples(self.session, duration=duration)
+            assert self.prerender_tuples, self.prerender_tuples
+            visited_renderable_prefixes = [
+                self.renderable_prefixes[prerender_tuple[0]].with_suffix("").name
+                for prerender_tuple in self.prerender_tuples
+            ]
+            with uqbar.io.DirectoryChange(directory=str(self.render_directory_path)):
+                if concurrency and concurrency > 1:
+                    exit_code = self._render_prerender_tuples_in_parallel(
+                        concurrency, extension, **kwargs
                     )
+                else:
+                    for prerender_tuple in self.prerender_tuples:
+                        exit_code = self._render_prerender_tuple(
+                            prerender_tuple, extension, **kwargs
+                        )
+                        if exit_code:
+                            self._report("    SuperCollider errored!")
+                            raise NonrealtimeRenderError(exit_code)
+        finally:
+            self._remove_streamed_files()
+        renderable = self.prerender_tuples[-1][0]
+        output_file_path = self.renderable_prefixes[renderable].with_suffix(extension)
         output_file_path = self.render_directory_path / output_file_path
         if not output_file_path.exists():
             self._report("    Output file is missing!")
@@ -191,6 +191,30 @@ class State(SessionObject):
 
         return recurse(root_node)
 
+    def _propagate(self, previous_state):
+        """
+        Re-derives this state's node tree from `previous_state`'s node tree.
+
+        Returns true if this state's node tree changed.
+        """
+        if not self._transitions and not self._stop_nodes:
+            if self._nodes_to_children == previous_state.nodes_to_children:
+                return False
+            self._nodes_to_children = previous_state.nodes_to_children.copy()
+            self._nodes_to_parents = previous_state.nodes_to_parents.copy()
+            return True
+        nodes_to_children, nodes_to_parents = self._apply_transitions(
+            self._transitions,
+            previous_state.nodes_to_children,
+            previous_state.nodes_to_parents,
+            self._stop_nodes,
+        )
+        if nodes_to_children == self._nodes_to_children:
+            return False
+        self._nodes_to_children = nodes_to_children
+        self._nodes_to_parents = nodes_to_parents
+        return True
+
     @classmethod
     def _rebuild_transitions(cls, state_one, state_two):
         # print('REBUILDING')
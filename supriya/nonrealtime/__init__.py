@@ -12,6 +12,7 @@ from .Group import Group  # noqa
 from .Moment import Moment  # noqa
 from .Node import Node  # noqa
 from .NodeAction import NodeAction  # noqa
+from .RenderCache import RenderCache  # noqa
 from .RootNode import RootNode  # noqa
 from .Session import Session  # noqa
 from .SessionFactory import SessionFactory  # noqa
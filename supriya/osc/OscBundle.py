@@ -3,6 +3,7 @@ import decimal
 import struct
 
 from supriya.osc import format_datagram
+from supriya.osc.OscCodec import OscCodec
 from supriya.system.SupriyaValueObject import SupriyaValueObject
 
 
@@ -161,35 +162,10 @@ class OscBundle(SupriyaValueObject):
 
     @staticmethod
     def from_datagram(datagram):
-        import supriya.osc
-
-        assert OscBundle.datagram_is_bundle(datagram)
-        offset = 8
-        timestamp, offset = OscBundle._read_date(datagram, offset)
-        contents = []
-        while offset < len(datagram):
-            length, offset = supriya.osc.OscMessage._read_int(datagram, offset)
-            data = datagram[offset : offset + length]
-            if OscBundle.datagram_is_bundle(data):
-                item = OscBundle.from_datagram(data)
-            else:
-                item = supriya.osc.OscMessage.from_datagram(data)
-            contents.append(item)
-            offset += length
-        osc_bundle = OscBundle(timestamp=timestamp, contents=tuple(contents))
-        return osc_bundle
+        return OscCodec.decode_bundle(datagram)
 
     def to_datagram(self, realtime=True):
-        import supriya.osc
-
-        datagram = OscBundle._bundle_prefix
-        datagram += OscBundle._write_date(self._timestamp, realtime=realtime)
-        for content in self.contents:
-            content_datagram = content.to_datagram()
-            content_length = len(content_datagram)
-            datagram += supriya.osc.OscMessage._write_int(content_length)
-            datagram += content_datagram
-        return datagram
+        return OscCodec.encode_bundle(self, realtime=realtime)
 
     def to_list(self):
         result = [self.timestamp]
@@ -0,0 +1,303 @@
+import collections
+import enum
+import re
+import struct
+
+
+class OscCodec:
+    """
+    A table-driven OSC codec.
+
+    Encodes OSC messages by laying out their arguments as a ``struct``
+    format string, then packing every argument of a message with a single
+    ``struct.Struct``, cached per message format. Bundles join their
+    encoded contents. Decoding unpacks runs of same-typed numeric arguments
+    in place with ``unpack_from`` and descends into nested blobs by offset,
+    rather than copying payloads, so memoryviews are decoded without being
+    copied.
+
+    ::
+
+        >>> import supriya.osc
+        >>> datagram = supriya.osc.OscCodec.encode_message(
+        ...     '/n_set', (1000, 'frequency', 443.0, 'amplitude', 0.5),
+        ...     )
+        >>> supriya.osc.OscCodec.decode_message(datagram)
+        OscMessage('/n_set', 1000, 'frequency', 443.0, 'amplitude', 0.5)
+
+    ::
+
+        >>> bundle = supriya.osc.OscBundle(
+        ...     timestamp=1401557034.5,
+        ...     contents=(
+        ...         supriya.osc.OscMessage('/one', 1),
+        ...         supriya.osc.OscMessage('/two', 2.5, 'three'),
+        ...         ),
+        ...     )
+        >>> datagram = supriya.osc.OscCodec.encode_bundle(bundle)
+        >>> supriya.osc.OscCodec.decode_bundle(datagram) == bundle
+        True
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ()
+
+    _bundle_header = struct.Struct(">8s8s")
+
+    _bundle_prefix = b"#bundle\x00"
+
+    _int32 = struct.Struct(">i")
+
+    _maximum_cached_structs = 4096
+
+    _null = re.compile(b"\x00")
+
+    _numeric_type_tags = frozenset("dfi")
+
+    _scalar_type_tags = {float: "f", int: "i", str: "s"}
+
+    _string_formats: dict = {}
+
+    _structs: dict = {}
+
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _get_struct(cls, format_):
+        struct_ = cls._structs.get(format_)
+        if struct_ is None:
+            if len(cls._structs) >= cls._maximum_cached_structs:
+                cls._structs.clear()
+            struct_ = struct.Struct(">" + format_)
+            cls._structs[format_] = struct_
+        return struct_
+
+    @classmethod
+    def _get_string_format(cls, length):
+        # Strings are null-terminated and padded to a multiple of four bytes.
+        format_ = cls._string_formats.get(length)
+        if format_ is None:
+            format_ = "{}s".format(length + 4 - (length % 4))
+            cls._string_formats[length] = format_
+        return format_
+
+    @classmethod
+    def _layout_arguments(cls, contents, type_tags, formats, values):
+        for value in contents:
+            type_tag = cls._scalar_type_tags.get(type(value))
+            if type_tag is None:
+                if hasattr(value, "to_datagram"):
+                    value = bytearray(value.to_datagram())
+                elif isinstance(value, enum.Enum):
+                    value = value.value
+                if isinstance(value, bytearray):
+                    type_tag = "b"
+                elif isinstance(value, str):
+                    type_tag = "s"
+                elif isinstance(value, bool):
+                    type_tags.append("T" if value else "F")
+                    continue
+                elif isinstance(value, float):
+                    type_tag = "f"
+                elif isinstance(value, int):
+                    type_tag = "i"
+                elif value is None:
+                    type_tags.append("N")
+                    continue
+                elif isinstance(value, collections.Sequence):
+                    type_tags.append("[")
+                    cls._layout_arguments(value, type_tags, formats, values)
+                    type_tags.append("]")
+                    continue
+                else:
+                    raise TypeError("Cannot encode {!r}".format(value))
+            type_tags.append(type_tag)
+            if type_tag == "s":
+                value = value.encode("utf-8")
+                formats.append(cls._get_string_format(len(value)))
+            elif type_tag == "b":
+                formats.append("i{}s".format(len(value) + (-len(value) % 4)))
+                values.append(len(value))
+                value = bytes(value)
+            else:
+                formats.append(type_tag)
+            values.append(value)
+
+    @classmethod
+    def _encode_bundle(cls, bundle, realtime=True):
+        from supriya.osc.OscBundle import OscBundle
+
+        datagrams = [
+            cls._bundle_header.pack(
+                cls._bundle_prefix,
+                OscBundle._write_date(bundle.timestamp, realtime=realtime),
+            )
+        ]
+        for content in bundle.contents:
+            # Requests lay out their arguments without building OSC messages.
+            if hasattr(content, "_get_osc_address_and_contents"):
+                datagram = cls.encode_message(*content._get_osc_address_and_contents())
+            elif hasattr(content, "address"):
+                datagram = cls.encode_message(content.address, content.contents)
+            else:
+                datagram = cls._encode_bundle(content, realtime=realtime)
+            datagrams.append(cls._int32.pack(len(datagram)))
+            datagrams.append(datagram)
+        return b"".join(datagrams)
+
+    @classmethod
+    def _layout_message(cls, address, contents):
+        # The address can be a string or (in SuperCollider) an int.
+        if isinstance(address, str):
+            address = address.encode("utf-8")
+            formats = [cls._get_string_format(len(address)), None]
+        else:
+            formats = ["i", None]
+        type_tags, values = [","], [address, None]
+        cls._layout_arguments(contents, type_tags, formats, values)
+        type_tags = "".join(type_tags).encode("utf-8")
+        formats[1] = cls._get_string_format(len(type_tags))
+        values[1] = type_tags
+        return "".join(formats), values
+
+    @classmethod
+    def _decode_arguments(cls, type_tags, datagram, offset, end):
+        stack = [[]]
+        index, type_tag_count = 1, len(type_tags)
+        while index < type_tag_count:
+            type_tag = type_tags[index]
+            if type_tag in cls._numeric_type_tags:
+                stop = index + 1
+                while stop < type_tag_count and type_tags[stop] == type_tag:
+                    stop += 1
+                struct_ = cls._get_struct(type_tag * (stop - index))
+                stack[-1].extend(struct_.unpack_from(datagram, offset))
+                offset += struct_.size
+                index = stop
+                continue
+            if type_tag == "s":
+                value, offset = cls._read_string(datagram, offset, end)
+            elif type_tag == "b":
+                length = cls._int32.unpack_from(datagram, offset)[0]
+                offset += 4
+                value = cls._decode_blob(datagram, offset, offset + length)
+                offset += length + (-length % 4)
+            elif type_tag == "T":
+                value = True
+            elif type_tag == "F":
+                value = False
+            elif type_tag == "N":
+                value = None
+            elif type_tag == "[":
+                stack.append([])
+                index += 1
+                continue
+            elif type_tag == "]":
+                value = tuple(stack.pop())
+            else:
+                raise ValueError("Cannot decode type tag {!r}".format(type_tag))
+            stack[-1].append(value)
+            index += 1
+        return stack[0], offset
+
+    @classmethod
+    def _decode_blob(cls, datagram, offset, end):
+        if cls._is_bundle(datagram, offset, end):
+            return cls._decode_bundle(datagram, offset, end)
+        try:
+            return cls._decode_message(datagram, offset, end)
+        except (IndexError, ValueError, UnicodeDecodeError, struct.error):
+            return bytearray(memoryview(datagram)[offset:end])
+
+    @classmethod
+    def _decode_bundle(cls, datagram, offset, end):
+        from supriya.osc.OscBundle import OscBundle
+
+        timestamp, offset = OscBundle._read_date(datagram, offset + 8)
+        contents = []
+        while offset < end:
+            length = cls._int32.unpack_from(datagram, offset)[0]
+            offset += 4
+            if cls._is_bundle(datagram, offset, offset + length):
+                item = cls._decode_bundle(datagram, offset, offset + length)
+            else:
+                item = cls._decode_message(datagram, offset, offset + length)
+            contents.append(item)
+            offset += length
+        return OscBundle(timestamp=timestamp, contents=contents)
+
+    @classmethod
+    def _decode_message(cls, datagram, offset, end):
+        from supriya.osc.OscMessage import OscMessage
+
+        address, offset = cls._read_string(datagram, offset, end)
+        type_tags, offset = cls._read_string(datagram, offset, end)
+        if not type_tags.startswith(","):
+            raise ValueError("Missing type tag string: {!r}".format(type_tags))
+        contents, offset = cls._decode_arguments(type_tags, datagram, offset, end)
+        if offset > end:
+            raise IndexError(offset)
+        return OscMessage(address, *contents)
+
+    @classmethod
+    def _is_bundle(cls, datagram, offset, end):
+        return end - offset >= 8 and datagram[offset : offset + 8] == cls._bundle_prefix
+
+    @classmethod
+    def _read_string(cls, datagram, offset, end):
+        # Searching with a regex works on any buffer, memoryviews included.
+        match = cls._null.search(datagram, offset, end)
+        if match is None:
+            raise IndexError(offset)
+        stop = match.start()
+        result = str(datagram[offset:stop], "utf-8")
+        length = stop - offset
+        return result, offset + length + 4 - (length % 4)
+
+    ### PUBLIC METHODS ###
+
+    @classmethod
+    def decode_bundle(cls, datagram, length=None):
+        """
+        Decodes `datagram` into an OSC bundle.
+
+        Pass `length` to decode only the first `length` bytes of a larger,
+        reusable receive buffer.
+        """
+        if length is None:
+            length = len(datagram)
+        if not cls._is_bundle(datagram, 0, length):
+            raise ValueError("Not an OSC bundle: {!r}".format(bytes(datagram[:8])))
+        return cls._decode_bundle(datagram, 0, length)
+
+    @classmethod
+    def decode_message(cls, datagram, length=None):
+        """
+        Decodes `datagram` into an OSC message.
+
+        Pass `length` to decode only the first `length` bytes of a larger,
+        reusable receive buffer.
+        """
+        if length is None:
+            length = len(datagram)
+        return cls._decode_message(datagram, 0, length)
+
+    @classmethod
+    def encode_bundle(cls, bundle, realtime=True):
+        """
+        Encodes `bundle` into a datagram.
+
+        Bundles may also be request bundles, whose requests are encoded
+        directly.
+        """
+        return cls._encode_bundle(bundle, realtime=realtime)
+
+    @classmethod
+    def encode_message(cls, address, contents=()):
+        """
+        Encodes an OSC message's `address` and `contents` into a datagram.
+        """
+        format_, values = cls._layout_message(address, contents)
+        return cls._get_struct(format_).pack(*values)
@@ -1,10 +1,14 @@
 import collections
+import queue
+import socket
 import socketserver
 import threading
 import time
+import traceback
 import typing
 
 from supriya.osc.OscBundle import OscBundle
+from supriya.osc.OscCodec import OscCodec
 from supriya.osc.OscMessage import OscMessage
 
 
@@ -35,30 +39,115 @@ class OscIO:
         def handle(self):
             data = self.request[0]
             message = OscMessage.from_datagram(data)
-            debug_osc = self.server.io_instance.debug_osc
-            debug_udp = self.server.io_instance.debug_udp
-            if message.address != "/status.reply":
-                for capture in self.server.io_instance.captures:
-                    capture.osc_messages.append(("R", message))
-                if debug_osc:
-                    print("RECV", "{:0.6f}".format(time.time()), message.to_list())
-                    if debug_udp:
-                        for line in str(message).splitlines():
-                            print("    " + line)
-            # TODO: Is it worth the additional thread creation?
-            response = None
-            for callback in self.server.io_instance.match(message):
-                if callback.parse_response:
-                    if response is None:
-                        handler = self.server.io_instance.response_handlers.get(
-                            message.address
-                        )
-                        if handler:
-                            response = handler.from_osc_message(message)
-                    args = response
-                else:
-                    args = message
-                callback.procedure(args)
+            self.server.io_instance._dispatch(message)
+
+    class OscReceiver:
+        """
+        Receives datagrams on a single reader thread and dispatches them on a
+        fixed pool of worker threads.
+
+        The reader decodes each datagram straight out of one reusable buffer
+        via ``recvfrom_into``. Server replies are all queued for the first
+        worker, so they are dispatched in the order they arrived (e.g.
+        ``/n_go`` before ``/n_end``, and ``/done`` before ``/synced``). When
+        its queue is full the reader blocks, leaving further datagrams queued
+        in the socket, so no reply a request waits on is ever lost.
+
+        Replies to the owning OscIO's ``droppable_addresses``, e.g. status
+        and meter replies, are high-volume and only ever superseded by the
+        next one, so they go to the remaining workers instead, each address
+        always to the same worker so its replies stay in order. When its
+        queue is full they are discarded and counted in the owning OscIO's
+        ``dropped_count``.
+        """
+
+        def __init__(self, osc_io, worker_count=4, queue_size=1024, batch_size=32):
+            self.osc_io = osc_io
+            self.batch_size = int(batch_size)
+            self.buffer = bytearray(65536)
+            self.received_count = 0
+            self.is_running = False
+            self.queues = [queue.Queue(maxsize=queue_size) for _ in range(worker_count)]
+            self.reader_thread = None
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.socket.bind(("", 0))
+            self.socket.settimeout(0.1)
+            self.worker_threads = []
+
+        def read(self):
+            buffer_ = self.buffer
+            socket_ = self.socket
+            droppable_addresses = self.osc_io.droppable_addresses
+            ordered_queue = self.queues[0]
+            droppable_queues = self.queues[1:] or self.queues
+            queues_by_address = {}
+            while self.is_running:
+                try:
+                    length, _ = socket_.recvfrom_into(buffer_)
+                except socket.timeout:
+                    continue
+                except OSError:
+                    break
+                self.received_count += 1
+                try:
+                    message = OscCodec.decode_message(buffer_, length)
+                except Exception:
+                    traceback.print_exc()
+                    continue
+                address = message.address
+                if address in droppable_addresses:
+                    queue_ = queues_by_address.get(address)
+                    if queue_ is None:
+                        queue_ = droppable_queues[
+                            len(queues_by_address) % len(droppable_queues)
+                        ]
+                        queues_by_address[address] = queue_
+                    try:
+                        queue_.put_nowait(message)
+                    except queue.Full:
+                        self.osc_io.dropped_count += 1
+                    continue
+                while self.is_running:
+                    try:
+                        ordered_queue.put(message, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+
+        def start(self):
+            self.is_running = True
+            for queue_ in self.queues:
+                thread = threading.Thread(target=self.work, args=(queue_,))
+                thread.daemon = True
+                thread.start()
+                self.worker_threads.append(thread)
+            self.reader_thread = threading.Thread(target=self.read)
+            self.reader_thread.daemon = True
+            self.reader_thread.start()
+
+        def stop(self):
+            self.is_running = False
+            if self.reader_thread is not threading.current_thread():
+                self.reader_thread.join()
+            self.socket.close()
+
+        def work(self, queue_):
+            dispatch = self.osc_io._dispatch
+            while self.is_running:
+                try:
+                    batch = [queue_.get(timeout=0.1)]
+                except queue.Empty:
+                    continue
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(queue_.get_nowait())
+                    except queue.Empty:
+                        break
+                for message in batch:
+                    try:
+                        dispatch(message)
+                    except Exception:
+                        traceback.print_exc()
 
     class OscCallback(typing.NamedTuple):
         pattern: typing.Tuple[typing.Union[str, int, float], ...]
@@ -73,6 +162,8 @@ class OscIO:
         ip_address="127.0.0.1",
         port=57751,
         timeout=2,
+        worker_count=None,
+        queue_size=1024,
     ):
         import supriya.commands
 
@@ -80,13 +171,18 @@ class OscIO:
         self.captures = set()
         self.debug_osc = bool(debug_osc)
         self.debug_udp = bool(debug_udp)
+        self.droppable_addresses = set()
+        self.dropped_count = 0
         self.ip_address = ip_address
         self.lock = threading.RLock()
+        self.queue_size = queue_size
+        self.receiver = None
         self.server = None
         self.server_thread = None
         self.port = port
         self.is_running = False
         self.timeout = timeout
+        self.worker_count = worker_count
         self.response_handlers = {
             "/b_info": supriya.commands.BufferInfoResponse,
             "/b_set": supriya.commands.BufferSetResponse,
@@ -115,6 +211,31 @@ class OscIO:
     def __del__(self):
         self.quit()
 
+    ### PRIVATE METHODS ###
+
+    def _dispatch(self, message):
+        debug_osc = self.debug_osc
+        debug_udp = self.debug_udp
+        if message.address != "/status.reply":
+            for capture in self.captures:
+                capture.osc_messages.append(("R", message))
+            if debug_osc:
+                print("RECV", "{:0.6f}".format(time.time()), message.to_list())
+                if debug_udp:
+                    for line in str(message).splitlines():
+                        print("    " + line)
+        response = None
+        for callback in self.match(message):
+            if callback.parse_response:
+                if response is None:
+                    handler = self.response_handlers.get(message.address)
+                    if handler:
+                        response = handler.from_osc_message(message)
+                args = response
+            else:
+                args = message
+            callback.procedure(args)
+
     ### PUBLIC METHODS ###
 
     def boot(self, ip_address=None, port=None):
@@ -125,6 +246,13 @@ class OscIO:
                 self.ip_address = ip_address
             if port:
                 self.port = port
+            if self.worker_count:
+                self.receiver = self.OscReceiver(
+                    self, worker_count=self.worker_count, queue_size=self.queue_size
+                )
+                self.receiver.start()
+                self.is_running = True
+                return
             self.server = self.OscServer(
                 (self.ip_address, self.port), self.OscHandler, bind_and_activate=False
             )
@@ -137,6 +265,23 @@ class OscIO:
     def capture(self):
         return self.Capture(self)
 
+    @classmethod
+    def from_config(cls, worker_count=None, queue_size=None, **kwargs):
+        """
+        Makes an OscIO, taking any unset pooled receiver settings from the
+        ``osc_worker_count`` and ``osc_queue_size`` settings in the ``core``
+        section of Supriya's config file.
+
+        The pooled receiver is used only if ``osc_worker_count`` is set.
+        """
+        import supriya
+
+        if worker_count is None:
+            worker_count = supriya.config.getint("core", "osc_worker_count", fallback=0)
+        if queue_size is None:
+            queue_size = supriya.config.getint("core", "osc_queue_size", fallback=1024)
+        return cls(worker_count=worker_count or None, queue_size=queue_size, **kwargs)
+
     def match(self, message):
         """
         Match callbacks against pattern.
@@ -193,15 +338,25 @@ class OscIO:
         with self.lock:
             if not self.is_running:
                 return
-            self.server.shutdown()
+            if self.receiver is not None:
+                self.receiver.stop()
+                self.receiver = None
+            else:
+                self.server.shutdown()
             self.server = None
             self.server_thread = None
             self.is_running = False
 
-    def register(self, pattern, procedure, once=False, parse_response=False):
+    def register(
+        self, pattern, procedure, once=False, parse_response=False, droppable=False
+    ):
         """
         Register a callback.
 
+        Pass `droppable` true for high-volume replies, like meter levels,
+        which are only ever superseded by the next one. The pooled receiver
+        drops such replies when it falls behind, rather than delaying others.
+
         ::
 
             >>> io = supriya.osc.OscIO()
@@ -233,14 +388,25 @@ class OscIO:
             for item in pattern:
                 callbacks, callback_map = callback_map.setdefault(item, ([], {}))
             callbacks.append(callback)
+            if droppable:
+                self.droppable_addresses.add(callback.pattern[0])
         return callback
 
-    def send(self, message):
+    def send(self, message, datagram=None):
         # TODO: only accept request(bundle) objects, and convert all others to
         #       request(bundle) here
+        # A pre-encoded datagram for message is sent as-is.
+        import supriya.commands
+
         if not self.is_running:
             raise RuntimeError
-        prototype = (str, collections.Iterable, OscBundle, OscMessage)
+        prototype = (
+            str,
+            collections.Iterable,
+            OscBundle,
+            OscMessage,
+            supriya.commands.Requestable,
+        )
         if not isinstance(message, prototype):
             raise ValueError(message)
         if isinstance(message, str):
@@ -251,17 +417,23 @@ class OscIO:
             if not len(message):
                 raise ValueError(message)
             message = OscMessage(message[0], *message[1:])
-        as_list = message.to_list()
-        if as_list != [2]:  # /status
-            for capture in self.captures:
-                capture.osc_messages.append(("S", message))
-            if self.debug_osc:
-                print("SEND", "{:0.6f}".format(time.time()), message.to_list())
-                if self.debug_udp:
-                    for line in str(message).splitlines():
-                        print("    " + line)
-        datagram = message.to_datagram()
-        self.server.socket.sendto(datagram, (self.ip_address, self.port))
+        if self.captures or self.debug_osc:
+            # Requests are encoded straight to datagrams unless captured or
+            # printed.
+            if isinstance(message, supriya.commands.Requestable):
+                message = message.to_osc()
+            as_list = message.to_list()
+            if as_list != [2]:  # /status
+                for capture in self.captures:
+                    capture.osc_messages.append(("S", message))
+                if self.debug_osc:
+                    print("SEND", "{:0.6f}".format(time.time()), message.to_list())
+                    if self.debug_udp:
+                        for line in str(message).splitlines():
+                            print("    " + line)
+        if datagram is None:
+            datagram = message.to_datagram()
+        self.socket.sendto(datagram, (self.ip_address, self.port))
 
     def unregister(self, callback):
         """
@@ -317,3 +489,11 @@ class OscIO:
 
         with self.lock:
             delete(list(callback.pattern), self.callbacks)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def socket(self):
+        if self.receiver is not None:
+            return self.receiver.socket
+        return self.server.socket
@@ -39,5 +39,6 @@ def format_datagram(datagram):
 
 from .OscBundle import OscBundle  # noqa
 from .OscCallback import OscCallback  # noqa
+from .OscCodec import OscCodec  # noqa
 from .OscIO import OscIO  # noqa
 from .OscMessage import OscMessage  # noqa
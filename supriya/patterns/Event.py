@@ -1,9 +1,7 @@
 import abc
-import collections
-import uuid
-
-import uqbar.objects
 
+from supriya import utils
+from supriya.patterns.EventExpansionPlan import EventExpansionPlan
 from supriya.system.SupriyaValueObject import SupriyaValueObject
 
 
@@ -53,37 +51,10 @@ class Event(SupriyaValueObject):
     def _expand(
         self, settings, synthdef, uuids, realtime=True, synth_parameters_only=False
     ):
-        settings = settings.copy()
-        for key, value in settings.items():
-            if isinstance(value, uuid.UUID) and value in uuids:
-                value = uuids[value]
-                if isinstance(value, dict):
-                    value = sorted(value)[0]
-                if not isinstance(value, collections.Sequence):
-                    value = [value]
-                settings[key] = value
-        maximum_length = 1
-        unexpanded_settings = {}
-        for key, value in settings.items():
-            if isinstance(value, collections.Sequence):
-                maximum_length = max(len(value), maximum_length)
-                unexpanded_settings[key] = value
-            else:
-                unexpanded_settings[key] = [value]
-        expanded_settings = []
-        for i in range(maximum_length):
-            settings = {}
-            for key, value in unexpanded_settings.items():
-                settings[key] = value[i % len(value)]
-            expanded_settings.append(settings)
-        if synth_parameters_only:
-            for i, dictionary in enumerate(expanded_settings):
-                expanded_settings[i] = {
-                    key: value
-                    for key, value in dictionary.items()
-                    if key in synthdef.parameter_names
-                }
-        return expanded_settings
+        plan = EventExpansionPlan.from_settings(settings, synthdef)
+        return plan.to_dicts(
+            plan.expand(settings, uuids), synth_parameters_only=synth_parameters_only
+        )
 
     @abc.abstractmethod
     def _perform_nonrealtime(self, session, uuids, offset):
@@ -98,7 +69,7 @@ class Event(SupriyaValueObject):
     ### PUBLIC METHODS ###
 
     def as_dict(self):
-        _, _, kwargs = uqbar.objects.get_vars(self)
+        _, _, kwargs = utils.get_vars(self)
         return kwargs
 
     def get(self, item, default=None):
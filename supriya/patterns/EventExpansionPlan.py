@@ -0,0 +1,174 @@
+import collections
+import uuid
+
+from supriya.system.SupriyaObject import SupriyaObject
+
+
+class EventExpansionPlan(SupriyaObject):
+    """
+    A precompiled multichannel expansion plan for event settings.
+
+    Plans are built once per synthdef and settings key set, and record which
+    keys are synth parameters and where they land in ``/s_new`` arguments.
+
+    ::
+
+        >>> plan = supriya.patterns.EventExpansionPlan.from_settings(
+        ...     {"amplitude": 0.5, "foo": "bar", "frequency": [440, 550]},
+        ...     supriya.assets.synthdefs.default,
+        ...     )
+        >>> plan.parameter_names
+        ('amplitude', 'frequency')
+
+    ::
+
+        >>> rows = plan.expand({"amplitude": 0.5, "foo": 1, "frequency": [440, 550]})
+        >>> rows
+        [(0.5, 1, 440), (0.5, 1, 550)]
+
+    ::
+
+        >>> for row in rows:
+        ...     plan.get_parameters(row)
+        ...
+        (('amplitude', 0.5), ('frequency', 440))
+        (('amplitude', 0.5), ('frequency', 550))
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_add_action_index",
+        "_keys",
+        "_parameter_indices",
+        "_parameter_names",
+        "_synthdef",
+        "_target_node_index",
+    )
+
+    _maximum_plan_count = 1024
+
+    _plans = {}
+
+    _sequence_types = {}
+
+    ### INITIALIZER ###
+
+    def __init__(self, synthdef, keys):
+        self._synthdef = synthdef
+        self._keys = tuple(keys)
+        indices = {key: i for i, key in enumerate(self._keys)}
+        synthdef_parameter_names = synthdef.metadata.parameter_names
+        # Sorted, as SynthNewRequest orders its arguments.
+        self._parameter_names = tuple(
+            sorted(key for key in self._keys if key in synthdef_parameter_names)
+        )
+        self._parameter_indices = tuple(indices[key] for key in self._parameter_names)
+        self._add_action_index = indices.get("add_action")
+        self._target_node_index = indices.get("target_node")
+
+    ### PUBLIC METHODS ###
+
+    def expand(self, settings, uuids=None):
+        """
+        Expands `settings` into one row of values per channel, ordered like
+        this plan's keys.
+
+        UUID values found in `uuids` are replaced by the node IDs or nodes
+        they map to.
+        """
+        sequence_types = self._sequence_types
+        values = [settings[key] for key in self._keys]
+        sequences = []
+        maximum_length = 1
+        for i, value in enumerate(values):
+            if uuids and isinstance(value, uuid.UUID) and value in uuids:
+                value = uuids[value]
+                if isinstance(value, dict):
+                    value = sorted(value)[0]
+                if not isinstance(value, collections.Sequence):
+                    value = [value]
+                values[i] = value
+            # Checking against the Sequence ABC is slow, so memoize by type.
+            value_type = type(value)
+            try:
+                is_sequence = sequence_types[value_type]
+            except KeyError:
+                is_sequence = sequence_types[value_type] = issubclass(
+                    value_type, collections.Sequence
+                )
+            if is_sequence:
+                maximum_length = max(len(value), maximum_length)
+                sequences.append((i, value))
+        if not sequences:
+            return [tuple(values)]
+        rows = []
+        for i in range(maximum_length):
+            for j, value in sequences:
+                values[j] = value[i % len(value)]
+            rows.append(tuple(values))
+        return rows
+
+    @classmethod
+    def from_settings(cls, settings, synthdef):
+        """
+        Gets the cached plan for `settings`' keys and `synthdef`.
+        """
+        key = (synthdef, tuple(settings))
+        try:
+            return cls._plans[key]
+        except KeyError:
+            pass
+        if len(cls._plans) >= cls._maximum_plan_count:
+            cls._plans.clear()
+        plan = cls._plans[key] = cls(synthdef, key[1])
+        return plan
+
+    def get_add_action(self, row):
+        if self._add_action_index is None:
+            return None
+        return row[self._add_action_index]
+
+    def get_parameters(self, row):
+        """
+        Gets `row`'s synth parameters as sorted name/value pairs.
+        """
+        return tuple(
+            zip(self._parameter_names, [row[i] for i in self._parameter_indices])
+        )
+
+    def get_target_node(self, row):
+        if self._target_node_index is None:
+            return None
+        return row[self._target_node_index]
+
+    def to_dicts(self, rows, synth_parameters_only=False):
+        """
+        Converts `rows` into settings dictionaries.
+        """
+        if synth_parameters_only:
+            parameter_names = self._synthdef.metadata.parameter_names
+            return [
+                {
+                    key: value
+                    for key, value in zip(self._keys, row)
+                    if key in parameter_names
+                }
+                for row in rows
+            ]
+        return [dict(zip(self._keys, row)) for row in rows]
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def keys(self):
+        return self._keys
+
+    @property
+    def parameter_names(self):
+        return self._parameter_names
+
+    @property
+    def synthdef(self):
+        return self._synthdef
@@ -23,13 +23,14 @@ class EventPattern(Pattern):
 
     ### PUBLIC METHODS ###
 
-    def play(self, clock=None, server=None):
+    def play(self, clock=None, server=None, lookahead=None):
         import supriya.patterns
         import supriya.realtime
 
         event_player = supriya.patterns.RealtimeEventPlayer(
             self,
             clock=clock,
+            lookahead=lookahead,
             server=server or supriya.realtime.Server.get_default_server(),
         )
         event_player.start()
@@ -99,17 +99,20 @@ class NoteEvent(Event):
         duration = self["duration"]
         if duration is None:
             duration = 1
-        dictionaries = self._expand(self.settings, synthdef, uuids)
+        plan = supriya.patterns.EventExpansionPlan.from_settings(
+            self.settings, synthdef
+        )
+        rows = plan.expand(self.settings, uuids)
         first_visit = False
         if synth_uuid not in uuids:
             first_visit = True
             node_ids = {
                 server.node_id_allocator.allocate_node_id(): None
-                for _ in range(len(dictionaries))
+                for _ in range(len(rows))
             }
             uuids[synth_uuid] = node_ids
         start_product = self._build_start_bundle(
-            dictionaries, first_visit, index, synth_uuid, synthdef, timestamp, uuids
+            plan, rows, first_visit, index, synth_uuid, synthdef, timestamp, uuids
         )
         if self.get("duration"):
             if is_stop:
@@ -131,42 +134,31 @@ class NoteEvent(Event):
             return [start_product]
 
     def _build_start_bundle(
-        self, dictionaries, first_visit, index, synth_uuid, synthdef, timestamp, uuids
+        self, plan, rows, first_visit, index, synth_uuid, synthdef, timestamp, uuids
     ):
         import supriya.patterns
 
         requests = []
         node_ids = uuids[synth_uuid]
         if first_visit:
-            for node_id, dictionary in zip(node_ids, dictionaries):
-                add_action = dictionary.pop("add_action")
-                target_node = dictionary.pop("target_node")
+            for node_id, row in zip(node_ids, rows):
+                target_node = plan.get_target_node(row)
                 if target_node is None:
                     target_node = 1
-                synth_kwargs = {
-                    key: value
-                    for key, value in dictionary.items()
-                    if key in synthdef.parameter_names
-                }
                 request = supriya.commands.SynthNewRequest(
-                    add_action=add_action,
+                    add_action=plan.get_add_action(row),
                     node_id=node_id,
                     synthdef=synthdef,
                     target_node_id=target_node,
-                    **synth_kwargs,
+                    **dict(plan.get_parameters(row)),
                 )
                 requests.append(request)
                 synth = supriya.realtime.Synth(synthdef)
                 node_ids[node_id] = synth
         else:
-            for node_id, dictionary in zip(node_ids, dictionaries):
-                synth_kwargs = {
-                    key: value
-                    for key, value in dictionary.items()
-                    if key in synthdef.parameter_names
-                }
+            for node_id, row in zip(node_ids, rows):
                 request = supriya.commands.NodeSetRequest(
-                    node_id=node_id, **synth_kwargs
+                    node_id=node_id, **dict(plan.get_parameters(row))
                 )
                 requests.append(request)
         event_product = supriya.patterns.EventProduct(
@@ -189,12 +181,13 @@ class NoteEvent(Event):
         requests = []
         timestamp = timestamp + duration
         node_ids = sorted(uuids[synth_uuid])
-        if synthdef.has_gate:
+        metadata = synthdef.metadata
+        if metadata.has_gate:
             for node_id in node_ids:
                 request = supriya.commands.NodeSetRequest(node_id=node_id, gate=0)
                 requests.append(request)
         elif any(
-            x >= supriya.synthdefs.DoneAction.FREE_SYNTH for x in synthdef.done_actions
+            x >= supriya.synthdefs.DoneAction.FREE_SYNTH for x in metadata.done_actions
         ):
             pass
         else:
@@ -202,6 +202,15 @@ class Pattern(SupriyaValueObject):
             return tuple(cls._freeze_recursive(_) for _ in value)
         return value
 
+    def _get_batch_draw_count(self):
+        # The number of random numbers drawn per value, or None if values
+        # can't be generated in batches.
+        return None
+
+    def _get_batch_length(self):
+        # The number of values iterated, or None if infinite.
+        return None
+
     @classmethod
     def _get_arity(cls, value):
         if isinstance(value, Pattern):
@@ -226,7 +235,7 @@ class Pattern(SupriyaValueObject):
                     break
                 frame = frame.f_back
         finally:
-            del (frame)
+            del frame
         if identifier in cls._rngs:
             rng = cls._rngs[identifier]
         else:
@@ -271,6 +280,11 @@ class Pattern(SupriyaValueObject):
     def _setup_state(self):
         return {}
 
+    def _take_batch(self, count, draws):
+        # Generates `count` values from `draws`, a `count` by draw count
+        # array of the random numbers iteration would draw, in order.
+        raise NotImplementedError
+
     def _setup_peripherals(self, initial_expr, state):
         return None, None
 
@@ -299,6 +313,49 @@ class Pattern(SupriyaValueObject):
             kwargs[key] = value
         return class_(**kwargs)
 
+    def take(self, count):
+        """
+        Takes up to `count` values from a fresh iteration of pattern, as a
+        NumPy array.
+
+        ::
+
+            >>> pattern = supriya.patterns.Pseq([1, 2, 3], repetitions=None)
+            >>> pattern.take(7)
+            array([1, 2, 3, 1, 2, 3, 1])
+
+        Patterns of numbers built from ``Pbinop``, ``Prand``, ``Pseed``,
+        ``Pseq`` and ``Pwhite`` generate their values in vectorized batches,
+        drawing the same random numbers in the same order as iteration does.
+        Other patterns are iterated.
+
+        ::
+
+            >>> pattern = supriya.patterns.Pseed(
+            ...     supriya.patterns.Pwhite(0, 10)
+            ...     * supriya.patterns.Prand([1, -1], repetitions=None)
+            ...     + 100,
+            ...     seed=3,
+            ... )
+            >>> iterator = iter(pattern)
+            >>> values = [next(iterator) for _ in range(1000)]
+            >>> (pattern.take(1000) == values).all()
+            True
+
+        """
+        import numpy
+        from supriya.patterns import RandomNumberGenerator
+
+        count = int(count)
+        draw_count = self._get_batch_draw_count()
+        if draw_count is None:
+            return numpy.array(list(itertools.islice(self, count)))
+        length = self._get_batch_length()
+        if length is not None:
+            count = min(count, length)
+        draws = RandomNumberGenerator.get_stdlib_array(count * draw_count)
+        return self._take_batch(count, draws.reshape(count, draw_count))
+
     ### PUBLIC PROPERTIES ###
 
     @abc.abstractproperty
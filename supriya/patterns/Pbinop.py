@@ -18,6 +18,32 @@ class Pbinop(Pattern):
 
     ### PRIVATE METHODS ###
 
+    def _get_batch_draw_count(self):
+        exprs = (self._expr_one, self._expr_two)
+        if not any(isinstance(expr, Pattern) for expr in exprs):
+            return None
+        draw_count = 0
+        for expr in exprs:
+            if isinstance(expr, Pattern):
+                expr_draw_count = expr._get_batch_draw_count()
+                if expr_draw_count is None:
+                    return None
+                draw_count += expr_draw_count
+            elif not isinstance(expr, (int, float)):
+                return None
+        return draw_count
+
+    def _get_batch_length(self):
+        lengths = [
+            expr._get_batch_length()
+            for expr in (self._expr_one, self._expr_two)
+            if isinstance(expr, Pattern)
+        ]
+        lengths = [length for length in lengths if length is not None]
+        if not lengths:
+            return None
+        return min(lengths)
+
     def _iterate(self, state=None):
         import supriya.patterns
 
@@ -44,6 +70,23 @@ class Pbinop(Pattern):
         }
         return operators[self.operator]
 
+    def _take_batch(self, count, draws):
+        import numpy
+
+        # Iteration advances both operands in lockstep, so each value's draws
+        # are the first operand's followed by the second's.
+        operands, start = [], 0
+        for expr in (self._expr_one, self._expr_two):
+            if isinstance(expr, Pattern):
+                stop = start + expr._get_batch_draw_count()
+                expr = expr._take_batch(count, draws[:, start:stop])
+                start = stop
+            if self.operator == "**":
+                # NumPy rejects negative integer powers of integers.
+                expr = numpy.asarray(expr, dtype=numpy.float64)
+            operands.append(expr)
+        return self._string_to_operator()(*operands)
+
     ### PUBLIC PROPERTIES ###
 
     @property
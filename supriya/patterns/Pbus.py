@@ -46,7 +46,7 @@ class Pbus(EventPattern):
             prototype = (supriya.patterns.NoteEvent, supriya.patterns.SynthEvent)
             if isinstance(expr, prototype):
                 synthdef = expr.get("synthdef") or supriya.assets.synthdefs.default
-                parameter_names = synthdef.parameter_names
+                parameter_names = synthdef.metadata.parameter_names
                 if expr.get("out") is None and "out" in parameter_names:
                     kwargs["out"] = state["bus_uuid"]
                 if expr.get("in_") is None and "in_" in parameter_names:
@@ -8,7 +8,15 @@ class Prand(Pseq):
 
     __slots__ = ()
 
-    ### INITIALIZER ###
+    ### PRIVATE METHODS ###
+
+    def _get_batch_draw_count(self):
+        if Pseq._get_batch_draw_count(self) is None:
+            return None
+        return 1
+
+    def _get_batch_length(self):
+        return self._repetitions
 
     def _iterate(self, state=None):
         rng = self._get_rng()
@@ -19,3 +27,9 @@ class Prand(Pseq):
                 yield from choice
             else:
                 yield choice
+
+    def _take_batch(self, count, draws):
+        import numpy
+
+        indices = (draws[:, 0] * 0x7FFFFFFF).astype(numpy.int64) % len(self.sequence)
+        return numpy.array(self.sequence)[indices]
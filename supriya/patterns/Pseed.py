@@ -21,6 +21,15 @@ class Pseed(Pattern):
 
     ### PRIVATE METHODS ###
 
+    def _get_batch_draw_count(self):
+        # Seeded patterns draw from their own generator, never the caller's.
+        if self._pattern._get_batch_draw_count() is None:
+            return None
+        return 0
+
+    def _get_batch_length(self):
+        return self._pattern._get_batch_length()
+
     def _iterate(self, state=None):
         try:
             identifier = id(inspect.currentframe())
@@ -28,7 +37,13 @@ class Pseed(Pattern):
             Pattern._rngs[identifier] = iter(rng)
             yield from self._pattern
         finally:
-            del (Pattern._rngs[identifier])
+            del Pattern._rngs[identifier]
+
+    def _take_batch(self, count, draws):
+        draw_count = self._pattern._get_batch_draw_count()
+        rng = RandomNumberGenerator(seed=self.seed)
+        draws = rng.get_array(count * draw_count).reshape(count, draw_count)
+        return self._pattern._take_batch(count, draws)
 
     ### PUBLIC PROPERTIES ###
 
@@ -50,6 +50,16 @@ class Pseq(Pattern):
 
     ### PRIVATE METHODS ###
 
+    def _get_batch_draw_count(self):
+        if self._sequence and all(isinstance(x, (int, float)) for x in self._sequence):
+            return 0
+        return None
+
+    def _get_batch_length(self):
+        if self._repetitions is None:
+            return None
+        return len(self._sequence) * self._repetitions
+
     def _iterate(self, state=None):
         should_stop = self.PatternState.CONTINUE
         for _ in self._loop(self._repetitions):
@@ -69,6 +79,11 @@ class Pseq(Pattern):
                 if should_stop:
                     return
 
+    def _take_batch(self, count, draws):
+        import numpy
+
+        return numpy.resize(numpy.array(self._sequence), count)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -19,6 +19,16 @@ class Pwhite(Pattern):
 
     ### PRIVATE METHODS ###
 
+    def _get_batch_draw_count(self):
+        if isinstance(self._minimum, (int, float)) and isinstance(
+            self._maximum, (int, float)
+        ):
+            return 1
+        return None
+
+    def _get_batch_length(self):
+        return self._repetitions
+
     def _iterate(self, state=None):
         def procedure(one, two):
             minimum, maximum = sorted([one, two])
@@ -32,6 +42,10 @@ class Pwhite(Pattern):
             if should_stop:
                 return
 
+    def _take_batch(self, count, draws):
+        minimum, maximum = sorted([self._minimum, self._maximum])
+        return (draws[:, 0] * (maximum - minimum)) + minimum
+
     ### PUBLIC PROPERTIES ###
 
     @property
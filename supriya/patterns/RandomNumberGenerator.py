@@ -20,6 +20,68 @@ class RandomNumberGenerator(SupriyaObject):
 
     ### PUBLIC METHODS ###
 
+    def get_array(self, count):
+        """
+        Gets the first `count` numbers this generator iterates, as a NumPy
+        array.
+
+        ::
+
+            >>> rng = supriya.patterns.RandomNumberGenerator(seed=1)
+            >>> iterator = iter(rng)
+            >>> numbers = [next(iterator) for _ in range(1000)]
+            >>> (rng.get_array(1000) == numbers).all()
+            True
+
+        """
+        import numpy
+
+        seeds = numpy.empty(count, dtype=numpy.uint64)
+        if not count:
+            return seeds.astype(numpy.float64)
+        mask = numpy.uint64(0x7FFFFFFF)
+        multiplier, increment = 1_103_515_245, 12345
+        seeds[0] = (self._seed * multiplier + increment) & 0x7FFFFFFF
+        # Fill by doubling: each pass jumps the seeds so far ahead by their
+        # own length in one vectorized step.
+        length = 1
+        while length < count:
+            stop = min(length * 2, count)
+            seeds[length:stop] = (
+                seeds[: stop - length] * numpy.uint64(multiplier)
+                + numpy.uint64(increment)
+            ) & mask
+            multiplier, increment = (
+                (multiplier * multiplier) & 0x7FFFFFFF,
+                (multiplier * increment + increment) & 0x7FFFFFFF,
+            )
+            length = stop
+        return seeds.astype(numpy.float64) / 0x7FFFFFFF
+
+    @staticmethod
+    def get_stdlib_array(count):
+        """
+        Gets `count` numbers from the stdlib RNG as a NumPy array, advancing
+        it exactly as `count` calls to ``random.random()`` would.
+        """
+        import numpy
+
+        # NumPy's legacy generator is the same Mersenne Twister as the
+        # stdlib's, producing doubles the same way.
+        version, internal_state, gauss_next = random.getstate()
+        random_state = numpy.random.RandomState()
+        random_state.set_state(
+            (
+                "MT19937",
+                numpy.array(internal_state[:-1], dtype=numpy.uint32),
+                internal_state[-1],
+            )
+        )
+        array = random_state.random_sample(count)
+        _, key, position, _, _ = random_state.get_state()
+        random.setstate((version, tuple(int(x) for x in key) + (position,), gauss_next))
+        return array
+
     @staticmethod
     def get_stdlib_rng():
         while True:
@@ -1,23 +1,68 @@
 import itertools
+import threading
 import time
-from queue import PriorityQueue
+from queue import Empty, Full, PriorityQueue, Queue
+from typing import NamedTuple
 
 import supriya.commands
 import supriya.realtime
 import supriya.system
-from supriya import utils
 from supriya.patterns.EventPlayer import EventPlayer
 
 
 class RealtimeEventPlayer(EventPlayer):
+    """
+    A realtime event player.
+
+    By default, each bundle is rendered, encoded and sent on the clock's
+    thread when it falls due. With ``lookahead``, a rendering thread instead
+    pre-renders bundles into a queue of at most ``queue_size`` encoded
+    datagrams, up to ``lookahead`` seconds before they fall due, and the
+    clock's thread only sends them.
+    """
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("_clock", "_iterator", "_pattern", "_server", "_uuids")
+    class Statistics(NamedTuple):
+        bundle_count: int
+        late_count: int
+        mean_lateness: float
+        maximum_lateness: float
+        retimed_count: int
+        underrun_count: int
+
+    __slots__ = (
+        "_bundle_count",
+        "_clock",
+        "_iterator",
+        "_late_count",
+        "_lateness_maximum",
+        "_lateness_sum",
+        "_lookahead",
+        "_lookahead_origin",
+        "_lookahead_queue",
+        "_lookahead_stopping",
+        "_lookahead_thread",
+        "_lookahead_unsent_node_ids",
+        "_pattern",
+        "_queue_size",
+        "_retimed_count",
+        "_server",
+        "_underrun_count",
+        "_uuids",
+    )
 
     ### INITIALIZER ###
 
-    def __init__(self, pattern, server=None, event_template=None, clock=None):
+    def __init__(
+        self,
+        pattern,
+        server=None,
+        event_template=None,
+        clock=None,
+        lookahead=None,
+        queue_size=64,
+    ):
         import supriya.patterns
 
         EventPlayer.__init__(self, pattern, event_template)
@@ -27,10 +72,25 @@ class RealtimeEventPlayer(EventPlayer):
         self._clock = clock
         self._iterator = None
         self._uuids = {}
+        if lookahead is not None:
+            lookahead = float(lookahead)
+            assert 0 <= lookahead
+        self._lookahead = lookahead
+        self._lookahead_origin = None
+        self._lookahead_queue = None
+        self._lookahead_stopping = None
+        self._lookahead_thread = None
+        self._lookahead_unsent_node_ids = set()
+        queue_size = int(queue_size)
+        assert 0 < queue_size
+        self._queue_size = queue_size
+        self.reset_statistics()
 
     ### SPECIAL METHODS ###
 
     def __call__(self, execution_time, scheduled_time, communicate=True):
+        if self._lookahead is not None:
+            return self._call_ahead(scheduled_time, communicate)
         if self._iterator is None:
             self._iterator = self._iterate_outer(
                 pattern=self._pattern,
@@ -39,7 +99,56 @@ class RealtimeEventPlayer(EventPlayer):
                 uuids=self._uuids,
             )
         event_products, delta = next(self._iterator)
-        node_free_ids, requests = set(), []
+        requests, stop_uuids = self._collect_requests(event_products)
+        self._release_proxies(stop_uuids)
+        timestamp = scheduled_time
+        if communicate:
+            timestamp += self._server.latency
+        consolidated_bundle = supriya.commands.RequestBundle(
+            timestamp=timestamp, contents=requests
+        )
+        if communicate:
+            self._send(consolidated_bundle)
+            return delta
+        return consolidated_bundle, delta
+
+    ### PRIVATE METHODS ###
+
+    def _call_ahead(self, scheduled_time, communicate):
+        if self._lookahead_thread is None:
+            self._start_rendering(scheduled_time)
+        try:
+            item = self._lookahead_queue.get_nowait()
+        except Empty:
+            self._underrun_count += 1
+            item = self._wait_for_rendering()
+            if item is None:
+                if communicate:
+                    return None
+                return supriya.commands.RequestBundle(timestamp=scheduled_time), None
+        predicted_time, bundle, datagram, node_ids, stop_uuids, delta = item
+        self._lookahead_unsent_node_ids.difference_update(node_ids)
+        self._release_proxies(stop_uuids)
+        if not communicate:
+            bundle = supriya.commands.RequestBundle(
+                timestamp=scheduled_time, contents=bundle.contents
+            )
+            return bundle, delta
+        if abs(scheduled_time - predicted_time) > 0.001:
+            # The clock's timing drifted from the prediction, e.g. after a
+            # tempo change, so the pre-encoded datagram is stale. Clocks sum
+            # deltas onto wall-clock times, so allow for rounding.
+            self._retimed_count += 1
+            bundle = supriya.commands.RequestBundle(
+                timestamp=scheduled_time + self._server.latency,
+                contents=bundle.contents,
+            )
+            datagram = None
+        self._send(bundle, datagram=datagram)
+        return delta
+
+    def _collect_requests(self, event_products):
+        node_free_ids, requests, stop_uuids = set(), [], []
         for event_product in event_products:
             if not event_product.event:
                 continue
@@ -49,33 +158,12 @@ class RealtimeEventPlayer(EventPlayer):
                 else:
                     requests.append(request)
             if event_product.is_stop:
-                proxies = self._uuids[event_product.uuid]
-                for proxy_id, proxy in proxies.items():
-                    if isinstance(
-                        proxy, (supriya.realtime.Bus, supriya.realtime.BusGroup)
-                    ):
-                        allocator = supriya.realtime.Bus._get_allocator(
-                            calculation_rate=proxy.calculation_rate, server=self._server
-                        )
-                        allocator.free(proxy_id)
-                self._uuids.pop(event_product.uuid)
+                stop_uuids.append(event_product.uuid)
         if node_free_ids:
             node_free_ids = sorted(node_free_ids)
             request = supriya.commands.NodeFreeRequest(node_ids=node_free_ids)
             requests.append(request)
-        consolidated_bundle = supriya.commands.RequestBundle(
-            timestamp=scheduled_time, contents=requests
-        )
-        if communicate:
-            osc_bundle = consolidated_bundle.to_osc()
-            osc_bundle = utils.new(
-                osc_bundle, timestamp=osc_bundle.timestamp + self._server.latency
-            )
-            self._server.send_message(osc_bundle)
-            return delta
-        return consolidated_bundle, delta
-
-    ### PRIVATE METHODS ###
+        return requests, stop_uuids
 
     def _collect_stop_requests(self):
         import supriya.nonrealtime
@@ -89,7 +177,7 @@ class RealtimeEventPlayer(EventPlayer):
                     continue
                 if (
                     isinstance(proxy, supriya.nonrealtime.Synth)
-                    and proxy.synthdef.has_gate
+                    and proxy.synthdef.metadata.has_gate
                 ):
                     gated_node_ids.append(proxy_id)
                 else:
@@ -104,6 +192,24 @@ class RealtimeEventPlayer(EventPlayer):
             return
         return supriya.commands.RequestBundle(contents=requests)
 
+    def _discard_rendered(self):
+        while True:
+            try:
+                self._lookahead_queue.get_nowait()
+            except Empty:
+                break
+        # Forget nodes whose creation was rendered but never sent.
+        node_ids = self._lookahead_unsent_node_ids
+        for uuid, proxies in tuple(self._uuids.items()):
+            if not isinstance(proxies, dict):
+                continue
+            for proxy_id in node_ids.intersection(proxies):
+                if isinstance(proxies[proxy_id], supriya.realtime.Node):
+                    del proxies[proxy_id]
+            if not proxies:
+                self._uuids.pop(uuid)
+        node_ids.clear()
+
     @staticmethod
     def _iterate_inner(pattern, server, timestamp, uuids):
         queue = PriorityQueue()
@@ -143,6 +249,100 @@ class RealtimeEventPlayer(EventPlayer):
         _, event_products = pairs.pop()
         yield event_products, None
 
+    def _offset_to_time(self, offset):
+        start_time, start_beat = self._lookahead_origin
+        if start_beat is None:
+            return start_time + offset
+        return self._clock.beats_to_time(start_beat + offset)
+
+    def _record_lateness(self, lateness):
+        self._bundle_count += 1
+        if lateness > 0:
+            self._late_count += 1
+            self._lateness_sum += lateness
+            self._lateness_maximum = max(self._lateness_maximum, lateness)
+
+    def _release_proxies(self, stop_uuids):
+        for uuid in stop_uuids:
+            proxies = self._uuids.pop(uuid)
+            for proxy_id, proxy in proxies.items():
+                if isinstance(proxy, (supriya.realtime.Bus, supriya.realtime.BusGroup)):
+                    allocator = supriya.realtime.Bus._get_allocator(
+                        calculation_rate=proxy.calculation_rate, server=self._server
+                    )
+                    allocator.free(proxy_id)
+
+    def _render_ahead(self, iterator, queue, stopping):
+        for event_products, delta in iterator:
+            predicted_time = self._offset_to_time(event_products[0].timestamp)
+            while not stopping.is_set():
+                remaining = predicted_time - self._lookahead - time.time()
+                if remaining <= 0:
+                    break
+                stopping.wait(remaining)
+            if stopping.is_set():
+                return
+            requests, stop_uuids = self._collect_requests(event_products)
+            # Stopped proxies are released once sent, so anything discarded
+            # is still stopped by stop().
+            node_ids = set()
+            for request in requests:
+                if isinstance(request, supriya.commands.SynthNewRequest):
+                    node_ids.add(request.node_id)
+                elif isinstance(request, supriya.commands.GroupNewRequest):
+                    node_ids.update(x.node_id for x in request.items)
+            self._lookahead_unsent_node_ids.update(node_ids)
+            bundle = supriya.commands.RequestBundle(
+                timestamp=predicted_time + self._server.latency, contents=requests
+            )
+            datagram = bundle.to_datagram()
+            item = (predicted_time, bundle, datagram, node_ids, stop_uuids, delta)
+            while not stopping.is_set():
+                try:
+                    queue.put(item, timeout=0.1)
+                    break
+                except Full:
+                    pass
+
+    def _send(self, bundle, datagram=None):
+        if datagram is None:
+            self._server.send_message(bundle)
+        else:
+            self._server.send_message(bundle, datagram=datagram)
+        self._record_lateness(time.time() - bundle.timestamp)
+
+    def _start_rendering(self, timestamp, beat=None):
+        self._lookahead_origin = (timestamp, beat)
+        self._lookahead_queue = Queue(maxsize=self._queue_size)
+        self._lookahead_stopping = threading.Event()
+        self._lookahead_unsent_node_ids = set()
+        self._iterator = self._iterate_outer(
+            pattern=self._pattern, server=self._server, timestamp=0.0, uuids=self._uuids
+        )
+        self._lookahead_thread = threading.Thread(
+            target=self._render_ahead,
+            args=(self._iterator, self._lookahead_queue, self._lookahead_stopping),
+        )
+        self._lookahead_thread.daemon = True
+        self._lookahead_thread.start()
+
+    def _stop_rendering(self):
+        if self._lookahead_thread is None:
+            return
+        self._lookahead_stopping.set()
+        self._lookahead_thread.join()
+        self._discard_rendered()
+        self._lookahead_thread = None
+
+    def _wait_for_rendering(self):
+        queue, thread = self._lookahead_queue, self._lookahead_thread
+        while True:
+            try:
+                return queue.get(timeout=0.01)
+            except Empty:
+                if not thread.is_alive() and queue.empty():
+                    return None
+
     ### PUBLIC METHODS ###
 
     def notify(self, topic, event):
@@ -151,22 +351,82 @@ class RealtimeEventPlayer(EventPlayer):
 
     @supriya.system.PubSub.subscribe_before("server-quitting")
     def start(self):
+        import supriya.patterns
+
         if not self._server.is_running:
             return
         timestamp = time.time()
         self._uuids.clear()
-        self._iterator = self._iterate_outer(
-            pattern=self._pattern,
-            server=self._server,
-            timestamp=timestamp,
-            uuids=self._uuids,
-        )
-        self._clock.schedule(self, scheduled_time=timestamp, absolute=True)
+        beat = None
+        if isinstance(self._clock, supriya.patterns.TempoClock):
+            beat = self._clock.time_to_beats(timestamp)
+        if self._lookahead is not None:
+            self._start_rendering(timestamp, beat)
+        else:
+            self._iterator = self._iterate_outer(
+                pattern=self._pattern,
+                server=self._server,
+                timestamp=timestamp,
+                uuids=self._uuids,
+            )
+        if beat is not None:
+            self._clock.schedule_beats(self, beat=beat, absolute=True)
+        else:
+            self._clock.schedule(self, scheduled_time=timestamp, absolute=True)
+
+    def reset_statistics(self):
+        self._bundle_count = 0
+        self._late_count = 0
+        self._lateness_maximum = 0.0
+        self._lateness_sum = 0.0
+        self._retimed_count = 0
+        self._underrun_count = 0
 
     @supriya.system.PubSub.unsubscribe_after("server-quitting")
     def stop(self):
+        """
+        Stops playback.
+
+        Bundles pre-rendered by the lookahead thread but not yet sent are
+        discarded, and nodes they would have created are forgotten before
+        stopping whatever is still playing.
+        """
         self._clock.cancel(self)
+        self._stop_rendering()
         self._iterator = None
         bundle = self._collect_stop_requests()
         if bundle and self._server.is_running:
-            self._server.send_message(bundle.to_osc())
+            self._server.send_message(bundle)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def lookahead(self):
+        return self._lookahead
+
+    @property
+    def queue_size(self):
+        return self._queue_size
+
+    @property
+    def statistics(self):
+        """
+        Gets lateness statistics for sent bundles.
+
+        Lateness is measured in seconds, between sending each bundle and its
+        timestamp, so late bundles reach the server too late to be scheduled
+        exactly. Mean and maximum lateness only consider late bundles.
+        Retimed bundles were pre-rendered for a time the clock no longer
+        called them at, and underruns found nothing pre-rendered when due.
+        """
+        mean_lateness = 0.0
+        if self._late_count:
+            mean_lateness = self._lateness_sum / self._late_count
+        return self.Statistics(
+            bundle_count=self._bundle_count,
+            late_count=self._late_count,
+            mean_lateness=mean_lateness,
+            maximum_lateness=self._lateness_maximum,
+            retimed_count=self._retimed_count,
+            underrun_count=self._underrun_count,
+        )
@@ -0,0 +1,300 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import NamedTuple
+
+from supriya import utils
+from supriya.patterns.Clock import Clock
+
+
+class TempoClock(Clock):
+    """
+    A single-threaded, tempo-aware clock.
+
+    Unlike ``Clock``, which starts a new ``threading.Timer`` whenever
+    anything is scheduled, ``TempoClock`` runs one dedicated thread over a
+    heap of scheduled procedures. It sleeps until the next procedure is
+    due, then spins for the final ``spin_interval`` seconds against
+    ``time.perf_counter()`` to minimize jitter.
+
+    Procedures can be scheduled in seconds, via ``schedule()``, or in beats,
+    via ``schedule_beats()``. Beat-scheduled procedures return deltas in
+    beats, and follow tempo changes.
+
+    Everything due within ``batch_window`` seconds is executed together.
+    Realtime event players executed in the same batch have their request
+    bundles merged into a single ``RequestBundle`` per server, except for
+    players with lookahead, which send their own pre-rendered bundles.
+
+    ::
+
+        >>> clock = supriya.patterns.TempoClock(tempo=120)
+        >>> clock.tempo
+        120.0
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    class Statistics(NamedTuple):
+        event_count: int
+        late_count: int
+        mean_lateness: float
+        maximum_lateness: float
+
+    _default_clock = None
+
+    __slots__ = (
+        "_anchor_beat",
+        "_anchor_time",
+        "_batch_window",
+        "_beats_per_second",
+        "_condition",
+        "_counter",
+        "_event_count",
+        "_late_count",
+        "_lateness_maximum",
+        "_lateness_sum",
+        "_spin_interval",
+        "_time_offset",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, tempo=60.0, batch_window=0.005, spin_interval=0.001):
+        self._lock = threading.RLock()
+        self._condition = threading.Condition(self._lock)
+        self._counter = itertools.count()
+        self._queue = []
+        self._registry = {}
+        self._timer = None
+        self._anchor_time = time.time()
+        self._anchor_beat = 0.0
+        self._beats_per_second = float(tempo) / 60.0
+        self._batch_window = float(batch_window)
+        self._spin_interval = float(spin_interval)
+        self._time_offset = time.time() - time.perf_counter()
+        self.reset_statistics()
+
+    ### PRIVATE METHODS ###
+
+    def _execute(self, entries):
+        import supriya.commands
+        import supriya.patterns
+
+        bundles = {}
+        for entry in entries:
+            scheduled_time, _, registry_key, procedure, beat = entry
+            if procedure is None:
+                continue
+            if self._registry.get(registry_key) is entry:
+                del self._registry[registry_key]
+            execution_time = time.time()
+            self._record_lateness(execution_time - scheduled_time)
+            if (
+                isinstance(procedure, supriya.patterns.RealtimeEventPlayer)
+                and procedure.lookahead is None
+            ):
+                bundle, delta = procedure(
+                    execution_time, scheduled_time, communicate=False
+                )
+                if bundle.contents:
+                    bundles.setdefault(procedure._server, []).append(bundle)
+            else:
+                delta = procedure(execution_time, scheduled_time)
+            if delta is None:
+                continue
+            if beat is None:
+                self._push(procedure, scheduled_time + delta, registry_key)
+            else:
+                self._push(
+                    procedure,
+                    self.beats_to_time(beat + delta),
+                    registry_key,
+                    beat=beat + delta,
+                )
+        for server, contents in bundles.items():
+            if not server.is_running:
+                continue
+            contents = [
+                utils.new(bundle, timestamp=bundle.timestamp + server.latency)
+                for bundle in contents
+            ]
+            if len(contents) == 1:
+                bundle = contents[0]
+            else:
+                bundle = supriya.commands.RequestBundle(
+                    timestamp=min(bundle.timestamp for bundle in contents),
+                    contents=contents,
+                )
+            server.send_message(bundle)
+
+    def _push(self, procedure, scheduled_time, registry_key, beat=None):
+        entry = [scheduled_time, next(self._counter), registry_key, procedure, beat]
+        previous_entry = self._registry.get(registry_key)
+        if previous_entry is not None:
+            previous_entry[3] = None
+        self._registry[registry_key] = entry
+        heapq.heappush(self._queue, entry)
+        if self._timer is None:
+            self._timer = threading.Thread(target=self._run)
+            self._timer.daemon = True
+            self._timer.start()
+        elif self._queue[0] is entry:
+            self._condition.notify()
+
+    def _record_lateness(self, lateness):
+        self._event_count += 1
+        if lateness > 0:
+            self._late_count += 1
+            self._lateness_sum += lateness
+            self._lateness_maximum = max(self._lateness_maximum, lateness)
+
+    def _run(self):
+        thread = threading.current_thread()
+        while True:
+            with self._lock:
+                if self._timer is not thread:
+                    return
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                entry = self._queue[0]
+                if entry[3] is None:
+                    heapq.heappop(self._queue)
+                    continue
+                target = entry[0] - self._time_offset
+                remaining = target - time.perf_counter()
+                if remaining > self._spin_interval:
+                    self._condition.wait(remaining - self._spin_interval)
+                    continue
+            while time.perf_counter() < target:
+                pass
+            with self._lock:
+                if self._timer is not thread:
+                    return
+                horizon = time.time() + self._batch_window
+                entries = []
+                while self._queue and self._queue[0][0] <= horizon:
+                    entries.append(heapq.heappop(self._queue))
+                self._execute(entries)
+
+    ### PUBLIC METHODS ###
+
+    def beats_to_time(self, beat):
+        """
+        Converts `beat` into a wall-clock time, at the current tempo.
+        """
+        return self._anchor_time + (beat - self._anchor_beat) / self._beats_per_second
+
+    def cancel(self, registry_key):
+        with self._lock:
+            entry = self._registry.pop(registry_key, None)
+            if entry is not None:
+                entry[3] = None
+
+    def reset(self):
+        with self._lock:
+            self._registry.clear()
+            self._queue[:] = []
+            self._condition.notify()
+
+    def reset_statistics(self):
+        self._event_count = 0
+        self._late_count = 0
+        self._lateness_maximum = 0.0
+        self._lateness_sum = 0.0
+
+    def schedule(
+        self, procedure, scheduled_time=0.0, absolute=False, registry_key=None
+    ):
+        registry_key = registry_key or procedure
+        now = time.time()
+        if not absolute:
+            scheduled_time += now
+        with self._lock:
+            self._push(procedure, scheduled_time, registry_key)
+        return now
+
+    def schedule_beats(self, procedure, beat=0.0, absolute=False, registry_key=None):
+        """
+        Schedules `procedure` at `beat`.
+
+        Deltas returned by `procedure` are interpreted as beats.
+
+        Returns the current beat.
+        """
+        registry_key = registry_key or procedure
+        with self._lock:
+            current_beat = self.time_to_beats(time.time())
+            if not absolute:
+                beat += current_beat
+            self._push(procedure, self.beats_to_time(beat), registry_key, beat=beat)
+        return current_beat
+
+    def stop(self):
+        """
+        Stops the clock's thread.
+
+        The thread restarts when anything is next scheduled.
+        """
+        with self._lock:
+            self._timer = None
+            self._condition.notify()
+
+    def time_to_beats(self, time_):
+        """
+        Converts wall-clock `time_` into beats, at the current tempo.
+        """
+        return self._anchor_beat + (time_ - self._anchor_time) * self._beats_per_second
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def batch_window(self):
+        return self._batch_window
+
+    @property
+    def beat(self):
+        return self.time_to_beats(time.time())
+
+    @property
+    def statistics(self):
+        """
+        Gets lateness statistics for executed procedures.
+
+        Lateness is measured in seconds, against each procedure's scheduled
+        time. Mean and maximum lateness only consider late procedures.
+        """
+        mean_lateness = 0.0
+        if self._late_count:
+            mean_lateness = self._lateness_sum / self._late_count
+        return self.Statistics(
+            event_count=self._event_count,
+            late_count=self._late_count,
+            mean_lateness=mean_lateness,
+            maximum_lateness=self._lateness_maximum,
+        )
+
+    @property
+    def tempo(self):
+        """
+        Gets and sets the clock's tempo, in beats per minute.
+
+        Changing the tempo reschedules everything scheduled in beats.
+        """
+        return self._beats_per_second * 60.0
+
+    @tempo.setter
+    def tempo(self, tempo):
+        with self._lock:
+            now = time.time()
+            self._anchor_beat = self.time_to_beats(now)
+            self._anchor_time = now
+            self._beats_per_second = float(tempo) / 60.0
+            for entry in self._queue:
+                if entry[4] is not None:
+                    entry[0] = self.beats_to_time(entry[4])
+            heapq.heapify(self._queue)
+            self._condition.notify()
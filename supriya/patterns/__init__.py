@@ -5,6 +5,7 @@ from .BusEvent import BusEvent  # noqa
 from .Clock import Clock  # noqa
 from .CompositeEvent import CompositeEvent  # noqa
 from .Event import Event  # noqa
+from .EventExpansionPlan import EventExpansionPlan  # noqa
 from .EventPattern import EventPattern  # noqa
 from .EventPlayer import EventPlayer  # noqa
 from .EventProduct import EventProduct  # noqa
@@ -30,3 +31,4 @@ from .Pwhite import Pwhite  # noqa
 from .RandomNumberGenerator import RandomNumberGenerator  # noqa
 from .RealtimeEventPlayer import RealtimeEventPlayer  # noqa
 from .SynthEvent import SynthEvent  # noqa
+from .TempoClock import TempoClock  # noqa
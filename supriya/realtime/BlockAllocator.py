@@ -1,4 +1,6 @@
+import heapq
 import threading
+from typing import NamedTuple
 
 from supriya import utils
 from supriya.system.SupriyaObject import SupriyaObject
@@ -41,36 +43,165 @@ class BlockAllocator(SupriyaObject):
         >>> allocator.allocate(8)
         8
 
+    Pass ``strategy="segregated-fit"`` to keep free blocks in power-of-two
+    size classes, indexed by offset for coalescing, rather than scanning
+    every free block on each allocation. Allocation and freeing then run in
+    logarithmic time, regardless of fragmentation:
+
+    ::
+
+        >>> allocator = supriya.realtime.BlockAllocator(
+        ...     heap_maximum=16,
+        ...     strategy="segregated-fit",
+        ...     )
+        >>> allocator.allocate(4), allocator.allocate(2), allocator.allocate(4)
+        (0, 4, 6)
+
+    ::
+
+        >>> allocator.free(4)
+        >>> allocator.report_fragmentation()
+        FragmentationReport(free_block_count=2, free_size=8, largest_free_block_size=6, used_block_count=2, used_size=8, fragmentation=0.25)
+
     """
 
     ### CLASS VARIABLES ###
 
     __documentation_section__ = "Server Internals"
 
-    __slots__ = ("_free_heap", "_heap_maximum", "_heap_minimum", "_lock", "_used_heap")
+    class FragmentationReport(NamedTuple):
+        free_block_count: int
+        free_size: int
+        largest_free_block_size: int
+        used_block_count: int
+        used_size: int
+        fragmentation: float
+
+    __slots__ = (
+        "_free_blocks",
+        "_free_block_stops",
+        "_free_heap",
+        "_heap_maximum",
+        "_heap_minimum",
+        "_lock",
+        "_size_classes",
+        "_size_class_entry_count",
+        "_strategy",
+        "_used_blocks",
+        "_used_heap",
+    )
+
+    _strategies = ("first-fit", "segregated-fit")
 
     ### INITIALIZER ###
 
-    def __init__(self, heap_maximum=None, heap_minimum=0):
+    def __init__(self, heap_maximum=None, heap_minimum=0, strategy="first-fit"):
         import supriya.realtime
         import supriya.time
 
-        self._free_heap = supriya.time.TimespanCollection(accelerated=True)
+        if strategy not in self._strategies:
+            raise ValueError(strategy)
         self._heap_maximum = heap_maximum
         self._heap_minimum = heap_minimum
         self._lock = threading.Lock()
+        self._strategy = strategy
+        if strategy == "segregated-fit":
+            # Free blocks, keyed by start and stop offset for coalescing, and
+            # min-heaps of (start, stop) pairs, per power-of-two size class.
+            # Heap entries are invalidated lazily, by checking them against
+            # the free block map. The unbounded block goes in the last class.
+            self._free_blocks = {}
+            self._free_block_stops = {}
+            self._size_classes = [[] for _ in range(65)]
+            self._size_class_entry_count = 0
+            self._used_blocks = {}
+            self._insert_free_block(heap_minimum, heap_maximum)
+            return
+        self._free_heap = supriya.time.TimespanCollection(accelerated=True)
         self._used_heap = supriya.time.TimespanCollection(accelerated=True)
         free_block = supriya.realtime.Block(
             start_offset=heap_minimum, stop_offset=heap_maximum, used=False
         )
         self._free_heap.insert(free_block)
 
+    ### PRIVATE METHODS ###
+
+    def _allocate_segregated(self, desired_block_size):
+        # Every block in the ceiling size class or above fits. Blocks in the
+        # floor size class may not, and are only searched as a last resort.
+        minimum_class = (desired_block_size - 1).bit_length()
+        for size_class in self._size_classes[minimum_class:]:
+            while size_class:
+                start_offset, stop_offset = size_class[0]
+                if self._free_blocks.get(start_offset, -1) == stop_offset:
+                    return start_offset, stop_offset
+                heapq.heappop(size_class)
+                self._size_class_entry_count -= 1
+        floor_class = desired_block_size.bit_length() - 1
+        if floor_class == minimum_class:
+            return None
+        fits = [
+            (start_offset, stop_offset)
+            for start_offset, stop_offset in self._size_classes[floor_class]
+            if self._free_blocks.get(start_offset, -1) == stop_offset
+            and desired_block_size <= stop_offset - start_offset
+        ]
+        if fits:
+            return min(fits)
+        return None
+
+    def _get_size_class(self, start_offset, stop_offset):
+        if stop_offset is None:
+            return len(self._size_classes) - 1
+        return min((stop_offset - start_offset).bit_length() - 1, 63)
+
+    def _insert_free_block(self, start_offset, stop_offset):
+        if stop_offset is not None and stop_offset <= start_offset:
+            return
+        self._free_blocks[start_offset] = stop_offset
+        if stop_offset is not None:
+            self._free_block_stops[stop_offset] = start_offset
+        heapq.heappush(
+            self._size_classes[self._get_size_class(start_offset, stop_offset)],
+            (start_offset, stop_offset),
+        )
+        self._size_class_entry_count += 1
+        if 64 + 2 * len(self._free_blocks) < self._size_class_entry_count:
+            self._rebuild_size_classes()
+
+    def _rebuild_size_classes(self):
+        for size_class in self._size_classes:
+            size_class[:] = []
+        for start_offset, stop_offset in self._free_blocks.items():
+            self._size_classes[self._get_size_class(start_offset, stop_offset)].append(
+                (start_offset, stop_offset)
+            )
+        for size_class in self._size_classes:
+            heapq.heapify(size_class)
+        self._size_class_entry_count = len(self._free_blocks)
+
+    def _remove_free_block(self, start_offset):
+        stop_offset = self._free_blocks.pop(start_offset)
+        if stop_offset is not None:
+            del self._free_block_stops[stop_offset]
+        return stop_offset
+
     ### PUBLIC METHODS ###
 
     def allocate(self, desired_block_size=1):
         desired_block_size = int(desired_block_size)
         assert 0 < desired_block_size
         block_id = None
+        if self._strategy == "segregated-fit":
+            with self._lock:
+                free_block = self._allocate_segregated(desired_block_size)
+                if free_block is not None:
+                    block_id, stop_offset = free_block
+                    self._remove_free_block(block_id)
+                    split_offset = block_id + desired_block_size
+                    self._used_blocks[block_id] = split_offset
+                    self._insert_free_block(split_offset, stop_offset)
+            return block_id
         with self._lock:
             free_block = None
             for block in self._free_heap:
@@ -100,6 +231,21 @@ class BlockAllocator(SupriyaObject):
         index = int(index)
         desired_block_size = int(desired_block_size)
         block_id = None
+        if self._strategy == "segregated-fit":
+            stop_offset = index + desired_block_size
+            with self._lock:
+                for free_start_offset, free_stop_offset in self._free_blocks.items():
+                    if free_start_offset <= index and (
+                        free_stop_offset is None or stop_offset <= free_stop_offset
+                    ):
+                        break
+                else:
+                    return None
+                self._remove_free_block(free_start_offset)
+                self._used_blocks[index] = stop_offset
+                self._insert_free_block(free_start_offset, index)
+                self._insert_free_block(stop_offset, free_stop_offset)
+            return index
         with self._lock:
             start_offset = index
             stop_offset = index + desired_block_size
@@ -129,6 +275,25 @@ class BlockAllocator(SupriyaObject):
         import supriya.realtime
 
         block_id = int(block_id)
+        if self._strategy == "segregated-fit":
+            with self._lock:
+                start_offset = block_id
+                if start_offset not in self._used_blocks:
+                    start_offsets = [
+                        used_start_offset
+                        for used_start_offset, used_stop_offset in self._used_blocks.items()
+                        if used_start_offset <= block_id < used_stop_offset
+                    ]
+                    assert len(start_offsets) == 1
+                    start_offset = start_offsets[0]
+                stop_offset = self._used_blocks.pop(start_offset)
+                if start_offset in self._free_block_stops:
+                    start_offset = self._free_block_stops[start_offset]
+                    self._remove_free_block(start_offset)
+                if stop_offset in self._free_blocks:
+                    stop_offset = self._remove_free_block(stop_offset)
+                self._insert_free_block(start_offset, stop_offset)
+            return
         with self._lock:
             cursor = self._used_heap.get_simultaneity_at(block_id)
             blocks = sorted(
@@ -156,6 +321,48 @@ class BlockAllocator(SupriyaObject):
             )
             self._free_heap.insert(free_block)
 
+    def report_fragmentation(self):
+        """
+        Reports on the allocator's free and used blocks.
+
+        Fragmentation is the fraction of free space outside the largest free
+        block. When the heap is unbounded, the trailing unbounded free block
+        is left out of the report.
+        """
+        from abjad import Infinity
+
+        with self._lock:
+            if self._strategy == "segregated-fit":
+                free_sizes = [
+                    stop_offset - start_offset
+                    for start_offset, stop_offset in self._free_blocks.items()
+                    if stop_offset is not None
+                ]
+                used_sizes = [
+                    stop_offset - start_offset
+                    for start_offset, stop_offset in self._used_blocks.items()
+                ]
+            else:
+                free_sizes = [
+                    block.duration
+                    for block in self._free_heap
+                    if block.stop_offset != Infinity
+                ]
+                used_sizes = [block.duration for block in self._used_heap]
+        free_size = int(sum(free_sizes))
+        largest_free_block_size = int(max(free_sizes, default=0))
+        fragmentation = 0.0
+        if free_size:
+            fragmentation = 1.0 - largest_free_block_size / free_size
+        return self.FragmentationReport(
+            free_block_count=len(free_sizes),
+            free_size=free_size,
+            largest_free_block_size=largest_free_block_size,
+            used_block_count=len(used_sizes),
+            used_size=int(sum(used_sizes)),
+            fragmentation=fragmentation,
+        )
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -171,3 +378,10 @@ class BlockAllocator(SupriyaObject):
         Minimum allocatable index.
         """
         return self._heap_minimum
+
+    @property
+    def strategy(self):
+        """
+        Allocation strategy, either first-fit or segregated-fit.
+        """
+        return self._strategy
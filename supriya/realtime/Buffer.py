@@ -1,4 +1,10 @@
+import array
 import collections
+import os
+import struct
+import tempfile
+import threading
+import time
 
 import supriya.exceptions
 from supriya.realtime.ServerObjectProxy import ServerObjectProxy
@@ -43,6 +49,20 @@ class Buffer(ServerObjectProxy):
 
     __slots__ = ("_buffer_group", "_buffer_id", "_buffer_id_was_set_manually")
 
+    # 1633 floats, at four bytes plus a one-byte type tag each, fit into
+    # scsynth's 8192-byte UDP datagrams.
+    _default_chunk_size = 1633
+
+    # Transfers of at least this many samples to or from a local server go
+    # through a temporary soundfile instead of OSC.
+    _file_transfer_threshold = 2 ** 20
+
+    _local_ip_addresses = ("127.0.0.1", "::1", "localhost")
+
+    _maximum_transfer_attempts = 3
+
+    _wav_header = struct.Struct("<4sI4s4sIHHIIHHH4sI")
+
     ### INITIALIZER ###
 
     def __init__(self, buffer_group_or_index=None):
@@ -204,6 +224,129 @@ class Buffer(ServerObjectProxy):
                 raise ValueError
             self._buffer_id = buffer_id
 
+    def _get_samples_via_file(self, start, samples, timeout):
+        import supriya.commands
+
+        channel_count = self.channel_count
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "buffer.wav")
+            request = supriya.commands.BufferWriteRequest(
+                buffer_id=self.buffer_id,
+                file_path=file_path,
+                frame_count=len(samples) // channel_count,
+                header_format="wav",
+                sample_format="float",
+                starting_frame=start // channel_count,
+            )
+            request.communicate(server=self.server, sync=False)
+            self._sync(timeout)
+            file_samples, _ = self._read_float_wav(file_path)
+            samples[:] = file_samples[: len(samples)]
+            del file_samples
+
+    def _get_samples_via_osc(self, start, samples, chunk_size, in_flight, timeout):
+        import supriya.commands
+
+        buffer_id = self.buffer_id
+        condition = threading.Condition()
+        failures = []
+        # Each pending chunk is an [index, count, attempt count] triple, and
+        # each requested chunk maps its index to a [count, deadline, attempt
+        # count] triple.
+        pending = collections.deque(
+            (index, count, 0)
+            for index, count in self._iterate_chunks(start, len(samples), chunk_size)
+        )
+        requested = {}
+
+        def receive(message):
+            contents = message.contents
+            index = contents[1]
+            with condition:
+                if requested.pop(index, None) is None:
+                    return
+                samples[index - start : index - start + contents[2]] = contents[3:]
+                condition.notify()
+
+        def fail(message):
+            with condition:
+                failures.append(message)
+                condition.notify()
+
+        callbacks = [
+            self.server.osc_io.register(["/b_setn", buffer_id], receive),
+            self.server.osc_io.register(["/fail", "/b_getn"], fail),
+        ]
+        try:
+            with condition:
+                while pending or requested:
+                    while pending and len(requested) < in_flight:
+                        index, count, attempts = pending.popleft()
+                        requested[index] = (count, time.time() + timeout, attempts)
+                        request = supriya.commands.BufferGetContiguousRequest(
+                            buffer_id=buffer_id, index_count_pairs=[(index, count)]
+                        )
+                        self.server.send_message(request.to_osc())
+                    deadline = min(deadline for _, deadline, _ in requested.values())
+                    condition.wait(deadline - time.time())
+                    if failures:
+                        raise IndexError("Index out of range.")
+                    now = time.time()
+                    for index, (count, deadline, attempts) in list(requested.items()):
+                        if now < deadline:
+                            continue
+                        if self._maximum_transfer_attempts <= attempts + 1:
+                            raise supriya.exceptions.RequestTimeout
+                        del requested[index]
+                        pending.appendleft((index, count, attempts + 1))
+        finally:
+            for callback in callbacks:
+                self.server.osc_io.unregister(callback)
+
+    @staticmethod
+    def _iterate_chunks(start, count, chunk_size):
+        for index in range(start, start + count, chunk_size):
+            yield index, min(chunk_size, start + count - index)
+
+    @staticmethod
+    def _read_float_wav(file_path):
+        """
+        Memory-maps the sample data of a 32-bit float WAV file.
+
+        Returns a pair of a NumPy memmap of interleaved samples and a channel
+        count.
+        """
+        import numpy
+
+        format_tag = channel_count = bits_per_sample = None
+        with open(file_path, "rb") as file_pointer:
+            riff, _, wave = struct.unpack("<4sI4s", file_pointer.read(12))
+            if riff != b"RIFF" or wave != b"WAVE":
+                raise ValueError("Not a WAV file: {}".format(file_path))
+            while True:
+                chunk_header = file_pointer.read(8)
+                if len(chunk_header) < 8:
+                    raise ValueError("No data chunk: {}".format(file_path))
+                chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+                if chunk_id == b"data":
+                    break
+                chunk = file_pointer.read(chunk_size + chunk_size % 2)
+                if chunk_id == b"fmt ":
+                    format_tag, channel_count = struct.unpack_from("<HH", chunk)
+                    bits_per_sample = struct.unpack_from("<H", chunk, 14)[0]
+                    if format_tag == 0xFFFE:  # WAVE_FORMAT_EXTENSIBLE
+                        format_tag = struct.unpack_from("<H", chunk, 24)[0]
+            offset = file_pointer.tell()
+        if (format_tag, bits_per_sample) != (3, 32):
+            raise ValueError("Not a 32-bit float WAV file: {}".format(file_path))
+        sample_count = chunk_size // 4
+        if not sample_count:
+            return numpy.zeros(0, dtype="<f4"), channel_count
+        samples = numpy.memmap(
+            file_path, dtype="<f4", mode="r", offset=offset, shape=(sample_count,)
+        )
+        return samples, channel_count
+
     def _register_with_local_server(self):
         if self.buffer_id not in self.server._buffers:
             self.server._buffers[self.buffer_id] = set()
@@ -251,6 +394,65 @@ class Buffer(ServerObjectProxy):
             )
         return request
 
+    def _resolve_sample_range(self, start, count):
+        sample_count = self.sample_count
+        if count is None:
+            count = sample_count - start
+        if start < 0 or count < 0 or sample_count < start + count:
+            raise IndexError("Index out of range.")
+        return start, count
+
+    def _set_samples_via_file(self, start, samples, timeout):
+        import supriya.commands
+
+        channel_count = self.channel_count
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "buffer.wav")
+            self._write_float_wav(file_path, samples, channel_count, self.sample_rate)
+            request = supriya.commands.BufferReadRequest(
+                buffer_id=self.buffer_id,
+                file_path=file_path,
+                frame_count=len(samples) // channel_count,
+                starting_frame_in_buffer=start // channel_count,
+                starting_frame_in_file=0,
+            )
+            request.communicate(server=self.server, sync=False)
+            self._sync(timeout)
+
+    def _set_samples_via_osc(self, start, samples, chunk_size, in_flight, timeout):
+        import supriya.commands
+
+        chunks = list(self._iterate_chunks(start, len(samples), chunk_size))
+        # Sync after each window of chunks, so no more than `in_flight`
+        # datagrams queue up in scsynth's socket at once.
+        for window_start in range(0, len(chunks), in_flight):
+            for index, count in chunks[window_start : window_start + in_flight]:
+                values = samples[index - start : index - start + count].tolist()
+                request = supriya.commands.BufferSetContiguousRequest(
+                    buffer_id=self.buffer_id, index_values_pairs=[(index, values)]
+                )
+                self.server.send_message(request.to_osc())
+            self._sync(timeout)
+
+    def _sync(self, timeout):
+        import supriya.commands
+
+        request = supriya.commands.SyncRequest(sync_id=self.server.next_sync_id)
+        if request.communicate(server=self.server, timeout=timeout) is None:
+            raise supriya.exceptions.RequestTimeout
+
+    def _transfers_via_file(self, start, count, via_file):
+        if via_file is None:
+            via_file = (
+                self._file_transfer_threshold <= count
+                and self.server.ip_address in self._local_ip_addresses
+            )
+        # Soundfiles can only address whole frames.
+        channel_count = self.channel_count
+        return (
+            bool(via_file) and not start % channel_count and not count % channel_count
+        )
+
     def _unregister_with_local_server(self):
         buffer_id = self.buffer_id
         buffers = self.server._buffers[buffer_id]
@@ -268,6 +470,32 @@ class Buffer(ServerObjectProxy):
         )
         return request
 
+    @classmethod
+    def _write_float_wav(cls, file_path, samples, channel_count, sample_rate):
+        import numpy
+
+        samples = numpy.asarray(samples, dtype="<f4")
+        data_size = samples.size * 4
+        header = cls._wav_header.pack(
+            b"RIFF",
+            cls._wav_header.size - 8 + data_size,
+            b"WAVE",
+            b"fmt ",
+            18,
+            3,  # WAVE_FORMAT_IEEE_FLOAT
+            channel_count,
+            int(sample_rate),
+            int(sample_rate) * channel_count * 4,
+            channel_count * 4,
+            32,
+            0,
+            b"data",
+            data_size,
+        )
+        with open(file_path, "wb") as file_pointer:
+            file_pointer.write(header)
+            samples.tofile(file_pointer)
+
     ### PUBLIC METHODS ###
 
     def allocate(self, channel_count=1, frame_count=1, server=None, sync=True):
@@ -1002,6 +1230,94 @@ class Buffer(ServerObjectProxy):
         response = self.get_contiguous(index_count_pairs=index_count_pairs)
         return response
 
+    def get_samples(
+        self,
+        start=0,
+        count=None,
+        out=None,
+        chunk_size=None,
+        in_flight=16,
+        via_file=None,
+        timeout=1.0,
+    ):
+        """
+        Gets `count` contiguous sample values starting at `start`, in bulk.
+
+        ::
+
+            >>> server = supriya.realtime.Server().boot()
+            >>> buffer_ = supriya.realtime.Buffer().allocate(
+            ...     channel_count=2,
+            ...     frame_count=4,
+            ...     )
+            >>> buffer_.set_contiguous([(2, [0.5, 0.25, 0.125])], sync=True)
+            >>> buffer_.get_samples().tolist()
+            [0.0, 0.0, 0.5, 0.25, 0.125, 0.0, 0.0, 0.0]
+
+        ::
+
+            >>> import array
+            >>> buffer_.get_samples(start=3, out=array.array('f', [0.0] * 2))
+            array('f', [0.25, 0.125])
+
+        ::
+
+            >>> buffer_.get_samples(start=6, count=4)
+            Traceback (most recent call last):
+            ...
+            IndexError: Index out of range.
+
+        ::
+
+            >>> buffer_ = buffer_.free()
+
+        ::
+
+            >>> buffer_.get_samples()
+            Traceback (most recent call last):
+            ...
+            supriya.exceptions.BufferNotAllocated
+
+        Samples are requested via `/b_getn` in chunks of `chunk_size`
+        samples, sized by default to fit a UDP datagram, with up to
+        `in_flight` chunks requested at once. Chunks unanswered after
+        `timeout` seconds are requested again.
+
+        Transfers of whole frames from a local server may instead have the
+        server write a temporary soundfile via `/b_write`, which is then
+        memory-mapped. This happens when `via_file` is true, or when
+        `via_file` is none and the transfer is large.
+
+        Samples are copied into `out`, a NumPy array or an ``array('f')``,
+        if given, or into a new NumPy float32 array otherwise. `count`
+        defaults to the length of `out`, or to the rest of the buffer.
+
+        Returns `out`.
+        """
+        import numpy
+
+        if not self.is_allocated:
+            raise supriya.exceptions.BufferNotAllocated
+        if count is None and out is not None:
+            count = len(out)
+        start, count = self._resolve_sample_range(start, count)
+        if out is None:
+            out = numpy.zeros(count, dtype=numpy.float32)
+        if len(out) < count:
+            raise ValueError("Cannot copy {} samples into {!r}.".format(count, out))
+        if isinstance(out, array.array):
+            samples = numpy.frombuffer(out, dtype=numpy.float32)[:count]
+        else:
+            samples = out[:count]
+        if not count:
+            return out
+        if self._transfers_via_file(start, count, via_file):
+            self._get_samples_via_file(start, samples, timeout)
+        else:
+            chunk_size = chunk_size or self._default_chunk_size
+            self._get_samples_via_osc(start, samples, chunk_size, in_flight, timeout)
+        return out
+
     def play(
         self, add_action=None, bus=0, level=1, loop=False, rate=1, target_node=None
     ):
@@ -1245,6 +1561,75 @@ class Buffer(ServerObjectProxy):
         )
         request.communicate(server=self.server, sync=sync)
 
+    def set_samples(
+        self,
+        samples,
+        start=0,
+        chunk_size=None,
+        in_flight=16,
+        via_file=None,
+        timeout=1.0,
+    ):
+        """
+        Sets contiguous sample values starting at `start`, in bulk.
+
+        ::
+
+            >>> server = supriya.realtime.Server().boot()
+            >>> buffer_ = supriya.realtime.Buffer().allocate(
+            ...     channel_count=2,
+            ...     frame_count=4,
+            ...     )
+
+        ::
+
+            >>> buffer_.set_samples([0.5, 0.25, 0.125], start=2)
+            >>> buffer_.get_contiguous([(0, 8)]).as_dict()[0]
+            (0.0, 0.0, 0.5, 0.25, 0.125, 0.0, 0.0, 0.0)
+
+        ::
+
+            >>> buffer_.set_samples([1.0] * 4, start=6)
+            Traceback (most recent call last):
+            ...
+            IndexError: Index out of range.
+
+        ::
+
+            >>> buffer_ = buffer_.free()
+
+        ::
+
+            >>> buffer_.set_samples([0.5])
+            Traceback (most recent call last):
+            ...
+            supriya.exceptions.BufferNotAllocated
+
+        `samples` may be any sequence of floats, including NumPy arrays and
+        ``array('f')``, and multidimensional arrays are flattened.
+
+        Samples are sent via `/b_setn` in chunks of `chunk_size` samples,
+        sized by default to fit a UDP datagram, syncing with the server
+        after every `in_flight` chunks. As with ``get_samples()``, large
+        transfers of whole frames to a local server may instead go through a
+        temporary soundfile read via `/b_read`.
+
+        Returns none.
+        """
+        import numpy
+
+        if not self.is_allocated:
+            raise supriya.exceptions.BufferNotAllocated
+        samples = numpy.asarray(samples, dtype=numpy.float32).ravel()
+        start, count = self._resolve_sample_range(start, len(samples))
+        if not count:
+            return
+        if self._transfers_via_file(start, count, via_file):
+            self._set_samples_via_file(start, samples, timeout)
+        else:
+            chunk_size = chunk_size or self._default_chunk_size
+            self._set_samples_via_osc(start, samples, chunk_size, in_flight, timeout)
+
     def write(
         self,
         file_path,
@@ -155,6 +155,26 @@ class BufferGroup(ServerObjectProxy):
         ServerObjectProxy.free(self)
         return self
 
+    def get_samples(self, chunk_size=None, in_flight=16, via_file=None, timeout=1.0):
+        """
+        Gets every buffer's samples in bulk.
+
+        See ``Buffer.get_samples()``.
+
+        Returns list of NumPy arrays.
+        """
+        if not self.is_allocated:
+            raise supriya.exceptions.BufferNotAllocated
+        return [
+            buffer_.get_samples(
+                chunk_size=chunk_size,
+                in_flight=in_flight,
+                via_file=via_file,
+                timeout=timeout,
+            )
+            for buffer_ in self
+        ]
+
     def index(self, item):
         return self.buffers.index(item)
 
@@ -201,6 +221,32 @@ class BufferGroup(ServerObjectProxy):
         )
         return buffer_group
 
+    def set_samples(
+        self, samples, chunk_size=None, in_flight=16, via_file=None, timeout=1.0
+    ):
+        """
+        Sets each buffer's samples in bulk, from a sequence of sample
+        sequences, one per buffer.
+
+        See ``Buffer.set_samples()``.
+
+        Returns none.
+        """
+        if not self.is_allocated:
+            raise supriya.exceptions.BufferNotAllocated
+        if len(samples) != len(self):
+            raise ValueError(
+                "Expected {} sample sequences, got {}.".format(len(self), len(samples))
+            )
+        for buffer_, buffer_samples in zip(self, samples):
+            buffer_.set_samples(
+                buffer_samples,
+                chunk_size=chunk_size,
+                in_flight=in_flight,
+                via_file=via_file,
+                timeout=timeout,
+            )
+
     def zero(self):
         """
         Analogous to SuperCollider's Buffer.zero.
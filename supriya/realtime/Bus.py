@@ -315,7 +315,7 @@ class Bus(ServerObjectProxy):
         request = supriya.commands.ControlBusSetRequest(
             index_value_pairs=((self, value),)
         )
-        request.communicate(server=self.server, sync=False)
+        self.server.control_outbox.communicate(request, sync=False)
 
     ### PUBLIC PROPERTIES ###
 
@@ -461,7 +461,7 @@ class BusGroup(ServerObjectProxy):
         request = supriya.commands.ControlBusSetContiguousRequest(
             index_values_pairs=[(self, values)]
         )
-        request.communicate(sync=False)
+        self.server.control_outbox.communicate(request, sync=False)
 
     ### PUBLIC PROPERTIES ###
 
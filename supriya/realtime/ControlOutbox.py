@@ -0,0 +1,270 @@
+import collections
+import threading
+
+from supriya.system.SupriyaObject import SupriyaObject
+
+
+class ControlOutbox(SupriyaObject):
+    """
+    A server's control-write outbox.
+
+    When enabled, node control and control bus writes are collected for a
+    short window, keeping only the last value written to each control or
+    bus, then flushed as a single bundle of ``/n_set`` and ``/c_setn``
+    messages.
+
+    ::
+
+        >>> import supriya
+        >>> server = supriya.Server().boot()
+        >>> outbox = server.control_outbox.enable()
+        >>> synth = supriya.Synth().allocate()
+        >>> for i in range(100):
+        ...     synth['frequency'] = 440 + i
+        ...
+        >>> outbox.flush()
+        >>> outbox.coalesced_message_count, outbox.sent_message_count
+        (99, 1)
+
+    ::
+
+        >>> synth['frequency']
+        539.0
+
+    ::
+
+        >>> outbox.disable()
+
+    Any other request sent to the server flushes the outbox first, so writes
+    are never reordered with respect to the requests around them.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Server Internals"
+
+    __slots__ = (
+        "_bus_values",
+        "_coalesced_message_count",
+        "_enqueued_message_count",
+        "_is_enabled",
+        "_lock",
+        "_node_settings",
+        "_sent_bundle_count",
+        "_sent_message_count",
+        "_server",
+        "_timer",
+        "_window",
+    )
+
+    _maximum_bundle_length = 64
+
+    ### INITIALIZER ###
+
+    def __init__(self, server):
+        self._bus_values = {}
+        self._is_enabled = False
+        self._lock = threading.RLock()
+        self._node_settings = collections.OrderedDict()
+        self._server = server
+        self._timer = None
+        self._window = None
+        self.reset_metrics()
+
+    ### PRIVATE METHODS ###
+
+    def _build_requests(self, node_settings, bus_values):
+        import supriya.commands
+
+        requests = [
+            supriya.commands.NodeSetRequest(node_id, **settings)
+            for node_id, settings in node_settings.items()
+        ]
+        index_values_pairs = []
+        for bus_id in sorted(bus_values):
+            if index_values_pairs and (
+                index_values_pairs[-1][0] + len(index_values_pairs[-1][1]) == bus_id
+            ):
+                index_values_pairs[-1][1].append(bus_values[bus_id])
+            else:
+                index_values_pairs.append((bus_id, [bus_values[bus_id]]))
+        if index_values_pairs:
+            requests.append(
+                supriya.commands.ControlBusSetContiguousRequest(
+                    index_values_pairs=index_values_pairs
+                )
+            )
+        return requests
+
+    def _enqueue(self, request):
+        import supriya.commands
+
+        if isinstance(request, supriya.commands.NodeSetRequest):
+            node_id = int(request.node_id)
+            if node_id in self._node_settings:
+                self._coalesced_message_count += 1
+                settings = self._node_settings[node_id]
+            else:
+                settings = self._node_settings[node_id] = {}
+            settings.update(request._kwargs)
+        else:
+            if isinstance(request, supriya.commands.ControlBusSetRequest):
+                bus_values = [
+                    (int(bus_id), value)
+                    for bus_id, value in request.index_value_pairs or ()
+                ]
+            else:
+                bus_values = [
+                    (int(index) + i, value)
+                    for index, values in request.index_values_pairs or ()
+                    for i, value in enumerate(values)
+                ]
+            if self._bus_values:
+                self._coalesced_message_count += 1
+            self._bus_values.update(bus_values)
+        self._enqueued_message_count += 1
+        if self._timer is None:
+            self._timer = threading.Timer(self._get_window(), self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _get_window(self):
+        if self._window is not None:
+            return self._window
+        server_options = self._server.server_options
+        return server_options.block_size / (server_options.sample_rate or 44100)
+
+    ### PUBLIC METHODS ###
+
+    def communicate(self, request, sync=True):
+        """
+        Enqueues `request` if the outbox is enabled, otherwise communicates
+        `request` immediately.
+
+        Requests other than node set, control bus set and contiguous control
+        bus set requests, or bundles containing them, are always communicated
+        immediately.
+        """
+        import supriya.commands
+
+        prototype = (
+            supriya.commands.ControlBusSetContiguousRequest,
+            supriya.commands.ControlBusSetRequest,
+            supriya.commands.NodeSetRequest,
+        )
+        requests = list(request._linearize())
+        if not self._is_enabled or not all(isinstance(_, prototype) for _ in requests):
+            request.communicate(server=self._server, sync=sync)
+            return
+        with self._server._lock:
+            for request in requests:
+                request._apply_local(self._server)
+        with self._lock:
+            for request in requests:
+                self._enqueue(request)
+
+    def disable(self):
+        """
+        Flushes and disables the outbox.
+        """
+        with self._lock:
+            self._is_enabled = False
+        self.flush()
+
+    def enable(self, window=None):
+        """
+        Enables the outbox.
+
+        `window` is the time in seconds writes are collected for before being
+        flushed, and defaults to the duration of one control block.
+        """
+        if window is not None:
+            window = float(window)
+            assert 0 <= window
+        with self._lock:
+            self._window = window
+            self._is_enabled = True
+        return self
+
+    def flush(self):
+        """
+        Sends all pending writes in as few bundles as possible.
+        """
+        import supriya.commands
+
+        # Sending under the lock keeps concurrent flushes, and the requests
+        # waiting on them, in order.
+        with self._lock:
+            if not self._node_settings and not self._bus_values:
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            node_settings, self._node_settings = (
+                self._node_settings,
+                collections.OrderedDict(),
+            )
+            bus_values, self._bus_values = self._bus_values, {}
+            if not self._server.is_running:
+                return
+            requests = self._build_requests(node_settings, bus_values)
+            for i in range(0, len(requests), self._maximum_bundle_length):
+                contents = requests[i : i + self._maximum_bundle_length]
+                if len(contents) == 1:
+                    request = contents[0]
+                else:
+                    request = supriya.commands.RequestBundle(contents=contents)
+                request.communicate(server=self._server, sync=False, apply_local=False)
+                self._sent_bundle_count += 1
+                self._sent_message_count += len(contents)
+
+    def reset_metrics(self):
+        """
+        Resets the outbox's message counts.
+        """
+        self._coalesced_message_count = 0
+        self._enqueued_message_count = 0
+        self._sent_bundle_count = 0
+        self._sent_message_count = 0
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def coalesced_message_count(self):
+        """
+        Gets the number of writes merged into an already pending message.
+        """
+        return self._coalesced_message_count
+
+    @property
+    def enqueued_message_count(self):
+        """
+        Gets the number of writes enqueued.
+        """
+        return self._enqueued_message_count
+
+    @property
+    def is_enabled(self):
+        return self._is_enabled
+
+    @property
+    def sent_bundle_count(self):
+        """
+        Gets the number of bundles, or lone messages, sent.
+        """
+        return self._sent_bundle_count
+
+    @property
+    def sent_message_count(self):
+        """
+        Gets the number of messages sent.
+        """
+        return self._sent_message_count
+
+    @property
+    def server(self):
+        return self._server
+
+    @property
+    def window(self):
+        return self._get_window()
@@ -21,6 +21,11 @@ class Server(SupriyaObject):
     """
     An scsynth server proxy.
 
+    Pass `osc_worker_count` to dispatch server replies on a pooled receiver
+    with that many worker threads, and `osc_queue_size` to bound each
+    worker's queue. Both default to Supriya's config file settings; see
+    ``OscIO.from_config()``.
+
     ::
 
         >>> import supriya.realtime
@@ -50,6 +55,7 @@ class Server(SupriyaObject):
         "_control_bus_allocator",
         "_control_buses",
         "_control_bus_proxies",
+        "_control_outbox",
         "_debug_subprocess",
         "_debug_osc",
         "_debug_udp",
@@ -90,7 +96,13 @@ class Server(SupriyaObject):
 
     ### INITIALIZER ###
 
-    def __init__(self, ip_address="127.0.0.1", port=57751):
+    def __init__(
+        self,
+        ip_address="127.0.0.1",
+        port=57751,
+        osc_worker_count=None,
+        osc_queue_size=None,
+    ):
         import supriya.osc
         import supriya.commands
         import supriya.realtime
@@ -107,7 +119,10 @@ class Server(SupriyaObject):
 
         self._latency = 0.1
         self._lock = threading.Lock()
-        self._osc_io = supriya.osc.OscIO()
+        self._osc_io = supriya.osc.OscIO.from_config(
+            worker_count=osc_worker_count, queue_size=osc_queue_size
+        )
+        self._control_outbox = supriya.realtime.ControlOutbox(self)
 
         ### ALLOCATORS ###
 
@@ -425,15 +440,19 @@ class Server(SupriyaObject):
     def _setup_allocators(self, server_options):
         import supriya.realtime
 
+        strategy = supriya.config.get(
+            "core", "allocator_strategy", fallback="first-fit"
+        )
         self._audio_bus_allocator = supriya.realtime.BlockAllocator(
             heap_maximum=server_options.audio_bus_channel_count,
             heap_minimum=server_options.first_private_bus_id,
+            strategy=strategy,
         )
         self._buffer_allocator = supriya.realtime.BlockAllocator(
-            heap_maximum=server_options.buffer_count
+            heap_maximum=server_options.buffer_count, strategy=strategy
         )
         self._control_bus_allocator = supriya.realtime.BlockAllocator(
-            heap_maximum=server_options.control_bus_channel_count
+            heap_maximum=server_options.control_bus_channel_count, strategy=strategy
         )
         self._node_id_allocator = supriya.realtime.NodeIdAllocator(
             initial_node_id=server_options.initial_node_id
@@ -642,6 +661,17 @@ class Server(SupriyaObject):
             Server._default_server = Server()
         return Server._default_server
 
+    def get_status_history(self, count=None):
+        """
+        Gets up to `count` of the latest status replies, oldest first, as a
+        dictionary of field names to NumPy arrays.
+
+        Returns none if the server is not running.
+        """
+        if self._status_watcher is None:
+            return None
+        return self._status_watcher.get_history(count)
+
     def query_local_nodes(self, include_controls=False):
         """
         Queries all node proxies in Python.
@@ -712,7 +742,7 @@ class Server(SupriyaObject):
         )
         return query_tree_group
 
-    def query_remote_nodes(self, include_controls=False):
+    def query_remote_nodes(self, include_controls=False, snapshot=False):
         """
         Queries all nodes on scsynth.
 
@@ -773,6 +803,9 @@ class Server(SupriyaObject):
             <Server: offline>
 
         Returns server query-tree group response.
+
+        If `snapshot` is true, returns a compact query-tree snapshot instead,
+        without building query-tree objects.
         """
         import supriya.commands
 
@@ -780,6 +813,8 @@ class Server(SupriyaObject):
             node_id=0, include_controls=include_controls
         )
         response = request.communicate(server=self)
+        if snapshot:
+            return response.query_tree_snapshot
         return response.query_tree_group
 
     def quit(self):
@@ -800,10 +835,10 @@ class Server(SupriyaObject):
         PubSub.notify("server-quit")
         return self
 
-    def send_message(self, message):
+    def send_message(self, message, datagram=None):
         if not message or not self.is_running:
             return
-        self._osc_io.send(message)
+        self._osc_io.send(message, datagram=datagram)
 
     def sync(self, sync_id=None):
         import supriya.commands
@@ -838,6 +873,10 @@ class Server(SupriyaObject):
     def control_bus_allocator(self):
         return self._control_bus_allocator
 
+    @property
+    def control_outbox(self):
+        return self._control_outbox
+
     @property
     def debug_osc(self):
         return self._debug_osc
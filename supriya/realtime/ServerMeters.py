@@ -1,5 +1,4 @@
 import supriya.system
-from supriya import utils
 from supriya.system.SupriyaObject import SupriyaObject
 
 
@@ -42,6 +41,15 @@ class ServerMeters(SupriyaObject):
             }
         }
 
+    Meter levels are also kept in fixed-size histories, which can be read
+    many packets at a time:
+
+    ::
+
+        >>> peaks, rms = meters.get_output_meter_history(count=10)
+        >>> peaks.shape
+        (10, 2)
+
     ::
 
         >>> meters.free()
@@ -54,10 +62,12 @@ class ServerMeters(SupriyaObject):
 
     __slots__ = (
         "_input_meter_callback",
+        "_input_meter_history",
         "_input_meter_peak_levels",
         "_input_meter_rms_levels",
         "_input_meter_synth",
         "_output_meter_callback",
+        "_output_meter_history",
         "_output_meter_peak_levels",
         "_output_meter_rms_levels",
         "_output_meter_synth",
@@ -69,10 +79,12 @@ class ServerMeters(SupriyaObject):
     def __init__(self, server):
         self._server = server
         self._input_meter_callback = None
+        self._input_meter_history = None
         self._input_meter_peak_levels = None
         self._input_meter_rms_levels = None
         self._input_meter_synth = None
         self._output_meter_callback = None
+        self._output_meter_history = None
         self._output_meter_peak_levels = None
         self._output_meter_rms_levels = None
         self._output_meter_synth = None
@@ -80,24 +92,16 @@ class ServerMeters(SupriyaObject):
     ### PRIVATE METHODS ###
 
     def _handle_input_levels(self, message):
-        contents = message.contents[2:]
-        peak_levels = []
-        rms_levels = []
-        for peak, rms in utils.group_iterable_by_count(contents, 2):
-            peak_levels.append(peak)
-            rms_levels.append(rms)
-        self._input_meter_peak_levels = tuple(peak_levels)
-        self._input_meter_rms_levels = tuple(rms_levels)
+        levels = message.contents[2:]
+        self._input_meter_history.append(levels)
+        self._input_meter_peak_levels = levels[::2]
+        self._input_meter_rms_levels = levels[1::2]
 
     def _handle_output_levels(self, message):
-        contents = message.contents[2:]
-        peak_levels = []
-        rms_levels = []
-        for peak, rms in utils.group_iterable_by_count(contents, 2):
-            peak_levels.append(peak)
-            rms_levels.append(rms)
-        self._output_meter_peak_levels = tuple(peak_levels)
-        self._output_meter_rms_levels = tuple(rms_levels)
+        levels = message.contents[2:]
+        self._output_meter_history.append(levels)
+        self._output_meter_peak_levels = levels[::2]
+        self._output_meter_rms_levels = levels[1::2]
         supriya.system.PubSub.notify(
             "server-meters",
             {
@@ -110,15 +114,38 @@ class ServerMeters(SupriyaObject):
 
     ### PUBLIC METHODS ###
 
-    def allocate(self):
+    def allocate(self, decimation=1, history_size=1024, peak_hold=True):
+        """
+        Allocates meter synths and starts recording their levels.
+
+        Keeps the latest `history_size` levels of each meter, storing one for
+        every `decimation` received: the latest, or with `peak_hold` the
+        highest.
+        """
         import supriya.osc
         import supriya.realtime
 
+        self._input_meter_history = supriya.system.RingBuffer(
+            capacity=history_size,
+            decimation=decimation,
+            peak_hold=peak_hold,
+            width=self.input_count * 2,
+        )
+        self._output_meter_history = supriya.system.RingBuffer(
+            capacity=history_size,
+            decimation=decimation,
+            peak_hold=peak_hold,
+            width=self.output_count * 2,
+        )
         self._input_meter_callback = self.server.osc_io.register(
-            pattern=self.input_meter_command, procedure=self._handle_input_levels
+            pattern=self.input_meter_command,
+            procedure=self._handle_input_levels,
+            droppable=True,
         )
         self._output_meter_callback = self.server.osc_io.register(
-            pattern=self.output_meter_command, procedure=self._handle_output_levels
+            pattern=self.output_meter_command,
+            procedure=self._handle_output_levels,
+            droppable=True,
         )
         input_meter_synthdef = self.input_meter_synthdef
         output_meter_synthdef = self.output_meter_synthdef
@@ -146,6 +173,26 @@ class ServerMeters(SupriyaObject):
         self._input_meter_synth = None
         self._output_meter_synth = None
 
+    def get_input_meter_history(self, count=None):
+        """
+        Gets up to `count` of the latest input meter levels, oldest first.
+
+        Returns NumPy arrays of peak and RMS levels, each of shape `(count,
+        channels)`.
+        """
+        levels = self._input_meter_history.latest(count)
+        return levels[:, 0::2], levels[:, 1::2]
+
+    def get_output_meter_history(self, count=None):
+        """
+        Gets up to `count` of the latest output meter levels, oldest first.
+
+        Returns NumPy arrays of peak and RMS levels, each of shape `(count,
+        channels)`.
+        """
+        levels = self._output_meter_history.latest(count)
+        return levels[:, 0::2], levels[:, 1::2]
+
     @staticmethod
     def make_meter_synthdef(channel_count=1, command_name="/reply", initial_bus=0):
         import supriya.synthdefs
@@ -195,6 +242,10 @@ class ServerMeters(SupriyaObject):
     def input_meter_command(self):
         return "/meter.inputs"
 
+    @property
+    def input_meter_history(self):
+        return self._input_meter_history
+
     @property
     def input_meter_synthdef(self):
         return self.make_meter_synthdef(
@@ -207,6 +258,10 @@ class ServerMeters(SupriyaObject):
     def output_meter_command(self):
         return "/meter.outputs"
 
+    @property
+    def output_meter_history(self):
+        return self._output_meter_history
+
     @property
     def output_meter_synthdef(self):
         return self.make_meter_synthdef(
@@ -10,7 +10,22 @@ class StatusWatcher(threading.Thread):
 
     __documentation_section__ = "Server Internals"
 
-    __slots__ = ("_active", "_attempts", "_callback", "_server")
+    __slots__ = ("_active", "_attempts", "_callback", "_history", "_server")
+
+    history_decimation = 1
+
+    history_fields = (
+        "average_cpu_usage",
+        "peak_cpu_usage",
+        "ugen_count",
+        "synth_count",
+        "group_count",
+        "synthdef_count",
+    )
+
+    history_peak_hold = False
+
+    history_size = 1024
 
     max_attempts = 5
 
@@ -21,6 +36,12 @@ class StatusWatcher(threading.Thread):
         self._attempts = 0
         self._server = server
         self._callback = None
+        self._history = supriya.system.RingBuffer(
+            capacity=self.history_size,
+            decimation=self.history_decimation,
+            peak_hold=self.history_peak_hold,
+            width=len(self.history_fields),
+        )
         self.active = True
         self.daemon = True
 
@@ -33,15 +54,30 @@ class StatusWatcher(threading.Thread):
             return
         self._server._status = response
         self._attempts = 0
+        self._history.append(
+            [getattr(response, field) for field in self.history_fields]
+        )
         supriya.system.PubSub.notify("server-status", response.to_dict())
 
     ### PUBLIC METHODS ###
 
+    def get_history(self, count=None):
+        """
+        Gets up to `count` of the latest status fields, oldest first.
+
+        Returns a dictionary of field names to NumPy arrays.
+        """
+        rows = self._history.latest(count)
+        return {field: rows[:, i] for i, field in enumerate(self.history_fields)}
+
     def run(self):
         import supriya.commands
 
         self._callback = self.server.osc_io.register(
-            pattern="/status.reply", procedure=self.__call__, parse_response=True
+            pattern="/status.reply",
+            procedure=self.__call__,
+            parse_response=True,
+            droppable=True,
         )
         request = supriya.commands.StatusRequest()
         message = request.to_osc()
@@ -72,6 +108,10 @@ class StatusWatcher(threading.Thread):
     def callback(self):
         return self._callback
 
+    @property
+    def history(self):
+        return self._history
+
     @property
     def server(self):
         return self._server
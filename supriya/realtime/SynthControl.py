@@ -133,7 +133,7 @@ class SynthControl:
                 self.node, **{self.name: self._value}
             )
         if self.node.is_allocated:
-            request.communicate(server=self.node.server)
+            self.node.server.control_outbox.communicate(request)
         return self.get()
 
     ### PUBLIC PROPERTIES ###
@@ -63,8 +63,8 @@ class SynthInterface(ControlInterface):
         requests = self._set(**settings)
         if not self.client.is_allocated:
             return
-        supriya.commands.RequestBundle(contents=requests).communicate(
-            server=self.client.server, sync=True
+        self.client.server.control_outbox.communicate(
+            supriya.commands.RequestBundle(contents=requests), sync=True
         )
 
     def __str__(self):
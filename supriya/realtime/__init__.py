@@ -13,6 +13,7 @@ from .Bus import Bus  # noqa
 from .BusGroup import BusGroup  # noqa
 from .BusProxy import BusProxy  # noqa
 from .ControlInterface import ControlInterface  # noqa
+from .ControlOutbox import ControlOutbox  # noqa
 from .Group import Group  # noqa
 from .GroupControl import GroupControl  # noqa
 from .GroupInterface import GroupInterface  # noqa
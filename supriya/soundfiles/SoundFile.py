@@ -1,4 +1,5 @@
 import os
+import struct
 
 from supriya.system.SupriyaObject import SupriyaObject
 
@@ -9,10 +10,50 @@ except ImportError:
 
 
 class SoundFile(SupriyaObject):
+    """
+    A soundfile.
+
+    ::
+
+        >>> import supriya.soundfiles
+        >>> soundfile = supriya.soundfiles.SoundFile(
+        ...     supriya.system.Assets['audio/sine_440hz_44100sr_16bit_mono_1s.wav'],
+        ...     )
+        >>> soundfile.frame_count, soundfile.channel_count
+        (44100, 1)
+
+    Soundfiles slice by frame, and optionally channel, into NumPy arrays of
+    shape `(frames, channels)`:
+
+    ::
+
+        >>> soundfile[1000:1004, 0]
+        array([-0.14199829, -0.07971191, -0.01708984,  0.04556274], dtype=float32)
+
+    ::
+
+        >>> soundfile.slice_seconds(0.25, 0.5).shape
+        (11025, 1)
+
+    Uncompressed WAV and AIFF sample data is memory-mapped rather than
+    read, so slicing costs only the frames sliced. Other formats are read
+    from disk in bounded blocks, seeking past frames that strided slices
+    skip.
+    """
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("_channel_count", "_file_path", "_frame_count", "_sample_rate")
+    __slots__ = (
+        "_channel_count",
+        "_file_path",
+        "_frame_count",
+        "_overview",
+        "_sample_layout",
+        "_sample_rate",
+        "_samples",
+    )
+
+    _read_block_size = 2 ** 16
 
     ### INITIALIZER ###
 
@@ -24,34 +65,213 @@ class SoundFile(SupriyaObject):
             self._frame_count = reader.frames
             self._channel_count = reader.channels
             self._sample_rate = reader.samplerate
+        self._overview = None
+        self._sample_layout = self._get_sample_layout()
+        self._samples = None
+
+    ### SPECIAL METHODS ###
+
+    def __getitem__(self, item):
+        """
+        Gets frames by index or slice, and optionally channels, as a NumPy
+        array of 32-bit floats.
+        """
+        channels = slice(None)
+        if isinstance(item, tuple):
+            item, channels = item
+        if isinstance(item, slice):
+            start, stop, step = item.indices(self.frame_count)
+            if step < 0:
+                step = -step
+                start, stop = start - (start - stop - 1) // step * step, start + 1
+                return self._read(start, stop, step)[::-1, channels]
+            return self._read(start, stop, step)[:, channels]
+        index = int(item)
+        if index < 0:
+            index += self.frame_count
+        if not 0 <= index < self.frame_count:
+            raise IndexError(item)
+        return self._read(index, index + 1)[0, channels]
+
+    def __len__(self):
+        return self.frame_count
+
+    ### PRIVATE METHODS ###
+
+    def _get_aiff_sample_layout(self, file_pointer):
+        offset = width = kind = byte_order = data_size = None
+        for chunk_id, chunk_size in self._iterate_chunks(file_pointer, ">"):
+            if chunk_id == b"COMM":
+                data = file_pointer.read(chunk_size)
+                bits = struct.unpack(">h", data[6:8])[0]
+                width, kind, byte_order = (bits + 7) // 8, "i", ">"
+                compression = data[18:22] or b"NONE"
+                if compression == b"sowt":
+                    byte_order = "<"
+                elif compression in (b"fl32", b"FL32"):
+                    width, kind = 4, "f"
+                elif compression in (b"fl64", b"FL64"):
+                    width, kind = 8, "f"
+                elif compression not in (b"NONE", b"twos"):
+                    return None
+            elif chunk_id == b"SSND":
+                data_offset = struct.unpack(">I", file_pointer.read(4))[0]
+                offset = file_pointer.tell() + 4 + data_offset
+                data_size = chunk_size - 8 - data_offset
+        if offset is None or width is None:
+            return None
+        return offset, byte_order, width, kind, data_size
+
+    def _get_sample_layout(self):
+        """
+        Locates the interleaved sample data of uncompressed WAV and AIFF
+        files.
+
+        Returns a tuple of byte offset, byte order, sample width in bytes and
+        sample kind ("f", "i" or "u"), or none when the data can't be
+        memory-mapped.
+        """
+        with open(self.file_path, "rb") as file_pointer:
+            header = file_pointer.read(12)
+            if header[:4] == b"RIFF" and header[8:] == b"WAVE":
+                layout = self._get_wav_sample_layout(file_pointer)
+            elif header[:4] == b"FORM" and header[8:] in (b"AIFF", b"AIFC"):
+                layout = self._get_aiff_sample_layout(file_pointer)
+            else:
+                return None
+        if layout is None:
+            return None
+        offset, byte_order, width, kind, data_size = layout
+        if width not in ((4, 8) if kind == "f" else (1, 2, 3, 4)):
+            return None
+        if data_size < self.frame_count * self.channel_count * width:
+            return None
+        return offset, byte_order, width, kind
+
+    def _get_samples(self):
+        import numpy
+
+        if self._samples is None:
+            offset, byte_order, width, kind = self._sample_layout
+            if width == 3:
+                dtype, shape = numpy.uint8, (self.frame_count, self.channel_count, 3)
+            else:
+                dtype = numpy.dtype("{}{}{}".format(byte_order, kind, width))
+                shape = (self.frame_count, self.channel_count)
+            # Plain array views of the mapping slice far faster than memmaps.
+            self._samples = numpy.memmap(
+                self.file_path, dtype=dtype, mode="r", offset=offset, shape=shape
+            ).view(numpy.ndarray)
+        return self._samples
+
+    def _get_wav_sample_layout(self, file_pointer):
+        offset = width = kind = data_size = None
+        for chunk_id, chunk_size in self._iterate_chunks(file_pointer, "<"):
+            if chunk_id == b"fmt ":
+                data = file_pointer.read(chunk_size)
+                format_tag, channel_count = struct.unpack("<HH", data[:4])
+                block_align, bits = struct.unpack("<HH", data[12:16])
+                if format_tag == 0xFFFE and 26 <= len(data):
+                    format_tag = struct.unpack("<H", data[24:26])[0]
+                width = block_align // channel_count
+                if width != (bits + 7) // 8:
+                    return None
+                if format_tag == 1:
+                    kind = "u" if width == 1 else "i"
+                elif format_tag == 3:
+                    kind = "f"
+                else:
+                    return None
+            elif chunk_id == b"data":
+                offset, data_size = file_pointer.tell(), chunk_size
+        if offset is None or width is None:
+            return None
+        return offset, "<", width, kind, data_size
+
+    @staticmethod
+    def _iterate_chunks(file_pointer, byte_order):
+        while True:
+            chunk_header = file_pointer.read(8)
+            if len(chunk_header) < 8:
+                return
+            chunk_id, chunk_size = struct.unpack(byte_order + "4sI", chunk_header)
+            position = file_pointer.tell()
+            yield chunk_id, chunk_size
+            file_pointer.seek(position + chunk_size + chunk_size % 2)
+
+    def _read(self, start, stop, step=1):
+        import numpy
+
+        if stop <= start or not self.frame_count:
+            return numpy.zeros((0, self.channel_count), dtype=numpy.float32)
+        if self._sample_layout is None:
+            return self._read_blocks(start, stop, step)
+        _, byte_order, width, kind = self._sample_layout
+        samples = self._get_samples()[start:stop:step]
+        if kind == "f":
+            return samples.astype(numpy.float32)
+        if width == 3:
+            if byte_order == ">":
+                samples = samples[..., ::-1]
+            samples = (
+                samples[..., 0].astype(numpy.int32)
+                | (samples[..., 1].astype(numpy.int32) << 8)
+                | (samples[..., 2].astype(numpy.int8).astype(numpy.int32) << 16)
+            )
+        elif kind == "u":
+            samples = samples.astype(numpy.int16) - 0x80
+        scale = numpy.float32(1.0 / (1 << (8 * width - 1)))
+        return samples.astype(numpy.float32) * scale
+
+    def _read_blocks(self, start, stop, step=1):
+        import numpy
+
+        samples = numpy.zeros(
+            (len(range(start, stop, step)), self.channel_count), dtype=numpy.float32
+        )
+        index, position = 0, start
+        with wavefile.WaveReader(self.file_path) as reader:
+            reader.seek(start)
+            buffer_ = reader.buffer(min(self._read_block_size, stop - start))
+            while index < len(samples):
+                # Seek over any frames a strided read skips between blocks.
+                if position < start + index * step:
+                    position = start + index * step
+                    reader.seek(position)
+                frame_count = reader.read(buffer_[:, : stop - position])
+                if not frame_count:
+                    break
+                block = buffer_[:, :frame_count:step]
+                samples[index : index + block.shape[1]] = block.transpose()
+                index += block.shape[1]
+                position += frame_count
+        return samples[:index]
 
     ### PUBLIC METHODS ###
 
     def at_frame(self, frames):
         assert 0 <= frames <= self.frame_count
-        with wavefile.WaveReader(self.file_path) as reader:
-            reader.seek(frames)
-            iterator = reader.read_iter(size=1)
-            frame = next(iterator)
-            return frame.transpose().tolist()[0]
+        frames = min(int(frames), self.frame_count - 1)
+        return self[frames].tolist()
 
     def at_percent(self, percent):
         assert 0 <= percent <= 1
-        frames = int(self.frame_count * percent)
-        with wavefile.WaveReader(self.file_path) as reader:
-            reader.seek(frames)
-            iterator = reader.read_iter(size=1)
-            frame = next(iterator)
-            return frame.transpose().tolist()[0]
+        return self.at_frame(int(self.frame_count * percent))
 
     def at_second(self, second):
         assert 0 <= second <= self.seconds
-        frames = second * self.sample_rate
-        with wavefile.WaveReader(self.file_path) as reader:
-            reader.seek(frames)
-            iterator = reader.read_iter(size=1)
-            frame = next(iterator)
-            return frame.transpose().tolist()[0]
+        return self.at_frame(int(second * self.sample_rate))
+
+    def slice_seconds(self, start_second=0, stop_second=None):
+        """
+        Gets frames between `start_second` and `stop_second` as a NumPy
+        array.
+        """
+        start_frame = int(start_second * self.sample_rate)
+        stop_frame = None
+        if stop_second is not None:
+            stop_frame = int(stop_second * self.sample_rate)
+        return self[start_frame:stop_frame]
 
     ### PUBLIC PROPERTIES ###
 
@@ -71,6 +291,25 @@ class SoundFile(SupriyaObject):
     def frame_count(self):
         return self._frame_count
 
+    @property
+    def is_memory_mapped(self):
+        """
+        Is true when this soundfile's sample data is memory-mapped.
+        """
+        return self._sample_layout is not None
+
+    @property
+    def overview(self):
+        """
+        Gets this soundfile's multi-resolution overview, building it, or
+        loading it from its cache file, on first access.
+        """
+        import supriya.soundfiles
+
+        if self._overview is None:
+            self._overview = supriya.soundfiles.SoundFileOverview(self)
+        return self._overview
+
     @property
     def sample_rate(self):
         return self._sample_rate
@@ -0,0 +1,216 @@
+import os
+import tempfile
+
+from supriya.system.SupriyaObject import SupriyaObject
+
+
+class SoundFileOverview(SupriyaObject):
+    """
+    A multi-resolution min/max/RMS overview of a soundfile.
+
+    ::
+
+        >>> import supriya.soundfiles
+        >>> soundfile = supriya.soundfiles.SoundFile(
+        ...     supriya.system.Assets['audio/sine_440hz_44100sr_16bit_mono_1s.wav'],
+        ...     )
+        >>> overview = supriya.soundfiles.SoundFileOverview(soundfile, cache=False)
+        >>> minima, maxima, rms = overview.query(width=4)
+        >>> minima.shape
+        (4, 1)
+
+    ::
+
+        >>> maxima[:, 0]
+        array([0.9999695, 0.9999695, 0.9999695, 0.9999695], dtype=float32)
+
+    The overview is a pyramid of levels, each summarizing blocks of frames
+    four times larger than the level below it. Queries read from the
+    coarsest level whose blocks still fit inside one pixel, so their cost
+    depends on the width asked for rather than the number of frames
+    spanned. Pixel boundaries are snapped to that level's blocks; queries
+    narrower than the finest level's blocks read frames directly.
+
+    Overviews are cached on disk next to their soundfile, and rebuilt when
+    the soundfile changes.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_cache", "_levels", "_soundfile")
+
+    _base_block_size = 256
+
+    _level_factor = 4
+
+    _read_block_size = 2 ** 18
+
+    ### INITIALIZER ###
+
+    def __init__(self, soundfile, cache=True):
+        self._cache = bool(cache)
+        self._soundfile = soundfile
+        self._levels = None
+        if cache:
+            self._levels = self._read_cache()
+        if self._levels is None:
+            self._levels = self._build_levels()
+            if cache:
+                self._write_cache()
+
+    ### PRIVATE METHODS ###
+
+    def _build_levels(self):
+        import numpy
+
+        soundfile = self._soundfile
+        block_size = self._base_block_size
+        minima, maxima, squares = [], [], []
+        for start_frame in range(0, soundfile.frame_count, self._read_block_size):
+            stop_frame = start_frame + self._read_block_size
+            samples = soundfile[start_frame:stop_frame]
+            indices = numpy.arange(0, len(samples), block_size)
+            minima.append(numpy.minimum.reduceat(samples, indices))
+            maxima.append(numpy.maximum.reduceat(samples, indices))
+            squares.append(
+                numpy.add.reduceat(numpy.square(samples, dtype="f8"), indices)
+            )
+        if not minima:
+            return []
+        levels = [
+            (
+                numpy.concatenate(minima),
+                numpy.concatenate(maxima),
+                numpy.concatenate(squares),
+            )
+        ]
+        while 1 < len(levels[-1][0]):
+            indices = numpy.arange(0, len(levels[-1][0]), self._level_factor)
+            levels.append(
+                (
+                    numpy.minimum.reduceat(levels[-1][0], indices),
+                    numpy.maximum.reduceat(levels[-1][1], indices),
+                    numpy.add.reduceat(levels[-1][2], indices),
+                )
+            )
+        return levels
+
+    def _get_cache_key(self):
+        import numpy
+
+        stat = os.stat(self._soundfile.file_path)
+        return numpy.array(
+            [
+                stat.st_size,
+                stat.st_mtime_ns,
+                self._soundfile.frame_count,
+                self._soundfile.channel_count,
+                self._base_block_size,
+                self._level_factor,
+            ],
+            dtype=numpy.int64,
+        )
+
+    def _read_cache(self):
+        import numpy
+
+        try:
+            with numpy.load(self.cache_file_path) as arrays:
+                if not numpy.array_equal(arrays["key"], self._get_cache_key()):
+                    return None
+                return [
+                    (
+                        arrays["minima_{}".format(i)],
+                        arrays["maxima_{}".format(i)],
+                        arrays["squares_{}".format(i)],
+                    )
+                    for i in range(int(arrays["level_count"]))
+                ]
+        except (IOError, KeyError, ValueError):
+            return None
+
+    def _write_cache(self):
+        import numpy
+
+        arrays = dict(key=self._get_cache_key(), level_count=len(self._levels))
+        for i, (minima, maxima, squares) in enumerate(self._levels):
+            arrays["minima_{}".format(i)] = minima
+            arrays["maxima_{}".format(i)] = maxima
+            arrays["squares_{}".format(i)] = squares
+        directory_path, file_name = os.path.split(self.cache_file_path)
+        try:
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                dir=directory_path, prefix=".{}-".format(file_name)
+            )
+        except OSError:
+            return
+        try:
+            with os.fdopen(file_descriptor, "wb") as file_pointer:
+                numpy.savez(file_pointer, **arrays)
+            os.replace(temporary_path, self.cache_file_path)
+        except OSError:
+            os.remove(temporary_path)
+
+    ### PUBLIC METHODS ###
+
+    def query(self, width, start_frame=0, stop_frame=None):
+        """
+        Gets per-pixel minima, maxima and RMS of frames between
+        `start_frame` and `stop_frame`, divided into `width` pixels.
+
+        Returns three NumPy arrays of shape `(width, channels)`.
+        """
+        import numpy
+
+        frame_count = self._soundfile.frame_count
+        if stop_frame is None:
+            stop_frame = frame_count
+        width = int(width)
+        assert 0 < width
+        assert 0 <= start_frame < stop_frame <= frame_count
+        frames_per_pixel = (stop_frame - start_frame) / width
+        level_index, block_size = -1, 1
+        while (
+            level_index + 1 < len(self._levels)
+            and self._base_block_size * self._level_factor ** (level_index + 1)
+            <= frames_per_pixel
+        ):
+            level_index += 1
+            block_size = self._base_block_size * self._level_factor ** level_index
+        start_block = start_frame // block_size
+        stop_block = -(-stop_frame // block_size)
+        if level_index < 0:
+            samples = self._soundfile[start_frame:stop_frame]
+            minima = maxima = samples
+            squares = numpy.square(samples, dtype="f8")
+        else:
+            minima, maxima, squares = (
+                array[start_block:stop_block] for array in self._levels[level_index]
+            )
+        block_starts = numpy.arange(start_block, stop_block) * block_size
+        counts = numpy.minimum(block_size, frame_count - block_starts)
+        pixel_starts = start_frame + numpy.arange(width) * frames_per_pixel
+        indices = (pixel_starts // block_size).astype(numpy.int64) - start_block
+        rms = numpy.sqrt(
+            numpy.add.reduceat(squares, indices)
+            / numpy.add.reduceat(counts, indices)[:, None]
+        )
+        return (
+            numpy.minimum.reduceat(minima, indices),
+            numpy.maximum.reduceat(maxima, indices),
+            rms.astype(numpy.float32),
+        )
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def cache_file_path(self):
+        return self._soundfile.file_path + ".overview.npz"
+
+    @property
+    def level_count(self):
+        return len(self._levels)
+
+    @property
+    def soundfile(self):
+        return self._soundfile
@@ -7,5 +7,6 @@ from .SampleFormat import SampleFormat  # noqa
 from .Say import Say  # noqa
 from .Signal import Signal  # noqa
 from .SoundFile import SoundFile  # noqa
+from .SoundFileOverview import SoundFileOverview  # noqa
 from .play import play  # noqa
 from .render import render  # noqa
@@ -4,6 +4,7 @@ import hashlib
 import os
 import shutil
 import tempfile
+from typing import FrozenSet, NamedTuple, Optional, Tuple
 
 import yaml
 
@@ -61,6 +62,17 @@ class SynthDef(ServerObjectProxy):
 
     ### CLASS VARIABLES ###
 
+    class Metadata(NamedTuple):
+        actual_name: str
+        anonymous_name: str
+        audio_input_channel_count: Optional[int]
+        audio_output_channel_count: Optional[int]
+        control_input_channel_count: Optional[int]
+        control_output_channel_count: Optional[int]
+        done_actions: Tuple
+        has_gate: bool
+        parameter_names: FrozenSet[str]
+
     __documentation_section__ = "Main Classes"
 
     __slots__ = (
@@ -68,6 +80,7 @@ class SynthDef(ServerObjectProxy):
         "_constants",
         "_control_ugens",
         "_indexed_parameters",
+        "_metadata",
         "_name",
         "_ugens",
     )
@@ -81,7 +94,11 @@ class SynthDef(ServerObjectProxy):
         ServerObjectProxy.__init__(self)
         compiler = supriya.synthdefs.SynthDefCompiler
         self._name = name
-        ugens = list(copy.deepcopy(ugens))
+        if kwargs.get("decompiled"):
+            # Decompiled ugens belong to no other graph.
+            ugens = list(ugens)
+        else:
+            ugens = list(copy.deepcopy(ugens))
         assert all(isinstance(_, supriya.ugens.UGen) for _ in ugens)
         ugens = self._cleanup_pv_chains(ugens)
         ugens = self._cleanup_local_bufs(ugens)
@@ -95,6 +112,7 @@ class SynthDef(ServerObjectProxy):
             self._control_ugens, parameter_names=parameter_names
         )
         self._compiled_ugen_graph = compiler.compile_ugen_graph(self)
+        self._metadata = self._build_metadata()
 
     ### SPECIAL METHODS ###
 
@@ -421,7 +439,10 @@ class SynthDef(ServerObjectProxy):
             for i, output_proxy in enumerate(control._get_parameter_output_proxies()):
                 control_mapping[output_proxy] = control[i]
         control_ugens = tuple(control_ugens)
-        indexed_parameters.sort(key=lambda pair: parameters.index(pair[1]))
+        parameter_indices = {}
+        for i, parameter in enumerate(parameters):
+            parameter_indices.setdefault(parameter, i)
+        indexed_parameters.sort(key=lambda pair: parameter_indices[pair[1]])
         indexed_parameters = tuple(indexed_parameters)
         return control_ugens, control_mapping, indexed_parameters
 
@@ -447,6 +468,49 @@ class SynthDef(ServerObjectProxy):
                 input_mapping[source].append((ugen, i))
         return input_mapping
 
+    def _build_metadata(self):
+        import supriya
+
+        md5 = hashlib.md5()
+        md5.update(self._compiled_ugen_graph)
+        anonymous_name = md5.hexdigest()
+        parameter_names = frozenset(
+            parameter.name for _, parameter in self.indexed_parameters
+        )
+        done_actions = set()
+        for ugen in self.ugens:
+            # Done actions driven by controls or other ugens can't be known
+            # ahead of time, and are left out.
+            try:
+                done_action = ugen._get_done_action()
+            except TypeError:
+                continue
+            if done_action is not None:
+                done_actions.add(done_action)
+        input_ugens = [_ for _ in self.ugens if _.is_input_ugen]
+        output_ugens = [_ for _ in self.ugens if _.is_output_ugen]
+        audio_rate = supriya.CalculationRate.AUDIO
+        control_rate = supriya.CalculationRate.CONTROL
+        return self.Metadata(
+            actual_name=self.name or anonymous_name,
+            anonymous_name=anonymous_name,
+            audio_input_channel_count=self._get_channel_count(
+                input_ugens, audio_rate, is_output=False
+            ),
+            audio_output_channel_count=self._get_channel_count(
+                output_ugens, audio_rate, is_output=True
+            ),
+            control_input_channel_count=self._get_channel_count(
+                input_ugens, control_rate, is_output=False
+            ),
+            control_output_channel_count=self._get_channel_count(
+                output_ugens, control_rate, is_output=True
+            ),
+            done_actions=tuple(sorted(done_actions)),
+            has_gate="gate" in parameter_names,
+            parameter_names=parameter_names,
+        )
+
     @staticmethod
     def _cleanup_local_bufs(ugens):
         import supriya.ugens
@@ -474,6 +538,9 @@ class SynthDef(ServerObjectProxy):
         import supriya.ugens
 
         input_mapping = SynthDef._build_input_mapping(ugens)
+        # Collect insertions first, then splice them in with a single pass,
+        # rather than searching and resizing the ugen list per insertion.
+        insertions = {}
         for antecedent, descendants in input_mapping.items():
             if len(descendants) == 1:
                 continue
@@ -484,23 +551,27 @@ class SynthDef(ServerObjectProxy):
                 inputs = list(descendant._inputs)
                 inputs[input_index] = pv_copy[0]
                 descendant._inputs = tuple(inputs)
-                index = ugens.index(descendant)
-                replacement = []
+                replacement = insertions.setdefault(descendant, [])
                 if isinstance(fft_size, supriya.synthdefs.UGenMethodMixin):
                     replacement.append(fft_size)
                 replacement.extend([new_buffer, pv_copy])
-                ugens[index:index] = replacement
-        return ugens
+        if not insertions:
+            return ugens
+        processed_ugens = []
+        for ugen in ugens:
+            processed_ugens.extend(insertions.get(ugen, ()))
+            processed_ugens.append(ugen)
+        return processed_ugens
 
     @staticmethod
     def _collect_constants(ugens):
-        constants = []
+        constants = {}
         for ugen in ugens:
             for input_ in ugen._inputs:
                 if not isinstance(input_, float):
                     continue
                 if input_ not in constants:
-                    constants.append(input_)
+                    constants[input_] = None
         return tuple(constants)
 
     @staticmethod
@@ -538,6 +609,19 @@ class SynthDef(ServerObjectProxy):
         parameters = tuple(sorted(parameters, key=lambda x: x.name))
         return ugens, parameters
 
+    @staticmethod
+    def _get_channel_count(ugens, calculation_rate, is_output):
+        # Ambiguous channel counts, across several input or output ugens of
+        # one rate, are recorded as none.
+        ugens = [_ for _ in ugens if _.calculation_rate == calculation_rate]
+        if len(ugens) == 1:
+            if is_output:
+                return len(ugens[0].source)
+            return ugens[0].channel_count
+        elif not ugens:
+            return 0
+        return None
+
     def _handle_response(self, response):
         import supriya.commands
 
@@ -561,11 +645,7 @@ class SynthDef(ServerObjectProxy):
             if isinstance(ugen, supriya.ugens.WidthFirstUGen):
                 width_first_antecedents.append(ugen)
         for ugen in ugens:
-            sort_bundle = sort_bundles[ugen]
-            sort_bundle._initialize_topological_sort(sort_bundles)
-            sort_bundle.descendants[:] = sorted(
-                sort_bundles[ugen].descendants, key=lambda x: ugens.index(ugen)
-            )
+            sort_bundles[ugen]._initialize_topological_sort(sort_bundles)
         return sort_bundles
 
     @staticmethod
@@ -623,7 +703,7 @@ class SynthDef(ServerObjectProxy):
         import supriya.commands
 
         synthdef_name = self.actual_name
-        del (self.server._synthdefs[synthdef_name])
+        del self.server._synthdefs[synthdef_name]
         request = supriya.commands.SynthDefFreeRequest(synthdef=self)
         if self.server.is_running:
             request.communicate(server=self.server)
@@ -751,14 +831,11 @@ class SynthDef(ServerObjectProxy):
 
     @property
     def actual_name(self):
-        return self.name or self.anonymous_name
+        return self._metadata.actual_name
 
     @property
     def anonymous_name(self):
-        md5 = hashlib.md5()
-        md5.update(self._compiled_ugen_graph)
-        anonymous_name = md5.hexdigest()
-        return anonymous_name
+        return self._metadata.anonymous_name
 
     @property
     def audio_channel_count(self):
@@ -793,18 +870,10 @@ class SynthDef(ServerObjectProxy):
 
         Returns integer.
         """
-        import supriya.synthdefs
-
-        ugens = tuple(
-            _
-            for _ in self.input_ugens
-            if _.calculation_rate == supriya.CalculationRate.AUDIO
-        )
-        if len(ugens) == 1:
-            return ugens[0].channel_count
-        elif not ugens:
-            return 0
-        raise ValueError
+        channel_count = self._metadata.audio_input_channel_count
+        if channel_count is None:
+            raise ValueError
+        return channel_count
 
     @property
     def audio_output_channel_count(self):
@@ -835,18 +904,10 @@ class SynthDef(ServerObjectProxy):
 
         Returns integer.
         """
-        import supriya.synthdefs
-
-        ugens = tuple(
-            _
-            for _ in self.output_ugens
-            if _.calculation_rate == supriya.CalculationRate.AUDIO
-        )
-        if len(ugens) == 1:
-            return len(ugens[0].source)
-        elif not ugens:
-            return 0
-        raise ValueError
+        channel_count = self._metadata.audio_output_channel_count
+        if channel_count is None:
+            raise ValueError
+        return channel_count
 
     @property
     def constants(self):
@@ -889,18 +950,10 @@ class SynthDef(ServerObjectProxy):
 
         Returns integer.
         """
-        import supriya.synthdefs
-
-        ugens = tuple(
-            _
-            for _ in self.input_ugens
-            if _.calculation_rate == supriya.CalculationRate.CONTROL
-        )
-        if len(ugens) == 1:
-            return ugens[0].channel_count
-        elif not ugens:
-            return 0
-        raise ValueError
+        channel_count = self._metadata.control_input_channel_count
+        if channel_count is None:
+            raise ValueError
+        return channel_count
 
     @property
     def control_output_channel_count(self):
@@ -931,31 +984,18 @@ class SynthDef(ServerObjectProxy):
 
         Returns integer.
         """
-        import supriya.synthdefs
-
-        ugens = tuple(
-            _
-            for _ in self.output_ugens
-            if _.calculation_rate == supriya.CalculationRate.CONTROL
-        )
-        if len(ugens) == 1:
-            return len(ugens[0].source)
-        elif not ugens:
-            return 0
-        raise ValueError
+        channel_count = self._metadata.control_output_channel_count
+        if channel_count is None:
+            raise ValueError
+        return channel_count
 
     @property
     def done_actions(self):
-        done_actions = set()
-        for ugen in self.ugens:
-            done_action = ugen._get_done_action()
-            if done_action is not None:
-                done_actions.add(done_action)
-        return sorted(done_actions)
+        return list(self._metadata.done_actions)
 
     @property
     def has_gate(self):
-        return "gate" in self.parameter_names
+        return self._metadata.has_gate
 
     @property
     def indexed_parameters(self):
@@ -971,6 +1011,41 @@ class SynthDef(ServerObjectProxy):
             return self in self.server
         return False
 
+    @property
+    def metadata(self):
+        """
+        Gets precomputed, immutable metadata about synthdef.
+
+        ::
+
+            >>> with SynthDefBuilder(frequency=440, gate=1) as builder:
+            ...     envelope = supriya.ugens.EnvGen.kr(
+            ...         done_action=2,
+            ...         envelope=supriya.synthdefs.Envelope.asr(),
+            ...         gate=builder['gate'],
+            ...         )
+            ...     source = supriya.ugens.SinOsc.ar(frequency=builder['frequency'])
+            ...     out = supriya.ugens.Out.ar(source=[source * envelope] * 2)
+            ...
+            >>> metadata = builder.build().metadata
+            >>> metadata.has_gate
+            True
+
+        ::
+
+            >>> sorted(metadata.parameter_names)
+            ['frequency', 'gate']
+
+        ::
+
+            >>> metadata.audio_output_channel_count, metadata.done_actions
+            (2, (DoneAction.FREE_SYNTH,))
+
+        Lookups on metadata do not rescan or recompile the synthdef's ugen
+        graph.
+        """
+        return self._metadata
+
     @property
     def name(self):
         return self._name
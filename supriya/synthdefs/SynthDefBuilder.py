@@ -61,7 +61,7 @@ class SynthDefBuilder(SupriyaObject):
         self._name = name
         self._uuid = uuid.uuid4()
         self._parameters = collections.OrderedDict()
-        self._ugens = []
+        self._ugens = collections.OrderedDict()
         for key, value in kwargs.items():
             self._add_parameter(key, value)
 
@@ -96,7 +96,7 @@ class SynthDefBuilder(SupriyaObject):
                 ugen = ugen.source
             assert ugen._uuid == self._uuid
             if ugen not in self._ugens:
-                self._ugens.append(ugen)
+                self._ugens[ugen] = None
 
     def _add_parameter(self, *args):
         import supriya.synthdefs
@@ -138,10 +138,25 @@ class SynthDefBuilder(SupriyaObject):
 
     ### PUBLIC METHODS ###
 
-    def build(self, name=None, optimize=True):
+    def build(self, name=None, optimize=True, cache=None):
+        """
+        Builds a SynthDef from the builder's ugen graph.
+
+        Uses the default ``SynthDefCache``, if configured, unless `cache` is
+        given. Pass false as `cache` to always build from scratch.
+        """
         import supriya.synthdefs
 
         name = self.name or name
+        if cache is None:
+            cache = supriya.synthdefs.SynthDefCache.get_default()
+        key = None
+        if cache:
+            key = cache.hash_builder(self, name=name, optimize=optimize)
+        if key is not None:
+            synthdef = cache.get(key)
+            if synthdef is not None:
+                return synthdef
         with self:
             ugens = list(self._parameters.values()) + list(self._ugens)
             ugens = copy.deepcopy(ugens)
@@ -154,6 +169,8 @@ class SynthDefBuilder(SupriyaObject):
             supriya.synthdefs.SynthDef._remap_controls(ugens, control_mapping)
             ugens = control_ugens + ugens
             synthdef = supriya.synthdefs.SynthDef(ugens, name=name, optimize=optimize)
+        if key is not None:
+            cache.set(key, synthdef)
         return synthdef
 
     def poll_ugen(self, ugen, label=None, trigger=None, trigger_id=-1):
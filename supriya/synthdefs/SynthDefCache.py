@@ -0,0 +1,200 @@
+import enum
+import hashlib
+import os
+import pathlib
+import uuid
+
+import supriya
+from supriya.system.SupriyaObject import SupriyaObject
+
+
+class SynthDefCache(SupriyaObject):
+    """
+    A persistent, on-disk cache of built SynthDefs.
+
+    Entries are keyed by a structural hash of a ``SynthDefBuilder``'s ugen
+    graph, so rebuilding an identical graph, in any process, skips
+    optimization, topological sorting and compilation.
+
+    Each entry is stored as a compiled ``.scsyndef`` file, loadable by
+    scsynth, and decompiled on lookup. Nothing executable is ever loaded from
+    the cache directory.
+
+    ::
+
+        >>> def build(synthdef_cache):
+        ...     with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        ...         supriya.ugens.Out.ar(
+        ...             bus=0, source=supriya.ugens.SinOsc.ar(builder["frequency"])
+        ...         )
+        ...     return builder.build(cache=synthdef_cache)
+        ...
+
+    ::
+
+        >>> import tempfile
+        >>> with tempfile.TemporaryDirectory() as temp_directory:
+        ...     synthdef_cache = supriya.synthdefs.SynthDefCache(temp_directory)
+        ...     synthdef_one = build(synthdef_cache)
+        ...     synthdef_two = build(synthdef_cache)
+        ...
+        >>> synthdef_one == synthdef_two
+        True
+
+    ::
+
+        >>> synthdef_cache.hit_count, synthdef_cache.miss_count
+        (1, 1)
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "SynthDef Internals"
+
+    __slots__ = ("_hit_count", "_miss_count", "_root_path")
+
+    _default = None
+
+    # Bump when the build pipeline changes in ways that alter built graphs.
+    _format_version = 2
+
+    ### INITIALIZER ###
+
+    def __init__(self, root_path=None):
+        if root_path is None:
+            root_path = pathlib.Path(supriya.output_path) / "synthdefs"
+        self._root_path = pathlib.Path(root_path).expanduser().absolute()
+        self._root_path.mkdir(parents=True, exist_ok=True)
+        self._hit_count = 0
+        self._miss_count = 0
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _tokenize(value, indices):
+        import supriya.synthdefs
+
+        if isinstance(value, (float, int, str, type(None))):
+            return value
+        elif isinstance(value, supriya.synthdefs.OutputProxy):
+            return ("output", indices[id(value.source)], value.output_index)
+        elif isinstance(value, supriya.synthdefs.UGenMethodMixin):
+            return ("ugen", indices[id(value)])
+        elif isinstance(value, (list, tuple)):
+            return tuple(SynthDefCache._tokenize(x, indices) for x in value)
+        elif isinstance(value, enum.Enum):
+            return (type(value).__name__, value.name)
+        raise TypeError(value)
+
+    def _write_atomically(self, file_path, contents):
+        temporary_path = file_path.with_name(
+            ".{}.{}".format(file_path.name, uuid.uuid4().hex)
+        )
+        try:
+            with open(str(temporary_path), "wb") as file_pointer:
+                file_pointer.write(contents)
+            os.replace(str(temporary_path), str(file_path))
+        finally:
+            if temporary_path.exists():
+                temporary_path.unlink()
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        """
+        Removes every entry from the SynthDef cache.
+        """
+        for file_path in self.root_path.iterdir():
+            if file_path.suffix == ".scsyndef":
+                file_path.unlink()
+
+    def get(self, key):
+        """
+        Gets the SynthDef cached under `key`, or none.
+        """
+        import supriya.synthdefs
+
+        file_path = self.root_path / "{}.scsyndef".format(key)
+        try:
+            synthdef = supriya.synthdefs.SynthDefDecompiler.decompile_synthdef(
+                file_path.read_bytes()
+            )
+        except Exception:
+            self._miss_count += 1
+            return None
+        self._hit_count += 1
+        return synthdef
+
+    @classmethod
+    def get_default(cls):
+        """
+        Gets the default SynthDef cache.
+
+        The default cache is configured by the ``synthdef_cache`` setting in
+        the ``core`` section of Supriya's config file, and is none if unset.
+        """
+        if cls._default is None:
+            root_path = supriya.config.get("core", "synthdef_cache", fallback=None)
+            cls._default = cls(root_path) if root_path else False
+        return cls._default or None
+
+    @classmethod
+    def hash_builder(cls, builder, name=None, optimize=True):
+        """
+        Hashes `builder`'s ugen graph, along with the `name` and `optimize`
+        flag it will be built with.
+
+        Returns none if the graph references anything outside the builder,
+        or holds values that can't be hashed faithfully.
+        """
+        md5 = hashlib.md5()
+        md5.update(
+            repr(
+                (cls._format_version, supriya.__version__, name, bool(optimize))
+            ).encode()
+        )
+        nodes = list(builder._parameters.values()) + list(builder._ugens)
+        indices = {id(node): i for i, node in enumerate(nodes)}
+        try:
+            for node in nodes:
+                state = {}
+                for class_ in type(node).__mro__:
+                    for slot in getattr(class_, "__slots__", ()):
+                        if slot != "_uuid" and hasattr(node, slot):
+                            state[slot] = getattr(node, slot)
+                state.update(getattr(node, "__dict__", {}))
+                token = (
+                    type(node).__module__,
+                    type(node).__name__,
+                    tuple(
+                        (key, cls._tokenize(value, indices))
+                        for key, value in sorted(state.items())
+                    ),
+                )
+                md5.update(repr(token).encode())
+        except (KeyError, TypeError):
+            return None
+        return md5.hexdigest()
+
+    def set(self, key, synthdef):
+        """
+        Caches `synthdef` under `key`.
+        """
+        self._write_atomically(
+            self.root_path / "{}.scsyndef".format(key), synthdef.compile()
+        )
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def hit_count(self):
+        return self._hit_count
+
+    @property
+    def miss_count(self):
+        return self._miss_count
+
+    @property
+    def root_path(self):
+        return self._root_path
@@ -70,7 +70,7 @@ class SynthDefCompiler(SupriyaObject):
         return result
 
     @staticmethod
-    def compile_ugen(ugen, synthdef):
+    def compile_ugen(ugen, synthdef, indices=None):
         outputs = ugen._get_outputs()
         result = []
         result.append(SynthDefCompiler.encode_string(type(ugen).__name__))
@@ -80,8 +80,11 @@ class SynthDefCompiler(SupriyaObject):
         result.append(
             SynthDefCompiler.encode_unsigned_int_16bit(int(ugen.special_index))
         )
+        indices = indices or SynthDefCompiler.index_synthdef(synthdef)
         for input_ in ugen.inputs:
-            result.append(SynthDefCompiler.compile_ugen_input_spec(input_, synthdef))
+            result.append(
+                SynthDefCompiler.compile_ugen_input_spec(input_, synthdef, indices)
+            )
         for output in outputs:
             result.append(SynthDefCompiler.encode_unsigned_int_8bit(output))
         result = bytes().join(result)
@@ -97,25 +100,29 @@ class SynthDefCompiler(SupriyaObject):
             result.append(SynthDefCompiler.encode_float(constant))
         result.append(SynthDefCompiler.compile_parameters(synthdef))
         result.append(SynthDefCompiler.encode_unsigned_int_32bit(len(synthdef.ugens)))
+        indices = SynthDefCompiler.index_synthdef(synthdef)
         for ugen_index, ugen in enumerate(synthdef.ugens):
-            result.append(SynthDefCompiler.compile_ugen(ugen, synthdef))
+            result.append(SynthDefCompiler.compile_ugen(ugen, synthdef, indices))
         result.append(SynthDefCompiler.encode_unsigned_int_16bit(0))
         result = bytes().join(result)
         return result
 
     @staticmethod
-    def compile_ugen_input_spec(input_, synthdef):
+    def compile_ugen_input_spec(input_, synthdef, indices=None):
         import supriya.synthdefs
 
+        constant_indices, ugen_indices = indices or SynthDefCompiler.index_synthdef(
+            synthdef
+        )
         result = []
         if isinstance(input_, float):
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(0xFFFFFFFF))
-            constant_index = synthdef._constants.index(input_)
+            constant_index = constant_indices[input_]
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(constant_index))
         elif isinstance(input_, supriya.synthdefs.OutputProxy):
             ugen = input_.source
             output_index = input_.output_index
-            ugen_index = synthdef._ugens.index(ugen)
+            ugen_index = ugen_indices[ugen]
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(ugen_index))
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(output_index))
         else:
@@ -143,3 +150,20 @@ class SynthDefCompiler(SupriyaObject):
     @staticmethod
     def encode_unsigned_int_32bit(value):
         return bytes(struct.pack(">I", int(value)))
+
+    @staticmethod
+    def index_synthdef(synthdef):
+        """
+        Maps `synthdef`'s constants and ugens to their indices.
+
+        Input specs are compiled against these maps, rather than by searching
+        the synthdef's constants and ugens, keeping compilation linear in the
+        size of the ugen graph.
+        """
+        constant_indices = {}
+        for i, constant in enumerate(synthdef._constants):
+            constant_indices.setdefault(constant, i)
+        ugen_indices = {}
+        for i, ugen in enumerate(synthdef._ugens):
+            ugen_indices.setdefault(ugen, i)
+        return constant_indices, ugen_indices
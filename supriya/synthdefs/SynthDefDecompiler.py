@@ -1,4 +1,5 @@
 import collections
+import math
 import struct
 import sys
 
@@ -222,7 +223,9 @@ class SynthDefDecompiler(SupriyaObject):
                     )
             ugens.append(ugen)
         variants_count, index = sdd._decode_int_16bit(value, index)
-        synthdef = supriya.synthdefs.SynthDef(ugens=ugens, name=name, decompiled=True)
+        synthdef = supriya.synthdefs.SynthDef(
+            ugens=ugens, name=name, optimize=False, decompiled=True
+        )
         if synthdef.name == synthdef.anonymous_name:
             synthdef._name = None
         return synthdef, index
@@ -238,7 +241,16 @@ class SynthDefDecompiler(SupriyaObject):
 
     @staticmethod
     def _decode_float(value, index):
-        result = struct.unpack(">f", value[index : index + 4])[0]
+        packed = value[index : index + 4]
+        result = struct.unpack(">f", packed)[0]
+        if math.isfinite(result):
+            # Prefer the shortest decimal encoding to the same 32-bit float,
+            # e.g. 0.01 rather than 0.009999999776482582.
+            for precision in range(1, 10):
+                candidate = float("{:.{}g}".format(result, precision))
+                if struct.pack(">f", candidate) == packed:
+                    result = candidate
+                    break
         index += 4
         return result, index
 
@@ -23,27 +23,27 @@ class UGenSortBundle(SupriyaObject):
         import supriya.synthdefs
         import supriya.ugens
 
+        antecedents = set(self.antecedents)
         for input_ in self.ugen.inputs:
             if isinstance(input_, supriya.synthdefs.OutputProxy):
                 input_ = input_.source
             elif not isinstance(input_, supriya.ugens.UGen):
                 continue
-            input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
+            if input_ not in antecedents:
+                antecedents.add(input_)
                 self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
+                sort_bundles[input_].descendants.append(self.ugen)
         for input_ in self.width_first_antecedents:
-            input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
+            if input_ not in antecedents:
+                antecedents.add(input_)
                 self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
+                sort_bundles[input_].descendants.append(self.ugen)
 
     def _make_available(self, available_ugens):
+        # A ugen's antecedents empty exactly once, so it can't already be
+        # available here.
         if not self.antecedents:
-            if self.ugen not in available_ugens:
-                available_ugens.append(self.ugen)
+            available_ugens.append(self.ugen)
 
     def _schedule(self, available_ugens, out_stack, sort_bundles):
         for ugen in reversed(self.descendants):
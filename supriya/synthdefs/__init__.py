@@ -13,6 +13,7 @@ from .SignalRange import SignalRange  # noqa
 from .SuperColliderSynthDef import SuperColliderSynthDef  # noqa
 from .SynthDef import SynthDef  # noqa
 from .SynthDefBuilder import SynthDefBuilder  # noqa
+from .SynthDefCache import SynthDefCache  # noqa
 from .SynthDefCompiler import SynthDefCompiler  # noqa
 from .SynthDefDecompiler import SynthDefDecompiler  # noqa
 from .SynthDefFactory import SynthDefFactory  # noqa
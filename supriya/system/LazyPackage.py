@@ -0,0 +1,74 @@
+import importlib
+import pathlib
+import sys
+import types
+
+
+class LazyPackage(types.ModuleType):
+    """
+    A package which imports its members on first access.
+
+    Installed on a package's module object in place of eager
+    ``from .Foo import Foo`` imports when Supriya's ``lazy_imports`` option
+    is set, either via the ``SUPRIYA_LAZY_IMPORTS`` environment variable or
+    the ``lazy_imports`` setting in the ``core`` section of Supriya's config
+    file.
+    """
+
+    ### SPECIAL METHODS ###
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._lazy_names))
+
+    def __getattr__(self, name):
+        lazy_names = self.__dict__.get("_lazy_names", {})
+        if name not in lazy_names:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(self.__name__, name)
+            )
+        module = importlib.import_module(
+            "{}.{}".format(self.__name__, lazy_names[name])
+        )
+        value = getattr(module, name)
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name, value):
+        # Importing a submodule binds it onto its package. Bind the
+        # submodule's nominative object instead, as an eager import would.
+        if (
+            isinstance(value, types.ModuleType)
+            and self.__dict__.get("_lazy_names", {}).get(name) == name
+            and hasattr(value, name)
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+    ### PUBLIC METHODS ###
+
+    @classmethod
+    def install(cls, package_name, lazy_names=None):
+        """
+        Makes the package named `package_name` lazy, if lazy imports are
+        enabled.
+
+        `lazy_names` maps member names to the names of the submodules defining
+        them, and defaults to the nominative objects of every submodule in
+        the package's directory.
+
+        Returns true if the package was made lazy.
+        """
+        import supriya
+
+        if not supriya.lazy_imports:
+            return False
+        module = sys.modules[package_name]
+        if lazy_names is None:
+            lazy_names = {
+                path.stem: path.stem
+                for path in pathlib.Path(module.__path__[0]).iterdir()
+                if path.suffix in (".py", ".pyx") and path.stem != "__init__"
+            }
+        module._lazy_names = dict(lazy_names)
+        module.__class__ = cls
+        return True
@@ -1,6 +1,6 @@
 import functools
 import threading
-from typing import Callable, Dict, Set
+from typing import Callable, Dict, FrozenSet, Set
 
 from supriya.system.SupriyaObject import SupriyaObject
 
@@ -13,7 +13,7 @@ class PubSub(SupriyaObject):
 
     _lock = threading.Lock()
     _subscribers: Dict[Callable, Set[str]] = {}
-    _topics: Dict[str, Set[Callable]] = {}
+    _topics: Dict[str, FrozenSet[Callable]] = {}
 
     ### PRIVATE METHODS ###
 
@@ -21,10 +21,10 @@ class PubSub(SupriyaObject):
     def _unsubscribe(cls, subscriber, topic):
         if topic not in cls._topics:
             return
-        subscribers = cls._topics[topic]
-        if subscriber in subscribers:
-            subscribers.remove(subscriber)
-        if not subscribers:
+        subscribers = cls._topics[topic] - {subscriber}
+        if subscribers:
+            cls._topics[topic] = subscribers
+        else:
             del (cls._topics[topic])
         topics = cls._subscribers[subscriber]
         if topic in topics:
@@ -42,16 +42,16 @@ class PubSub(SupriyaObject):
 
     @classmethod
     def notify(cls, topic, event=None):
-        with cls._lock:
-            subscribers = cls._topics.get(topic, set()).copy()
-        for subscriber in subscribers:
+        # Subscriber sets are replaced rather than mutated, so they can be
+        # read without locking or copying.
+        for subscriber in cls._topics.get(topic, ()):
             subscriber.notify(topic, event)
 
     @classmethod
     def subscribe(cls, subscriber, topic):
         with cls._lock:
             cls._subscribers.setdefault(subscriber, set()).add(topic)
-            cls._topics.setdefault(topic, set()).add(subscriber)
+            cls._topics[topic] = cls._topics.get(topic, frozenset()) | {subscriber}
 
     @classmethod
     def unsubscribe(cls, subscriber, topic):
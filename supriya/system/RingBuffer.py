@@ -0,0 +1,160 @@
+import threading
+
+from supriya.system.SupriyaObject import SupriyaObject
+
+
+class RingBuffer(SupriyaObject):
+    """
+    A fixed-size history of rows of floats, backed by a NumPy array.
+
+    ::
+
+        >>> import supriya.system
+        >>> ring_buffer = supriya.system.RingBuffer(capacity=4, width=2)
+        >>> for i in range(6):
+        ...     ring_buffer.append((i, -i))
+        ...
+        >>> ring_buffer.latest()
+        array([[ 2., -2.],
+               [ 3., -3.],
+               [ 4., -4.],
+               [ 5., -5.]])
+
+    ::
+
+        >>> ring_buffer.latest(2)
+        array([[ 4., -4.],
+               [ 5., -5.]])
+
+    Decimating ring buffers store one row for every `decimation` rows
+    appended: the last of them, or with `peak_hold` their per-column maxima.
+
+    ::
+
+        >>> ring_buffer = supriya.system.RingBuffer(
+        ...     capacity=4, decimation=3, peak_hold=True,
+        ...     )
+        >>> for value in (1, 5, 2, 0, 0, 3, 4):
+        ...     ring_buffer.append((value,))
+        ...
+        >>> ring_buffer.latest()
+        array([[5.],
+               [3.]])
+
+    Appending and reading are thread-safe, and reads copy the latest rows
+    out in one call, so readers can poll history at their own pace.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Server Internals"
+
+    __slots__ = (
+        "_append_count",
+        "_capacity",
+        "_decimation",
+        "_lock",
+        "_peak_hold",
+        "_pending",
+        "_rows",
+        "_width",
+        "_write_count",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, capacity=1024, width=1, decimation=1, peak_hold=False):
+        import numpy
+
+        capacity = int(capacity)
+        width = int(width)
+        decimation = int(decimation)
+        assert 0 < capacity
+        assert 0 < width
+        assert 0 < decimation
+        self._capacity = capacity
+        self._width = width
+        self._decimation = decimation
+        self._peak_hold = bool(peak_hold)
+        self._lock = threading.Lock()
+        self._rows = numpy.zeros((capacity, width), dtype=numpy.float64)
+        self._pending = numpy.zeros(width, dtype=numpy.float64)
+        self._append_count = 0
+        self._write_count = 0
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self):
+        return min(self._write_count, self._capacity)
+
+    ### PUBLIC METHODS ###
+
+    def append(self, values):
+        """
+        Appends a row of `width` values.
+        """
+        import numpy
+
+        with self._lock:
+            self._append_count += 1
+            if self._peak_hold and 1 < self._decimation:
+                if self._append_count == 1:
+                    self._pending[:] = values
+                else:
+                    numpy.maximum(self._pending, values, out=self._pending)
+                values = self._pending
+            if self._append_count < self._decimation:
+                return
+            self._append_count = 0
+            self._rows[self._write_count % self._capacity] = values
+            self._write_count += 1
+
+    def clear(self):
+        with self._lock:
+            self._append_count = 0
+            self._write_count = 0
+
+    def latest(self, count=None):
+        """
+        Gets up to `count` of the most recently stored rows, oldest first,
+        as a NumPy array of shape `(count, width)`.
+
+        Gets every stored row when `count` is none.
+        """
+        import numpy
+
+        with self._lock:
+            size = min(self._write_count, self._capacity)
+            if count is not None:
+                size = min(max(int(count), 0), size)
+            stop = self._write_count % self._capacity
+            start = stop - size
+            if 0 <= start:
+                return self._rows[start:stop].copy()
+            return numpy.concatenate((self._rows[start:], self._rows[:stop]))
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def decimation(self):
+        return self._decimation
+
+    @property
+    def peak_hold(self):
+        return self._peak_hold
+
+    @property
+    def width(self):
+        return self._width
+
+    @property
+    def write_count(self):
+        """
+        Gets the number of rows stored since creation or clearing, including
+        those since overwritten.
+        """
+        return self._write_count
@@ -1,6 +1,6 @@
-import uqbar.objects
-
 from supriya.system.SupriyaObject import SupriyaObject
+from supriya.utils.get_vars import get_vars
+from supriya.utils.new import new
 
 
 class SupriyaValueObject(SupriyaObject):
@@ -12,18 +12,22 @@ class SupriyaValueObject(SupriyaObject):
     ### SPECIAL METHODS ###
 
     def __copy__(self, *args):
-        return uqbar.objects.new(self)
+        return new(self)
 
     def __eq__(self, expr):
-        self_values = type(self), uqbar.objects.get_vars(self)
+        if expr is self:
+            return True
+        if type(expr) is not type(self):
+            return False
+        self_values = get_vars(self)
         try:
-            expr_values = type(expr), uqbar.objects.get_vars(expr)
+            expr_values = get_vars(expr)
         except AttributeError:
-            expr_values = type(expr), expr
+            return False
         return self_values == expr_values
 
     def __hash__(self):
-        args, var_args, kwargs = uqbar.objects.get_vars(self)
+        args, var_args, kwargs = get_vars(self)
         hash_values = [type(self)]
         hash_values.append(tuple(args.items()))
         hash_values.append(tuple(var_args))
@@ -6,7 +6,9 @@ from .Bindable import Bindable  # noqa
 from .BindableFloat import BindableFloat  # noqa
 from .BindableNamespace import BindableNamespace  # noqa
 from .Binding import Binding  # noqa
+from .LazyPackage import LazyPackage  # noqa
 from .PubSub import PubSub  # noqa
+from .RingBuffer import RingBuffer  # noqa
 from .SupriyaObject import SupriyaObject  # noqa
 from .SupriyaValueObject import SupriyaValueObject  # noqa
 from .YAMLLoader import YAMLLoader  # noqa
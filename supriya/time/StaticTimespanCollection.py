@@ -0,0 +1,80 @@
+from supriya.time.StaticTimespanCollectionDriver import StaticTimespanCollectionDriver
+from supriya.time.TimespanCollection import TimespanCollection
+
+
+class StaticTimespanCollection(TimespanCollection):
+    """
+    A read-only sorted collection of timespans, backed by NumPy arrays.
+
+    ::
+
+        >>> import abjad.timespans
+        >>> import supriya.time
+        >>> timespans = (
+        ...     abjad.timespans.Timespan(0, 3),
+        ...     abjad.timespans.Timespan(1, 3),
+        ...     abjad.timespans.Timespan(1, 2),
+        ...     abjad.timespans.Timespan(2, 5),
+        ...     abjad.timespans.Timespan(6, 9),
+        ...     )
+        >>> timespan_collection = supriya.time.StaticTimespanCollection(timespans)
+
+    ::
+
+        >>> timespan_collection.find_intersection(1.5)
+        [Timespan(start_offset=Offset(0, 1), stop_offset=Offset(3, 1)), Timespan(start_offset=Offset(1, 1), stop_offset=Offset(2, 1)), Timespan(start_offset=Offset(1, 1), stop_offset=Offset(3, 1))]
+
+    ::
+
+        >>> timespan_collection.insert(abjad.timespans.Timespan(3, 4))
+        Traceback (most recent call last):
+        ...
+        TypeError: StaticTimespanCollection is read-only
+
+    Queries are answered by binary searches over arrays of offsets rather
+    than tree walks, trading mutability for faster construction and lookups
+    over collections built once and queried often.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ()
+
+    ### INITIALIZER ###
+
+    def __init__(self, timespans=None):
+        self._driver = StaticTimespanCollectionDriver(timespans)
+
+    ### PUBLIC METHODS ###
+
+    def insert(self, timespans):
+        raise TypeError("{} is read-only".format(type(self).__name__))
+
+    def remove(self, timespans):
+        raise TypeError("{} is read-only".format(type(self).__name__))
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def earliest_start_offset(self):
+        if len(self):
+            return float(self._driver._start_offsets[0])
+        return float("-inf")
+
+    @property
+    def earliest_stop_offset(self):
+        if len(self):
+            return float(self._driver._stop_offsets.min())
+        return float("inf")
+
+    @property
+    def latest_start_offset(self):
+        if len(self):
+            return float(self._driver._start_offsets[-1])
+        return float("-inf")
+
+    @property
+    def latest_stop_offset(self):
+        if len(self):
+            return float(self._driver._stop_offsets.max())
+        return float("inf")
@@ -0,0 +1,170 @@
+class StaticTimespanCollectionDriver:
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_offsets",
+        "_sorted_stop_offsets",
+        "_start_offsets",
+        "_stop_offset_maxima",
+        "_stop_offsets",
+        "_stop_order",
+        "_timespans",
+        "_unique_start_offsets",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, timespans=None):
+        import numpy
+
+        if self._is_timespan(timespans):
+            timespans = [timespans]
+        self._timespans = sorted(
+            (timespan for timespan in timespans or () if self._is_timespan(timespan)),
+            key=lambda x: (float(x.start_offset), float(x.stop_offset)),
+        )
+        self._start_offsets = numpy.array(
+            [float(timespan.start_offset) for timespan in self._timespans],
+            dtype=numpy.float64,
+        )
+        self._stop_offsets = numpy.array(
+            [float(timespan.stop_offset) for timespan in self._timespans],
+            dtype=numpy.float64,
+        )
+        # Running maxima of stop offsets, in start offset order, bound where
+        # timespans stopping after any given offset can begin.
+        self._stop_offset_maxima = numpy.maximum.accumulate(self._stop_offsets)
+        self._stop_order = self._stop_offsets.argsort(kind="stable")
+        self._sorted_stop_offsets = self._stop_offsets[self._stop_order]
+        self._unique_start_offsets = numpy.unique(self._start_offsets)
+        self._offsets = (self._start_offsets.tolist(), self._stop_offsets.tolist())
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, timespan):
+        assert self._is_timespan(timespan)
+        candidates = self.find_timespans_starting_at(timespan.start_offset)
+        result = timespan in candidates
+        return result
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, slice)):
+            return self._timespans[item]
+        raise TypeError("Indices must be integers or slices, got {}".format(item))
+
+    def __iter__(self):
+        return iter(self._timespans)
+
+    def __len__(self):
+        return len(self._timespans)
+
+    ### PRIVATE METHODS ###
+
+    def _find_intersecting_indices(self, start_offset, stop_offset, lower, upper):
+        # Candidate ranges are short, and filtering them in Python is cheaper
+        # than a round of NumPy calls per query.
+        start_offsets, stop_offsets = self._offsets
+        indices = []
+        for i in range(lower, upper):
+            if start_offsets[i] <= start_offset < stop_offsets[i] or (
+                start_offset <= start_offsets[i] < stop_offset
+            ):
+                indices.append(i)
+        return indices
+
+    def _get_bounds(self, start_offsets, stop_offsets):
+        lower = self._stop_offset_maxima.searchsorted(start_offsets, side="left")
+        upper = self._start_offsets.searchsorted(stop_offsets, side="left")
+        upper = upper.clip(
+            self._start_offsets.searchsorted(start_offsets, side="right"), None
+        )
+        return lower, upper
+
+    @staticmethod
+    def _is_timespan(expr):
+        if hasattr(expr, "start_offset") and hasattr(expr, "stop_offset"):
+            return True
+        return False
+
+    ### PUBLIC METHODS ###
+
+    def find_timespans_intersecting_offset(self, offset):
+        query = (float(offset), float(offset))
+        return self.sweep([query])[query][0]
+
+    def find_timespans_intersecting_timespan(self, timespan):
+        query = (float(timespan.start_offset), float(timespan.stop_offset))
+        return self.sweep([query])[query][0]
+
+    def find_timespans_starting_at(self, offset):
+        lower = self._start_offsets.searchsorted(float(offset), side="left")
+        upper = self._start_offsets.searchsorted(float(offset), side="right")
+        return self._timespans[lower:upper]
+
+    def find_timespans_stopping_at(self, offset):
+        stop_offsets = self._sorted_stop_offsets
+        lower = stop_offsets.searchsorted(float(offset), side="left")
+        upper = stop_offsets.searchsorted(float(offset), side="right")
+        indices = sorted(self._stop_order[lower:upper].tolist())
+        return [self._timespans[index] for index in indices]
+
+    def get_start_offset_after(self, offset):
+        index = self._unique_start_offsets.searchsorted(offset, side="right")
+        if index == len(self._unique_start_offsets):
+            return None
+        return float(self._unique_start_offsets[index])
+
+    def get_start_offset_before(self, offset):
+        index = self._unique_start_offsets.searchsorted(offset, side="left")
+        if not index:
+            return None
+        return float(self._unique_start_offsets[index - 1])
+
+    def index(self, timespan):
+        assert self._is_timespan(timespan)
+        start_offset = float(timespan.start_offset)
+        stop_offset = float(timespan.stop_offset)
+        lower = self._start_offsets.searchsorted(start_offset, side="left")
+        upper = self._start_offsets.searchsorted(start_offset, side="right")
+        for index in range(lower, upper):
+            if (
+                self._stop_offsets[index] == stop_offset
+                and self._timespans[index] == timespan
+            ):
+                return index
+        raise ValueError("{} not in timespan collection.".format(timespan))
+
+    def sweep(self, queries):
+        import numpy
+
+        queries = sorted(set(queries))
+        if not queries:
+            return {}
+        start_offsets, stop_offsets = (
+            numpy.array(x, dtype=numpy.float64) for x in zip(*queries)
+        )
+        lowers, uppers = self._get_bounds(start_offsets, stop_offsets)
+        stop_lowers = self._sorted_stop_offsets.searchsorted(start_offsets, side="left")
+        stop_uppers = self._sorted_stop_offsets.searchsorted(
+            start_offsets, side="right"
+        )
+        results = {}
+        for query, lower, upper, stop_lower, stop_upper in zip(
+            queries,
+            lowers.tolist(),
+            uppers.tolist(),
+            stop_lowers.tolist(),
+            stop_uppers.tolist(),
+        ):
+            intersecting_timespans, stop_timespans = [], []
+            if lower < upper:
+                indices = self._find_intersecting_indices(
+                    query[0], query[1], lower, upper
+                )
+                intersecting_timespans = [self._timespans[i] for i in indices]
+            if stop_lower < stop_upper:
+                indices = sorted(self._stop_order[stop_lower:stop_upper].tolist())
+                stop_timespans = [self._timespans[i] for i in indices]
+            results[query] = (intersecting_timespans, stop_timespans)
+        return results
@@ -236,6 +236,15 @@ class TimespanCollection(SupriyaObject):
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _get_query(cls, timespan_or_offset):
+        if cls._is_timespan(timespan_or_offset):
+            return (
+                float(timespan_or_offset.start_offset),
+                float(timespan_or_offset.stop_offset),
+            )
+        return (float(timespan_or_offset), float(timespan_or_offset))
+
     @staticmethod
     def _is_timespan(expr):
         if hasattr(expr, "start_offset") and hasattr(expr, "stop_offset"):
@@ -303,6 +312,41 @@ class TimespanCollection(SupriyaObject):
             return self._driver.find_timespans_intersecting_timespan(timespan_or_offset)
         return self._driver.find_timespans_intersecting_offset(timespan_or_offset)
 
+    def find_intersections(self, timespans_or_offsets):
+        """
+        Finds timespans intersecting each of many timespans or offsets.
+
+        ::
+
+            >>> import abjad.timespans
+            >>> timespans = (
+            ...     abjad.timespans.Timespan(0, 3),
+            ...     abjad.timespans.Timespan(1, 3),
+            ...     abjad.timespans.Timespan(1, 2),
+            ...     abjad.timespans.Timespan(2, 5),
+            ...     abjad.timespans.Timespan(6, 9),
+            ...     )
+            >>> timespan_collection = supriya.time.TimespanCollection(timespans)
+
+        ::
+
+            >>> queries = [1.5, abjad.timespans.Timespan(2, 4), 5]
+            >>> for result in timespan_collection.find_intersections(queries):
+            ...     [(x.start_offset, x.stop_offset) for x in result]
+            ...
+            [(Offset(0, 1), Offset(3, 1)), (Offset(1, 1), Offset(2, 1)), (Offset(1, 1), Offset(3, 1))]
+            [(Offset(0, 1), Offset(3, 1)), (Offset(1, 1), Offset(3, 1)), (Offset(2, 1), Offset(5, 1))]
+            []
+
+        Answers all queries in a single walk of the collection, rather than
+        one tree search per query.
+
+        Returns list of lists of timespans, one per query.
+        """
+        queries = [self._get_query(x) for x in timespans_or_offsets]
+        results = self._driver.sweep(queries)
+        return [list(results[query][0]) for query in queries]
+
     def find_timespans_starting_at(self, offset):
         return self._driver.find_timespans_starting_at(offset)
 
@@ -352,6 +396,54 @@ class TimespanCollection(SupriyaObject):
         )
         return simultaneity
 
+    def get_simultaneities_at(self, offsets):
+        """
+        Gets simultaneities at each of `offsets`.
+
+        ::
+
+            >>> import abjad.timespans
+            >>> timespans = (
+            ...     abjad.timespans.Timespan(0, 3),
+            ...     abjad.timespans.Timespan(1, 3),
+            ...     abjad.timespans.Timespan(1, 2),
+            ...     abjad.timespans.Timespan(2, 5),
+            ...     abjad.timespans.Timespan(6, 9),
+            ...     )
+            >>> timespan_collection = supriya.time.TimespanCollection(timespans)
+
+        ::
+
+            >>> timespan_collection.get_simultaneities_at([1, 6.5, 3])
+            [<TimespanSimultaneity(1 <<3>>)>, <TimespanSimultaneity(6.5 <<1>>)>, <TimespanSimultaneity(3 <<1>>)>]
+
+        Equivalent to calling ``get_simultaneity_at()`` once per offset, but
+        sweeps the collection once.
+
+        Returns list of simultaneities.
+        """
+        offsets = list(offsets)
+        queries = [self._get_query(offset) for offset in offsets]
+        results = self._driver.sweep(queries)
+        simultaneities = []
+        for offset, query in zip(offsets, queries):
+            intersecting_timespans, stop_timespans = results[query]
+            start_timespans, overlap_timespans = [], []
+            for timespan in intersecting_timespans:
+                if timespan.start_offset == offset:
+                    start_timespans.append(timespan)
+                else:
+                    overlap_timespans.append(timespan)
+            simultaneity = TimespanSimultaneity(
+                timespan_collection=self,
+                overlap_timespans=overlap_timespans,
+                start_timespans=start_timespans,
+                start_offset=offset,
+                stop_timespans=list(stop_timespans),
+            )
+            simultaneities.append(simultaneity)
+        return simultaneities
+
     def get_start_offset_after(self, offset):
         """
         Gets start offst in this timespan collection after `offset`.
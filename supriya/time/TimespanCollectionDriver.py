@@ -59,30 +59,24 @@ class _CNode:
         "balance",
         "height",
         "left_child",
-        "node_start_index",
-        "node_stop_index",
         "payload",
         "right_child",
         "start_offset",
         "stop_offset_high",
         "stop_offset_low",
-        "subtree_start_index",
-        "subtree_stop_index",
+        "subtree_count",
     )
 
     def __init__(self, start_offset):
         self.balance = 0
         self.height = 0
         self.left_child = None
-        self.node_start_index = -1
-        self.node_stop_index = -1
         self.payload = []
         self.right_child = None
         self.start_offset = start_offset
         self.stop_offset_high = None
         self.stop_offset_low = None
-        self.subtree_start_index = -1
-        self.subtree_stop_index = -1
+        self.subtree_count = 0
 
 
 class TimespanCollectionDriver:
@@ -111,15 +105,15 @@ class TimespanCollectionDriver:
             if self._root_node is None:
                 raise IndexError
             if item < 0:
-                item = self._root_node.subtree_stop_index + item
-            if item < 0 or self._root_node.subtree_stop_index <= item:
+                item = self._root_node.subtree_count + item
+            if item < 0 or self._root_node.subtree_count <= item:
                 raise IndexError
             ctimespan = self._recurse_getitem_by_index(self._root_node, item)
             return ctimespan.original_timespan
         elif isinstance(item, slice):
             if self._root_node is None:
                 return []
-            indices = item.indices(self._root_node.subtree_stop_index)
+            indices = item.indices(self._root_node.subtree_count)
             start, stop = indices[0], indices[1]
             ctimespans = self._recurse_getitem_by_slice(self._root_node, start, stop)
             return [ctimespan.original_timespan for ctimespan in ctimespans]
@@ -146,32 +140,51 @@ class TimespanCollectionDriver:
     def __len__(self):
         if self._root_node is None:
             return 0
-        return self._root_node.subtree_stop_index
+        return self._root_node.subtree_count
 
     ### PRIVATE METHODS ###
 
+    def _build_tree(self, ctimespans):
+        nodes = []
+        for ctimespan in ctimespans:
+            if not nodes or nodes[-1].start_offset != ctimespan.start_offset:
+                nodes.append(_CNode(ctimespan.start_offset))
+            nodes[-1].payload.append(ctimespan)
+        return self._recurse_build_tree(nodes, 0, len(nodes))
+
+    def _collect_ctimespans(self):
+        result, stack = [], []
+        current = self._root_node
+        while True:
+            while current is not None:
+                stack.append(current)
+                current = current.left_child
+            if not stack:
+                return result
+            current = stack.pop()
+            result.extend(current.payload)
+            current = current.right_child
+
     def _get_node_ctimespan(self, node):
         return abjad.timespans.Timespan(
             start_offset=node.start_offset, stop_offset=node.stop_offset_high
         )
 
-    def _insert_node(self, node, start_offset):
+    def _insert_timespan(self, node, ctimespan):
         if node is None:
-            return _CNode(start_offset)
-        if start_offset < node.start_offset:
-            left_child = self._insert_node(node.left_child, start_offset)
+            node = _CNode(ctimespan.start_offset)
+        if ctimespan.start_offset < node.start_offset:
+            left_child = self._insert_timespan(node.left_child, ctimespan)
             self._set_node_left_child(node, left_child)
-        elif node.start_offset < start_offset:
-            right_child = self._insert_node(node.right_child, start_offset)
+        elif node.start_offset < ctimespan.start_offset:
+            right_child = self._insert_timespan(node.right_child, ctimespan)
             self._set_node_right_child(node, right_child)
+        else:
+            node.payload.append(ctimespan)
+            node.payload.sort(key=lambda x: x.stop_offset)
+            self._update_node(node)
         return self._rebalance(node)
 
-    def _insert_timespan(self, ctimespan):
-        self._root_node = self._insert_node(self._root_node, ctimespan.start_offset)
-        node = self._search(self._root_node, ctimespan.start_offset)
-        node.payload.append(ctimespan)
-        node.payload.sort(key=lambda x: x.stop_offset)
-
     @staticmethod
     def _is_timespan(expr):
         if hasattr(expr, "start_offset") and hasattr(expr, "stop_offset"):
@@ -217,6 +230,16 @@ class TimespanCollectionDriver:
                 node = self._rotate_left_right(node)
         return node
 
+    def _recurse_build_tree(self, nodes, start, stop):
+        if stop <= start:
+            return None
+        middle = (start + stop) // 2
+        node = nodes[middle]
+        node.left_child = self._recurse_build_tree(nodes, start, middle)
+        node.right_child = self._recurse_build_tree(nodes, middle + 1, stop)
+        self._update_node(node)
+        return node
+
     def _recurse_find_timespans_intersecting_timespan(self, node, ctimespan):
         result = []
         if node is None:
@@ -309,41 +332,59 @@ class TimespanCollectionDriver:
         return result
 
     def _recurse_getitem_by_index(self, node, index):
-        if node.node_start_index <= index < node.node_stop_index:
-            return node.payload[index - node.node_start_index]
-        elif node.left_child is not None and index < node.node_start_index:
+        node_start_index = 0
+        if node.left_child is not None:
+            node_start_index = node.left_child.subtree_count
+        node_stop_index = node_start_index + len(node.payload)
+        if node_start_index <= index < node_stop_index:
+            return node.payload[index - node_start_index]
+        elif node.left_child is not None and index < node_start_index:
             return self._recurse_getitem_by_index(node.left_child, index)
-        elif node.right_child is not None and node.node_stop_index <= index:
-            return self._recurse_getitem_by_index(node.right_child, index)
+        elif node.right_child is not None and node_stop_index <= index:
+            return self._recurse_getitem_by_index(
+                node.right_child, index - node_stop_index
+            )
 
     def _recurse_getitem_by_slice(self, node, start, stop):
         result = []
         if node is None:
             return result
-        if start < node.node_start_index and node.left_child is not None:
+        node_start_index = 0
+        if node.left_child is not None:
+            node_start_index = node.left_child.subtree_count
+        node_stop_index = node_start_index + len(node.payload)
+        if start < node_start_index and node.left_child is not None:
             result.extend(self._recurse_getitem_by_slice(node.left_child, start, stop))
-        if start < node.node_stop_index and node.node_start_index < stop:
-            node_start = start - node.node_start_index
+        if start < node_stop_index and node_start_index < stop:
+            node_start = start - node_start_index
             if node_start < 0:
                 node_start = 0
-            node_stop = stop - node.node_start_index
+            node_stop = stop - node_start_index
             result.extend(node.payload[node_start:node_stop])
-        if node.node_stop_index <= stop and node.right_child is not None:
-            result.extend(self._recurse_getitem_by_slice(node.right_child, start, stop))
+        if node_stop_index <= stop and node.right_child is not None:
+            result.extend(
+                self._recurse_getitem_by_slice(
+                    node.right_child, start - node_stop_index, stop - node_stop_index
+                )
+            )
         return result
 
-    def _remove_timespan(self, ctimespan, old_start_offset=None):
-        assert isinstance(ctimespan, _CTimespan)
-        start_offset = ctimespan.start_offset
-        if old_start_offset is not None:
-            start_offset = old_start_offset
-        node = self._search(self._root_node, start_offset)
+    def _remove_timespan(self, node, ctimespan):
         if node is None:
-            return
-        if ctimespan in node.payload:
-            node.payload.remove(ctimespan)
-        if not node.payload:
-            self._root_node = self._remove_node(self._root_node, start_offset)
+            return None
+        if ctimespan.start_offset < node.start_offset:
+            left_child = self._remove_timespan(node.left_child, ctimespan)
+            self._set_node_left_child(node, left_child)
+        elif node.start_offset < ctimespan.start_offset:
+            right_child = self._remove_timespan(node.right_child, ctimespan)
+            self._set_node_right_child(node, right_child)
+        else:
+            if ctimespan in node.payload:
+                node.payload.remove(ctimespan)
+            if not node.payload:
+                return self._remove_node(node, ctimespan.start_offset)
+            self._update_node(node)
+        return self._rebalance(node)
 
     def _rotate_left_left(self, node):
         next_node = node.left_child
@@ -380,62 +421,37 @@ class TimespanCollectionDriver:
 
     def _set_node_left_child(self, node, left_child):
         node.left_child = left_child
-        self._update_node_height(node)
+        self._update_node(node)
 
     def _set_node_right_child(self, node, right_child):
         node.right_child = right_child
-        self._update_node_height(node)
+        self._update_node(node)
 
-    def _update_node_height(self, node):
+    def _update_node(self, node):
+        # Payloads are sorted by stop offset, so each node's own stop offset
+        # bounds are its first and last timespans.
         left_height = -1
         right_height = -1
+        stop_offset_low = node.payload[0].stop_offset
+        stop_offset_high = node.payload[-1].stop_offset
+        subtree_count = len(node.payload)
+        for child_node in (node.left_child, node.right_child):
+            if child_node is None:
+                continue
+            if child_node.stop_offset_low < stop_offset_low:
+                stop_offset_low = child_node.stop_offset_low
+            if stop_offset_high < child_node.stop_offset_high:
+                stop_offset_high = child_node.stop_offset_high
+            subtree_count += child_node.subtree_count
         if node.left_child is not None:
             left_height = node.left_child.height
         if node.right_child is not None:
             right_height = node.right_child.height
         node.height = max(left_height, right_height) + 1
         node.balance = right_height - left_height
-        return node.height
-
-    def _update_indices(self, node, parent_stop_index):
-        if node is None:
-            return
-        if node.left_child is not None:
-            self._update_indices(node.left_child, parent_stop_index)
-            node.node_start_index = node.left_child.subtree_stop_index
-            node.subtree_start_index = node.left_child.subtree_start_index
-        elif parent_stop_index == -1:
-            node.node_start_index = 0
-            node.subtree_start_index = 0
-        else:
-            node.node_start_index = parent_stop_index
-            node.subtree_start_index = parent_stop_index
-        node.node_stop_index = node.node_start_index + len(node.payload)
-        node.subtree_stop_index = node.node_stop_index
-        if node.right_child is not None:
-            self._update_indices(node.right_child, node.node_stop_index)
-            node.subtree_stop_index = node.right_child.subtree_stop_index
-
-    def _update_offsets(self, node):
-        if node is None:
-            return
-        stop_offset_low = min(x.stop_offset for x in node.payload)
-        stop_offset_high = max(x.stop_offset for x in node.payload)
-        if node.left_child:
-            left_child = self._update_offsets(node.left_child)
-            if left_child.stop_offset_low < stop_offset_low:
-                stop_offset_low = left_child.stop_offset_low
-            if stop_offset_high < left_child.stop_offset_high:
-                stop_offset_high = left_child.stop_offset_high
-        if node.right_child:
-            right_child = self._update_offsets(node.right_child)
-            if right_child.stop_offset_low < stop_offset_low:
-                stop_offset_low = right_child.stop_offset_low
-            if stop_offset_high < right_child.stop_offset_high:
-                stop_offset_high = right_child.stop_offset_high
-        node.stop_offset_low = stop_offset_low
         node.stop_offset_high = stop_offset_high
-        return node
+        node.stop_offset_low = stop_offset_low
+        node.subtree_count = subtree_count
 
     ### PUBLIC METHODS ###
 
@@ -483,24 +499,41 @@ class TimespanCollectionDriver:
     def index(self, timespan):
         assert self._is_timespan(timespan)
         ctimespan = _CTimespan.from_timespan(timespan)
-        node = self._search(self._root_node, ctimespan.start_offset)
+        index, node = 0, self._root_node
+        while node is not None and node.start_offset != ctimespan.start_offset:
+            if ctimespan.start_offset < node.start_offset:
+                node = node.left_child
+                continue
+            if node.left_child is not None:
+                index += node.left_child.subtree_count
+            index += len(node.payload)
+            node = node.right_child
         if node is None:
             raise ValueError("{} not in timespan collection.".format(timespan))
         if ctimespan not in node.payload:
             raise ValueError("{} not in timespan collection.".format(timespan))
-        index = node.payload.index(ctimespan) + node.node_start_index
+        if node.left_child is not None:
+            index += node.left_child.subtree_count
+        index += node.payload.index(ctimespan)
         return index
 
     def insert(self, timespans):
         if self._is_timespan(timespans):
             timespans = [timespans]
-        for timespan in timespans:
-            if not self._is_timespan(timespan):
-                continue
-            ctimespan = _CTimespan.from_timespan(timespan)
-            self._insert_timespan(ctimespan)
-        self._update_indices(self._root_node, -1)
-        self._update_offsets(self._root_node)
+        ctimespans = [
+            _CTimespan.from_timespan(timespan)
+            for timespan in timespans
+            if self._is_timespan(timespan)
+        ]
+        if len(self) <= len(ctimespans):
+            # Rebuilding from sorted timespans is linear, and the sort itself
+            # is linear for already-sorted input.
+            ctimespans[:0] = self._collect_ctimespans()
+            ctimespans.sort(key=lambda x: (x.start_offset, x.stop_offset))
+            self._root_node = self._build_tree(ctimespans)
+        else:
+            for ctimespan in ctimespans:
+                self._root_node = self._insert_timespan(self._root_node, ctimespan)
 
     def remove(self, timespans):
         if self._is_timespan(timespans):
@@ -509,6 +542,36 @@ class TimespanCollectionDriver:
             if not self._is_timespan(timespan):
                 continue
             ctimespan = _CTimespan.from_timespan(timespan)
-            self._remove_timespan(ctimespan)
-        self._update_indices(self._root_node, -1)
-        self._update_offsets(self._root_node)
+            self._root_node = self._remove_timespan(self._root_node, ctimespan)
+
+    def sweep(self, queries):
+        ctimespans = self._collect_ctimespans()
+        active, index, results = [], 0, {}
+        for query in sorted(set(queries)):
+            start_offset, stop_offset = query
+            while (
+                index < len(ctimespans)
+                and ctimespans[index].start_offset <= start_offset
+            ):
+                active.append(ctimespans[index])
+                index += 1
+            active = [x for x in active if start_offset <= x.stop_offset]
+            intersecting = [
+                x
+                for x in active
+                if start_offset < x.stop_offset
+                or x.start_offset == start_offset < stop_offset
+            ]
+            cursor = index
+            while (
+                cursor < len(ctimespans)
+                and ctimespans[cursor].start_offset < stop_offset
+            ):
+                intersecting.append(ctimespans[cursor])
+                cursor += 1
+            stopping = [x for x in active if x.stop_offset == start_offset]
+            results[query] = (
+                [x.original_timespan for x in intersecting],
+                [x.original_timespan for x in stopping],
+            )
+        return results
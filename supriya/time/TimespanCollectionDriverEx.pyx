@@ -58,29 +58,23 @@ cdef class _CNode:
     cdef public int balance
     cdef public int height
     cdef public _CNode left_child
-    cdef public int node_start_index
-    cdef public int node_stop_index
     cdef public object payload
     cdef public _CNode right_child
     cdef public float start_offset
     cdef public float stop_offset_high
     cdef public float stop_offset_low
-    cdef public int subtree_start_index
-    cdef public int subtree_stop_index
+    cdef public int subtree_count
 
     def __init__(self, start_offset):
         self.balance = 0
         self.height = 0
         self.left_child = None
-        self.node_start_index = -1
-        self.node_stop_index = -1
         self.payload = []
         self.right_child = None
         self.start_offset = start_offset
         self.stop_offset_high = start_offset
         self.stop_offset_low = start_offset
-        self.subtree_start_index = -1
-        self.subtree_stop_index = -1
+        self.subtree_count = 0
 
 
 cdef class TimespanCollectionDriverEx:
@@ -126,15 +120,15 @@ cdef class TimespanCollectionDriverEx:
             if self._root_node is None:
                 raise IndexError
             if i < 0:
-                i = self._root_node.subtree_stop_index + i
-            if i < 0 or self._root_node.subtree_stop_index <= i:
+                i = self._root_node.subtree_count + i
+            if i < 0 or self._root_node.subtree_count <= i:
                 raise IndexError
             ctimespan = self._recurse_getitem_by_index(self._root_node, i)
             return ctimespan.original_timespan
         elif isinstance(i, slice):
             if self._root_node is None:
                 return []
-            indices = i.indices(self._root_node.subtree_stop_index)
+            indices = i.indices(self._root_node.subtree_count)
             start, stop = indices[0], indices[1]
             ctimespans = self._recurse_getitem_by_slice(self._root_node, start, stop)
             return self._unbox_ctimespans(ctimespans)
@@ -165,39 +159,58 @@ cdef class TimespanCollectionDriverEx:
     def __len__(self):
         if self._root_node is None:
             return 0
-        return self._root_node.subtree_stop_index
+        return self._root_node.subtree_count
 
     ### PRIVATE METHODS ###
 
-    cdef _CNode _insert_node(
+    cdef _CNode _build_tree(
+        self,
+        list ctimespans,
+        ):
+        cdef _CNode node = None
+        cdef _CTimespan ctimespan
+        cdef list nodes = []
+        for ctimespan in ctimespans:
+            if node is None or node.start_offset != ctimespan.start_offset:
+                node = _CNode(ctimespan.start_offset)
+                nodes.append(node)
+            node.payload.append(ctimespan)
+        return self._recurse_build_tree(nodes, 0, len(nodes))
+
+    cdef list _collect_ctimespans(self):
+        cdef _CNode current
+        cdef list result = [], stack = []
+        current = self._root_node
+        while True:
+            while current is not None:
+                stack.append(current)
+                current = current.left_child
+            if not stack:
+                return result
+            current = stack.pop()
+            result.extend(current.payload)
+            current = current.right_child
+
+    cdef _CNode _insert_timespan(
         self,
         _CNode node,
-        float start_offset,
+        _CTimespan ctimespan,
         ):
         cdef _CNode child_node
         if node is None:
-            return _CNode(start_offset)
-        if start_offset < node.start_offset:
-            child_node = self._insert_node(node.left_child, start_offset)
+            node = _CNode(ctimespan.start_offset)
+        if ctimespan.start_offset < node.start_offset:
+            child_node = self._insert_timespan(node.left_child, ctimespan)
             self._set_node_left_child(node, child_node)
-        elif node.start_offset < start_offset:
-            child_node = self._insert_node(node.right_child, start_offset)
+        elif node.start_offset < ctimespan.start_offset:
+            child_node = self._insert_timespan(node.right_child, ctimespan)
             self._set_node_right_child(node, child_node)
+        else:
+            node.payload.append(ctimespan)
+            node.payload.sort(key=lambda x: x.stop_offset)
+            self._update_node(node)
         return self._rebalance(node)
 
-    cdef void _insert_timespan(
-        self,
-        _CTimespan ctimespan,
-        ):
-        cdef _CNode node
-        self._root_node = self._insert_node(
-            self._root_node,
-            ctimespan.start_offset,
-            )
-        node = self._search(self._root_node, ctimespan.start_offset)
-        node.payload.append(ctimespan)
-        node.payload.sort(key=lambda x: x.stop_offset)
-
     @staticmethod
     def _is_timespan(expr):
         if hasattr(expr, 'start_offset') and hasattr(expr, 'stop_offset'):
@@ -222,6 +235,23 @@ cdef class TimespanCollectionDriverEx:
                 node = self._rotate_left_right(node)
         return node
 
+    cdef _CNode _recurse_build_tree(
+        self,
+        list nodes,
+        int start,
+        int stop,
+        ):
+        cdef _CNode node
+        cdef int middle
+        if stop <= start:
+            return None
+        middle = (start + stop) // 2
+        node = nodes[middle]
+        node.left_child = self._recurse_build_tree(nodes, start, middle)
+        node.right_child = self._recurse_build_tree(nodes, middle + 1, stop)
+        self._update_node(node)
+        return node
+
     cdef object _recurse_find_timespans_intersecting_offset(
         self,
         _CNode node,
@@ -339,12 +369,17 @@ cdef class TimespanCollectionDriverEx:
         _CNode node, 
         int index,
         ):
-        if node.node_start_index <= index < node.node_stop_index:
-            return node.payload[index - node.node_start_index]
-        elif node.left_child and index < node.node_start_index:
+        cdef int node_start_index = 0, node_stop_index
+        if node.left_child is not None:
+            node_start_index = node.left_child.subtree_count
+        node_stop_index = node_start_index + len(node.payload)
+        if node_start_index <= index < node_stop_index:
+            return node.payload[index - node_start_index]
+        elif node.left_child and index < node_start_index:
             return self._recurse_getitem_by_index(node.left_child, index)
-        elif node.right_child and node.node_stop_index <= index:
-            return self._recurse_getitem_by_index(node.right_child, index)
+        elif node.right_child and node_stop_index <= index:
+            return self._recurse_getitem_by_index(
+                node.right_child, index - node_stop_index)
 
     cdef object _recurse_getitem_by_slice(
         self,
@@ -353,21 +388,25 @@ cdef class TimespanCollectionDriverEx:
         int stop,
         ):
         cdef int node_start, node_stop
+        cdef int node_start_index = 0, node_stop_index
         result = []
         if node is None:
             return result
-        if start < node.node_start_index and node.left_child:
+        if node.left_child is not None:
+            node_start_index = node.left_child.subtree_count
+        node_stop_index = node_start_index + len(node.payload)
+        if start < node_start_index and node.left_child:
             result.extend(self._recurse_getitem_by_slice(
                 node.left_child, start, stop))
-        if start < node.node_stop_index and node.node_start_index < stop:
-            node_start = start - node.node_start_index
+        if start < node_stop_index and node_start_index < stop:
+            node_start = start - node_start_index
             if node_start < 0:
                 node_start = 0
-            node_stop = stop - node.node_start_index
+            node_stop = stop - node_start_index
             result.extend(node.payload[node_start:node_stop])
-        if node.node_stop_index <= stop and node.right_child:
+        if node_stop_index <= stop and node.right_child:
             result.extend(self._recurse_getitem_by_slice(
-                node.right_child, start, stop))
+                node.right_child, start - node_stop_index, stop - node_stop_index))
         return result
 
     cdef _CNode _remove_node(
@@ -399,21 +438,27 @@ cdef class TimespanCollectionDriverEx:
             self._set_node_right_child(node, child_node)
         return self._rebalance(node)
 
-    cdef void _remove_timespan(
+    cdef _CNode _remove_timespan(
         self,
+        _CNode node,
         _CTimespan ctimespan,
         ):
-        cdef _CNode node
-        node = self._search(self._root_node, ctimespan.start_offset)
+        cdef _CNode child_node
         if node is None:
-            return
-        if ctimespan in node.payload:
-            node.payload.remove(ctimespan)
-        if not node.payload:
-            self._root_node = self._remove_node(
-                self._root_node,
-                ctimespan.start_offset,
-                )
+            return None
+        if ctimespan.start_offset < node.start_offset:
+            child_node = self._remove_timespan(node.left_child, ctimespan)
+            self._set_node_left_child(node, child_node)
+        elif node.start_offset < ctimespan.start_offset:
+            child_node = self._remove_timespan(node.right_child, ctimespan)
+            self._set_node_right_child(node, child_node)
+        else:
+            if ctimespan in node.payload:
+                node.payload.remove(ctimespan)
+            if not node.payload:
+                return self._remove_node(node, ctimespan.start_offset)
+            self._update_node(node)
+        return self._rebalance(node)
 
     cdef _CNode _rotate_left_left(
         self,
@@ -478,7 +523,7 @@ cdef class TimespanCollectionDriverEx:
         _CNode left_child,
         ):
         node.left_child = left_child
-        self._update_node_height(node)
+        self._update_node(node)
 
     cdef void _set_node_right_child(
         self,
@@ -486,7 +531,7 @@ cdef class TimespanCollectionDriverEx:
         _CNode right_child,
         ):
         node.right_child = right_child
-        self._update_node_height(node)
+        self._update_node(node)
 
     cdef object _unbox_ctimespans(
         self,
@@ -496,85 +541,44 @@ cdef class TimespanCollectionDriverEx:
         ctimespans.sort(key=lambda x: (x.start_offset, x.stop_offset))
         return [ctimespan.original_timespan for ctimespan in ctimespans]
 
-    cdef void _update_node_height(
+    cdef void _update_node(
         self,
         _CNode node,
         ):
-        cdef int left_height, right_height
-        left_height = -1
-        right_height = -1
-        if node.left_child is not None:
-            left_height = node.left_child.height
-        if node.right_child is not None:
-            right_height = node.right_child.height
-        node.height = max(left_height, right_height) + 1
-        node.balance = right_height - left_height
-
-    cdef void _update_indices(
-        self,
-        _CNode node,
-        int parent_stop_index,
-        ):
-        if node is None:
-            return
-        if node.left_child is not None:
-            self._update_indices(
-                node.left_child,
-                parent_stop_index,
-                )
-            node.node_start_index = node.left_child.subtree_stop_index
-            node.subtree_start_index = node.left_child.subtree_start_index
-        elif parent_stop_index == -1:
-            node.node_start_index = 0
-            node.subtree_start_index = 0
-        else:
-            node.node_start_index = parent_stop_index
-            node.subtree_start_index = parent_stop_index
-        node.node_stop_index = node.node_start_index + len(node.payload)
-        node.subtree_stop_index = node.node_stop_index
-        if node.right_child is not None:
-            self._update_indices(
-                node.right_child,
-                node.node_stop_index,
-                )
-            node.subtree_stop_index = node.right_child.subtree_stop_index
-
-    cdef _CNode _update_offsets(
-        self, 
-        _CNode node,
-        ):
+        # Payloads are sorted by stop offset, so each node's own stop offset
+        # bounds are its first and last timespans.
         cdef _CNode child_node
         cdef _CTimespan ctimespan
-        cdef float stop_offset_low, stop_offset_hight
-        if node is None:
-            return
-        stop_offset_low = float('inf')
-        stop_offset_high = float('-inf')
-        for i in range(len(node.payload)):
-            ctimespan = node.payload[i]
-            if ctimespan.stop_offset < stop_offset_low:
-                stop_offset_low = ctimespan.stop_offset
-            if ctimespan.stop_offset > stop_offset_high:
-                stop_offset_high = ctimespan.stop_offset
+        cdef int left_height, right_height, subtree_count
+        cdef float stop_offset_low, stop_offset_high
+        left_height = -1
+        right_height = -1
+        ctimespan = node.payload[0]
+        stop_offset_low = ctimespan.stop_offset
+        ctimespan = node.payload[-1]
+        stop_offset_high = ctimespan.stop_offset
+        subtree_count = len(node.payload)
         if node.left_child is not None:
-            child_node = self._update_offsets(
-                node.left_child,
-                )
+            child_node = node.left_child
+            left_height = child_node.height
             if child_node.stop_offset_low < stop_offset_low:
                 stop_offset_low = child_node.stop_offset_low
             if stop_offset_high < child_node.stop_offset_high:
                 stop_offset_high = child_node.stop_offset_high
+            subtree_count += child_node.subtree_count
         if node.right_child is not None:
-            child_node = self._update_offsets(
-                node.right_child,
-                )
+            child_node = node.right_child
+            right_height = child_node.height
             if child_node.stop_offset_low < stop_offset_low:
                 stop_offset_low = child_node.stop_offset_low
             if stop_offset_high < child_node.stop_offset_high:
                 stop_offset_high = child_node.stop_offset_high
-        node.stop_offset_low = stop_offset_low
+            subtree_count += child_node.subtree_count
+        node.height = max(left_height, right_height) + 1
+        node.balance = right_height - left_height
         node.stop_offset_high = stop_offset_high
-        return node
+        node.stop_offset_low = stop_offset_low
+        node.subtree_count = subtree_count
 
     ### PUBLIC METHODS ###
 
@@ -618,24 +622,46 @@ cdef class TimespanCollectionDriverEx:
     def index(self, timespan):
         assert self._is_timespan(timespan)
         ctimespan = _CTimespan.from_timespan(timespan)
-        node = self._search(self._root_node, ctimespan.start_offset)
+        index, node = 0, self._root_node
+        while node is not None and node.start_offset != ctimespan.start_offset:
+            if ctimespan.start_offset < node.start_offset:
+                node = node.left_child
+                continue
+            if node.left_child is not None:
+                index += node.left_child.subtree_count
+            index += len(node.payload)
+            node = node.right_child
         if node is None:
             raise ValueError('{} not in timespan collection.'.format(timespan))
         if ctimespan not in node.payload:
             raise ValueError('{} not in timespan collection.'.format(timespan))
-        index = node.payload.index(ctimespan) + node.node_start_index
+        if node.left_child is not None:
+            index += node.left_child.subtree_count
+        index += node.payload.index(ctimespan)
         return index
 
     def insert(self, timespans):
+        cdef _CTimespan ctimespan
+        cdef list ctimespans
         if self._is_timespan(timespans):
             timespans = [timespans]
-        for timespan in timespans:
-            if not self._is_timespan(timespan):
-                continue
-            ctimespan = _CTimespan.from_timespan(timespan)
-            self._insert_timespan(ctimespan)
-        self._update_indices(self._root_node, -1)
-        self._update_offsets(self._root_node)
+        ctimespans = [
+            _CTimespan.from_timespan(timespan)
+            for timespan in timespans
+            if self._is_timespan(timespan)
+            ]
+        if len(self) <= len(ctimespans):
+            # Rebuilding from sorted timespans is linear, and the sort itself
+            # is linear for already-sorted input.
+            ctimespans[:0] = self._collect_ctimespans()
+            ctimespans.sort(key=lambda x: (x.start_offset, x.stop_offset))
+            self._root_node = self._build_tree(ctimespans)
+        else:
+            for ctimespan in ctimespans:
+                self._root_node = self._insert_timespan(
+                    self._root_node,
+                    ctimespan,
+                    )
 
     def remove(self, timespans):
         if self._is_timespan(timespans):
@@ -644,6 +670,45 @@ cdef class TimespanCollectionDriverEx:
             if not self._is_timespan(timespan):
                 continue
             ctimespan = _CTimespan.from_timespan(timespan)
-            self._remove_timespan(ctimespan)
-        self._update_indices(self._root_node, -1)
-        self._update_offsets(self._root_node)
+            self._root_node = self._remove_timespan(
+                self._root_node,
+                ctimespan,
+                )
+
+    def sweep(self, queries):
+        cdef _CTimespan ctimespan
+        cdef float start_offset, stop_offset
+        cdef int count, cursor, index = 0
+        cdef list active = [], ctimespans, intersecting, stopping
+        ctimespans = self._collect_ctimespans()
+        count = len(ctimespans)
+        results = {}
+        for query in sorted(set(queries)):
+            start_offset, stop_offset = query
+            while index < count:
+                ctimespan = ctimespans[index]
+                if start_offset < ctimespan.start_offset:
+                    break
+                active.append(ctimespan)
+                index += 1
+            active = [x for x in active if start_offset <= x.stop_offset]
+            intersecting, stopping = [], []
+            for ctimespan in active:
+                if (
+                    start_offset < ctimespan.stop_offset or (
+                        ctimespan.start_offset == start_offset and
+                        start_offset < stop_offset
+                        )
+                    ):
+                    intersecting.append(ctimespan.original_timespan)
+                if ctimespan.stop_offset == start_offset:
+                    stopping.append(ctimespan.original_timespan)
+            cursor = index
+            while cursor < count:
+                ctimespan = ctimespans[cursor]
+                if stop_offset <= ctimespan.start_offset:
+                    break
+                intersecting.append(ctimespan.original_timespan)
+                cursor += 1
+            results[query] = (intersecting, stopping)
+        return results
@@ -1,6 +1,8 @@
 """
 Tools for modeling overlapping time structures with timespans.
 """
+from .StaticTimespanCollection import StaticTimespanCollection
+from .StaticTimespanCollectionDriver import StaticTimespanCollectionDriver
 from .TimespanCollection import TimespanCollection
 from .TimespanCollectionDriver import TimespanCollectionDriver
 from .TimespanCollectionDriverEx import TimespanCollectionDriverEx  # type: ignore
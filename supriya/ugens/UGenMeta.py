@@ -1,5 +1,6 @@
 import abc
 import collections
+import functools
 
 import uqbar.strings
 
@@ -79,7 +80,8 @@ class UGenMeta(abc.ABCMeta):
                     unexpanded=name in unexpanded_input_names,
                 )
             if "__init__" not in namespace:
-                function, string = UGenMeta.make_initializer(
+                factory = functools.partial(
+                    UGenMeta.make_initializer,
                     ugen_name=class_name,
                     bases=bases,
                     parameters=ordered_input_names.copy(),
@@ -87,8 +89,7 @@ class UGenMeta(abc.ABCMeta):
                     default_channel_count=default_channel_count,
                     has_settable_channel_count=has_settable_channel_count,
                 )
-                namespace["__init__"] = function
-                namespace["_init_source"] = string
+                UGenMeta.install(namespace, "__init__", "_init_source", factory)
             constructor_rates = {}
             if valid_calculation_rates:
                 for rate in valid_calculation_rates:
@@ -98,7 +99,8 @@ class UGenMeta(abc.ABCMeta):
             elif "new" not in namespace:
                 constructor_rates["new"] = None
             for name, rate in constructor_rates.items():
-                function, string = UGenMeta.make_constructor(
+                factory = functools.partial(
+                    UGenMeta.make_constructor,
                     ugen_name=class_name,
                     bases=bases,
                     rate=rate,
@@ -106,8 +108,7 @@ class UGenMeta(abc.ABCMeta):
                     default_channel_count=default_channel_count,
                     has_settable_channel_count=has_settable_channel_count,
                 )
-                namespace[name] = function
-                namespace["_{}_source".format(name)] = string
+                UGenMeta.install(namespace, name, "_{}_source".format(name), factory)
         return super().__new__(metaclass, class_name, bases, namespace)
 
     @staticmethod
@@ -141,6 +142,32 @@ class UGenMeta(abc.ABCMeta):
             raise
         return namespace[object_name]
 
+    @staticmethod
+    def install(namespace, name, source_name, factory):
+        """
+        Installs the function built by `factory` into `namespace` as `name`,
+        and its source as `source_name`.
+
+        In lazy-import mode the function is only built on first access.
+        """
+        if not supriya.lazy_imports:
+            function, string = factory()
+            namespace[name] = function
+            namespace[source_name] = string
+            return
+
+        class DeferredFunction:
+            def __get__(self, instance, owner):
+                function, string = factory()
+                for class_ in owner.__mro__:
+                    if class_.__dict__.get(name) is self:
+                        break
+                setattr(class_, name, function)
+                setattr(class_, source_name, string)
+                return function.__get__(instance, owner)
+
+        namespace[name] = DeferredFunction()
+
     @staticmethod
     def make_constructor(
         ugen_name,
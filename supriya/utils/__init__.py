@@ -4,6 +4,7 @@ Utility functions.
 These will be migrated out into a base package at some point.
 """
 from .flatten_iterable import flatten_iterable  # noqa
+from .get_vars import get_vars  # noqa
 from .group_iterable_by_count import group_iterable_by_count  # noqa
 from .iterate_nwise import iterate_nwise  # noqa
 from .new import new  # noqa
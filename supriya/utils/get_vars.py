@@ -0,0 +1,93 @@
+import inspect
+
+_field_schemas = {}
+
+
+def _get_field_schema(class_):
+    try:
+        return _field_schemas[class_]
+    except KeyError:
+        pass
+    if class_.__new__ is not object.__new__:
+        signature = inspect.signature(class_.__new__)
+    elif class_.__init__ is not object.__init__:
+        signature = inspect.signature(class_.__init__)
+    else:
+        signature = None
+    schema = None
+    if signature is not None:
+        schema = []
+        for i, (name, parameter) in enumerate(signature.parameters.items()):
+            if i == 0 and name in ("self", "cls", "class_", "klass"):
+                continue
+            schema.append((name, "_" + name, parameter.kind, parameter.default))
+        schema = tuple(schema)
+    _field_schemas[class_] = schema
+    return schema
+
+
+def get_vars(expr):
+    """
+    Get `args`, `var args` and `kwargs` for an object `expr`.
+
+    Matches `uqbar.objects.get_vars()`, but inspects each class's signature
+    only once.
+    """
+    schema = _get_field_schema(type(expr))
+    if schema is None:
+        return {}, [], {}
+    args, var_args, kwargs = {}, [], {}
+    if expr is None:
+        return args, var_args, kwargs
+    for name, private_name, kind, default in schema:
+        if kind is inspect.Parameter.POSITIONAL_ONLY:
+            try:
+                args[name] = getattr(expr, name)
+            except AttributeError:
+                args[name] = expr[name]
+        elif (
+            kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+            or kind is inspect.Parameter.KEYWORD_ONLY
+        ):
+            found = False
+            for x in (name, private_name):
+                try:
+                    value = getattr(expr, x)
+                    found = True
+                    break
+                except AttributeError:
+                    try:
+                        value = expr[x]
+                        found = True
+                        break
+                    except (KeyError, TypeError):
+                        pass
+            if not found:
+                raise ValueError("Cannot find value for {!r}".format(name))
+            if default is inspect.Parameter.empty:
+                args[name] = value
+            elif default != value:
+                kwargs[name] = value
+        elif kind is inspect.Parameter.VAR_POSITIONAL:
+            try:
+                value = expr[:]
+            except TypeError:
+                value = getattr(expr, name)
+            if value:
+                var_args.extend(value)
+        elif kind is inspect.Parameter.VAR_KEYWORD:
+            items = {}
+            if hasattr(expr, "items"):
+                items = expr.items()
+            else:
+                for x in (name, private_name):
+                    if hasattr(expr, x):
+                        mapping = getattr(expr, x)
+                        if not isinstance(mapping, dict):
+                            mapping = dict(mapping)
+                        items = mapping.items()
+                        break
+            for key, value in items:
+                if key not in args:
+                    kwargs[key] = value
+    return args, var_args, kwargs
@@ -1,8 +1,32 @@
-import uqbar.objects
+from supriya.utils.get_vars import get_vars
 
 
 def new(expr, *args, **kwargs):
     """
     Template an object.
+
+    Matches `uqbar.objects.new()`, but inspects each class's signature only
+    once.
     """
-    return uqbar.objects.new(expr, *args, **kwargs)
+    current_args, current_var_args, current_kwargs = get_vars(expr)
+    new_kwargs = current_kwargs.copy()
+    recursive_arguments = {}
+    for key in tuple(kwargs):
+        if "__" in key:
+            value = kwargs.pop(key)
+            key, _, subkey = key.partition("__")
+            recursive_arguments.setdefault(key, []).append((subkey, value))
+    for key, pairs in recursive_arguments.items():
+        recursed_object = current_args.get(key, current_kwargs.get(key))
+        if recursed_object is None:
+            continue
+        kwargs[key] = new(recursed_object, **dict(pairs))
+    if args:
+        current_var_args = args
+    for key, value in kwargs.items():
+        if key in current_args:
+            current_args[key] = value
+        else:
+            new_kwargs[key] = value
+    new_args = list(current_args.values()) + list(current_var_args)
+    return type(expr)(*new_args, **new_kwargs)
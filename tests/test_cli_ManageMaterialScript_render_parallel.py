@@ -0,0 +1,166 @@
+import io
+import os
+import threading
+
+import pytest
+import uqbar.io
+import uqbar.strings
+
+import supriya.cli
+import supriya.nonrealtime
+
+
+definition_template = r"""
+import pathlib
+import time
+
+
+class Foo:
+    def __render__(
+        self,
+        output_file_path=None,
+        render_directory_path=None,
+        **kwargs
+        ):
+        time.sleep({delay})
+        {statement}
+        pathlib.Path(output_file_path).write_text('{name}')
+        return pathlib.Path(output_file_path)
+
+material = Foo()
+"""
+
+
+def create_material(cli_paths, name, delay=0.0, statement="pass"):
+    material_path = pytest.helpers.create_cli_material(
+        cli_paths.test_directory_path, name
+    )
+    definition_path = material_path.joinpath("definition.py")
+    definition_path.write_text(
+        uqbar.strings.normalize(
+            definition_template.format(delay=delay, name=name, statement=statement)
+        )
+    )
+    return material_path
+
+
+def test_success(cli_paths):
+    """
+    Transcripts print in matching order, whichever job finishes first.
+    """
+    string_io = io.StringIO()
+    pytest.helpers.create_cli_project(cli_paths.test_directory_path)
+    material_paths = [
+        create_material(cli_paths, "material_one", delay=0.5),
+        create_material(cli_paths, "material_two"),
+        create_material(cli_paths, "material_three"),
+    ]
+    script = supriya.cli.ManageMaterialScript()
+    command = ["--render", "*", "--jobs", "3"]
+    with uqbar.io.RedirectedStreams(stdout=string_io), uqbar.io.DirectoryChange(
+        cli_paths.inner_project_path
+    ):
+        try:
+            script(command)
+        except SystemExit as exception:
+            raise RuntimeError("SystemExit: {}".format(exception.code))
+    pytest.helpers.compare_strings(
+        r"""
+        Render candidates: '*' ...
+        Rendering test_project/materials/material_one/
+            Importing test_project.materials.material_one.definition
+            Python/SC runtime: 0 seconds
+            Rendered test_project/materials/material_one/
+        Rendering test_project/materials/material_three/
+            Importing test_project.materials.material_three.definition
+            Python/SC runtime: 0 seconds
+            Rendered test_project/materials/material_three/
+        Rendering test_project/materials/material_two/
+            Importing test_project.materials.material_two.definition
+            Python/SC runtime: 0 seconds
+            Rendered test_project/materials/material_two/
+        Render times (3 jobs):
+            test_project/materials/material_one/   ... seconds
+            test_project/materials/material_three/ ... seconds
+            test_project/materials/material_two/   ... seconds
+            Total                                  ... seconds (... seconds elapsed)
+        """.replace(
+            "/", os.path.sep
+        ),
+        string_io.getvalue(),
+    )
+    for material_path in material_paths:
+        assert (material_path / "render.aiff").read_text() == material_path.name
+
+
+def test_python_error(cli_paths):
+    """
+    A failing job prints its transcript and exits.
+    """
+    string_io = io.StringIO()
+    pytest.helpers.create_cli_project(cli_paths.test_directory_path)
+    create_material(cli_paths, "material_one")
+    create_material(cli_paths, "material_two", statement="raise TypeError('Fake.')")
+    script = supriya.cli.ManageMaterialScript()
+    command = ["--render", "*", "-j", "2"]
+    with uqbar.io.RedirectedStreams(stdout=string_io), uqbar.io.DirectoryChange(
+        cli_paths.inner_project_path
+    ), pytest.raises(SystemExit) as exception_info:
+        script(command)
+    assert exception_info.value.code == 1
+    pytest.helpers.compare_strings(
+        r"""
+        Render candidates: '*' ...
+        Rendering test_project/materials/material_one/
+            Importing test_project.materials.material_one.definition
+            Python/SC runtime: 0 seconds
+            Rendered test_project/materials/material_one/
+        Rendering test_project/materials/material_two/
+            Importing test_project.materials.material_two.definition
+        Traceback (most recent call last):
+        ...
+        TypeError: Fake.
+        """.replace(
+            "/", os.path.sep
+        ),
+        string_io.getvalue(),
+    )
+
+
+def test_claim_session(cli_paths):
+    """
+    Jobs rendering identical sessions wait for the first claimant.
+    """
+    pytest.helpers.create_cli_project(cli_paths.test_directory_path)
+    script = supriya.cli.ManageMaterialScript()
+    script._setup_paths(cli_paths.inner_project_path)
+    session = supriya.nonrealtime.Session()
+    with session.at(0):
+        session.add_synth(duration=1)
+    claims, lock = {}, threading.Lock()
+    paths = [cli_paths.materials_path / name for name in ("one", "two")]
+    events = []
+
+    def claim(path):
+        with uqbar.io.RedirectedStreams(stdout=io.StringIO()):
+            renderer, _ = script._build_session_renderer(session)
+            with script._claim_session(renderer, path, (claims, lock)) as hash_:
+                events.append((path.name, hash_, dict(claims)))
+
+    renderer, _ = script._build_session_renderer(session)
+    with script._claim_session(renderer, paths[0], (claims, lock)) as session_hash:
+        assert session_hash.startswith("session-")
+        thread = threading.Thread(target=claim, args=(paths[1],))
+        thread.start()
+        thread.join(0.3)
+        assert thread.is_alive()
+        assert not events
+    thread.join()
+    assert events == [
+        (
+            "two",
+            session_hash,
+            {session_hash: os.path.join("test_project", "materials", "two")},
+        )
+    ]
+    assert not claims
@@ -0,0 +1,128 @@
+import random
+
+import pytest
+import uqbar.io
+
+import supriya.commands
+import supriya.osc
+
+
+def make_tree(node_count, include_controls, seed=0):
+    """
+    Makes a random query-tree group, along with the /g_queryTree.reply
+    contents scsynth would send for it.
+    """
+    random_ = random.Random(seed)
+    node_ids = iter(range(1000, 1000 + node_count))
+
+    def recurse(depth):
+        node_id = next(node_ids, None)
+        if node_id is None:
+            return None, []
+        if depth < 4 and random_.random() < 0.2:
+            children, contents = [], []
+            for _ in range(random_.randint(0, 8)):
+                child, child_contents = recurse(depth + 1)
+                if child is None:
+                    break
+                children.append(child)
+                contents.extend(child_contents)
+            group = supriya.commands.QueryTreeGroup(
+                node_id=node_id, children=tuple(children)
+            )
+            return group, [node_id, len(children)] + contents
+        controls = []
+        contents = [node_id, -1, "default"]
+        if include_controls:
+            controls = [
+                supriya.commands.QueryTreeControl(
+                    control_name_or_index=name, control_value=random_.random()
+                )
+                for name in ("amplitude", "frequency", "gate", "out")
+            ]
+            contents.append(len(controls))
+            for control in controls:
+                contents.extend([control.control_name_or_index, control.control_value])
+        synth = supriya.commands.QueryTreeSynth(
+            node_id=node_id, synthdef_name="default", controls=tuple(controls)
+        )
+        return synth, contents
+
+    children, contents = [], []
+    while True:
+        child, child_contents = recurse(0)
+        if child is None:
+            break
+        children.append(child)
+        contents.extend(child_contents)
+    root = supriya.commands.QueryTreeGroup(node_id=0, children=tuple(children))
+    contents = [int(include_controls), 0, len(children)] + contents
+    return root, supriya.osc.OscMessage("/g_queryTree.reply", *contents)
+
+
+def iterate_nodes(node, parent=None):
+    yield node, parent
+    if isinstance(node, supriya.commands.QueryTreeGroup):
+        for child in node:
+            yield from iterate_nodes(child, node)
+
+
+@pytest.mark.parametrize("include_controls", [True, False])
+def test_snapshot(include_controls):
+    root, osc_message = make_tree(500, include_controls)
+    snapshot = supriya.commands.QueryTreeSnapshot.from_osc_message(osc_message)
+    assert len(snapshot) == 501
+    for node, parent in iterate_nodes(root):
+        assert node.node_id in snapshot
+        if parent is None:
+            assert snapshot.get_parent_id(node.node_id) is None
+        else:
+            assert snapshot.get_parent_id(node.node_id) == parent.node_id
+        if isinstance(node, supriya.commands.QueryTreeGroup):
+            assert snapshot.get_synthdef_name(node.node_id) is None
+            assert snapshot.get_children_ids(node.node_id) == tuple(
+                child.node_id for child in node
+            )
+        else:
+            assert snapshot.get_synthdef_name(node.node_id) == "default"
+            assert snapshot.get_controls(node.node_id) == {
+                control.control_name_or_index: control.control_value for control in node
+            }
+    assert snapshot.to_query_tree_group() == root
+
+
+def test_response():
+    root, osc_message = make_tree(100, True)
+    response = supriya.commands.QueryTreeResponse.from_osc_message(osc_message)
+    assert response.node_id == 0
+    assert response.query_tree_snapshot.include_controls
+    assert response._query_tree_group is None
+    assert response.query_tree_group == root
+    assert response.query_tree_group is response.query_tree_group
+    assert str(response) == str(root)
+
+
+def test_synth_root():
+    osc_message = supriya.osc.OscMessage("/g_queryTree.reply", 0, 1000, -1, "default")
+    snapshot = supriya.commands.QueryTreeSnapshot.from_osc_message(osc_message)
+    assert snapshot.to_query_tree_group() == supriya.commands.QueryTreeSynth(
+        node_id=1000, synthdef_name="default", controls=()
+    )
+
+
+@pytest.mark.parametrize("node_count", [1000, 10000])
+def test_benchmark(node_count):
+    root, osc_message = make_tree(node_count, True)
+    with uqbar.io.Timer() as timer:
+        snapshot = supriya.commands.QueryTreeSnapshot.from_osc_message(osc_message)
+    parse_time = timer.elapsed_time
+    with uqbar.io.Timer() as timer:
+        query_tree_group = snapshot.to_query_tree_group()
+    build_time = timer.elapsed_time
+    print(
+        "{} nodes: parse {:.4f}s, build {:.4f}s".format(
+            node_count, parse_time, build_time
+        )
+    )
+    assert len(snapshot) == node_count + 1
+    assert str(query_tree_group) == str(root)
@@ -0,0 +1,106 @@
+import threading
+
+import uqbar.io
+
+import supriya.assets.synthdefs
+import supriya.commands
+import supriya.patterns
+
+
+def make_request_bundle():
+    return supriya.commands.RequestBundle(
+        timestamp=10.5,
+        contents=[
+            supriya.commands.SynthNewRequest(
+                node_id=1000,
+                synthdef=supriya.assets.synthdefs.default,
+                target_node_id=1,
+                amplitude=0.5,
+                frequency=[440, 550],
+            ),
+            supriya.commands.NodeSetRequest(node_id=1000, gate=0, frequency=443.0),
+            supriya.commands.RequestBundle(
+                timestamp=11.0,
+                contents=[supriya.commands.NodeFreeRequest(node_ids=[1000, 1001])],
+            ),
+            supriya.commands.BufferAllocateRequest(
+                buffer_id=23,
+                frame_count=512,
+                channel_count=1,
+                callback=supriya.commands.BufferFreeRequest(buffer_id=23),
+            ),
+        ],
+    )
+
+
+def test_lazy_condition():
+    request = supriya.commands.NodeFreeRequest(node_ids=[1000])
+    request_bundle = supriya.commands.RequestBundle(contents=[request])
+    assert request._condition is None
+    assert request_bundle._condition is None
+    condition = request.condition
+    assert isinstance(condition, type(threading.Condition()))
+    assert request.condition is condition
+    request._set_response("response")
+    assert request.response == "response"
+
+
+def test_to_datagram():
+    request_bundle = make_request_bundle()
+    for realtime in (True, False):
+        assert request_bundle.to_datagram(
+            realtime=realtime
+        ) == request_bundle.to_osc().to_datagram(realtime=realtime)
+    for request in request_bundle.contents:
+        assert request.to_datagram() == request.to_osc().to_datagram()
+
+
+def test_benchmark(pseudo_server):
+    pattern = supriya.patterns.Ppar(
+        [
+            supriya.patterns.Pbind(
+                amplitude=0.1,
+                delta=0.01,
+                duration=0.05,
+                frequency=supriya.patterns.Pseq(range(220 + i, 880, 4)),
+                synthdef=supriya.assets.synthdefs.default,
+            )
+            for i in range(8)
+        ]
+    )
+    timer = uqbar.io.Timer()
+    with timer:
+        request_bundles = []
+        for event_products, _ in supriya.patterns.RealtimeEventPlayer._iterate_outer(
+            pattern, pseudo_server, 0.0, {}
+        ):
+            requests = [
+                request
+                for event_product in event_products
+                for request in event_product.requests
+            ]
+            request_bundles.append(
+                supriya.commands.RequestBundle(
+                    timestamp=event_products[0].timestamp, contents=requests
+                )
+            )
+    request_count = sum(len(x.contents) for x in request_bundles)
+    print(
+        "{} requests built: {:.0f}/s".format(
+            request_count, request_count / timer.elapsed_time
+        )
+    )
+    with timer:
+        for request_bundle in request_bundles:
+            request_bundle.to_osc().to_datagram()
+    message_time = timer.elapsed_time
+    with timer:
+        byte_count = sum(len(x.to_datagram()) for x in request_bundles)
+    print(
+        "{} bytes encoded: via OSC messages {:.0f}/s, directly {:.0f}/s".format(
+            byte_count, byte_count / message_time, byte_count / timer.elapsed_time
+        )
+    )
+    assert [x.to_datagram() for x in request_bundles] == [
+        x.to_osc().to_datagram() for x in request_bundles
+    ]
@@ -0,0 +1,58 @@
+import asyncio
+
+import supriya.commands
+
+
+def test_pipelined_sync(server):
+    requests = [supriya.commands.SyncRequest(sync_id=x) for x in range(1000, 1100)]
+    loop = asyncio.new_event_loop()
+    try:
+        responses = loop.run_until_complete(
+            asyncio.gather(*[request.async_communicate(server) for request in requests])
+        )
+    finally:
+        loop.close()
+    assert [response.sync_id for response in responses] == list(range(1000, 1100))
+    assert all(request.response is not None for request in requests)
+
+
+def test_pipelined_buffer_queries(server):
+    allocations = supriya.commands.RequestBundle(
+        contents=[
+            supriya.commands.BufferAllocateRequest(
+                buffer_id=buffer_id, frame_count=512 + buffer_id, channel_count=1
+            )
+            for buffer_id in range(8)
+        ]
+    )
+    queries = [
+        supriya.commands.BufferQueryRequest(buffer_ids=[buffer_id])
+        for buffer_id in range(8)
+    ]
+
+    async def communicate():
+        await allocations.async_communicate(server)
+        return await asyncio.gather(
+            *[request.async_communicate(server) for request in queries]
+        )
+
+    loop = asyncio.new_event_loop()
+    try:
+        responses = loop.run_until_complete(communicate())
+    finally:
+        loop.close()
+    assert [response.items[0].frame_count for response in responses] == [
+        512 + buffer_id for buffer_id in range(8)
+    ]
+
+
+def test_timeout(server):
+    request = supriya.commands.BufferGetRequest(buffer_id=1023, indices=[0])
+    loop = asyncio.new_event_loop()
+    try:
+        response = loop.run_until_complete(
+            request.async_communicate(server, timeout=0.1)
+        )
+    finally:
+        loop.close()
+    assert response is None
@@ -0,0 +1,159 @@
+import os
+import pathlib
+import time
+from unittest import mock
+
+import pytest
+
+import supriya.nonrealtime
+
+
+@pytest.fixture
+def render_cache(tmpdir):
+    return supriya.nonrealtime.RenderCache(pathlib.Path(tmpdir) / "cache")
+
+
+def make_file(path, size):
+    path.write_bytes(b"\x00" * size)
+    return path
+
+
+def test_store_and_fetch(render_cache, tmpdir):
+    source_path = make_file(pathlib.Path(tmpdir) / "session-abc.aiff", 16)
+    target_path = pathlib.Path(tmpdir) / "target.aiff"
+    assert not render_cache.fetch("session-abc.aiff", target_path)
+    render_cache.store("session-abc.aiff", source_path)
+    assert "session-abc.aiff" in render_cache
+    assert render_cache.fetch("session-abc.aiff", target_path)
+    assert target_path.read_bytes() == source_path.read_bytes()
+    assert render_cache.statistics == supriya.nonrealtime.RenderCache.Statistics(
+        hit_count=1,
+        miss_count=1,
+        store_count=1,
+        eviction_count=0,
+        entry_count=1,
+        total_size=16,
+    )
+    assert not list(render_cache.root_path.glob(".*"))
+
+
+def test_store_and_fetch_copy(render_cache, tmpdir):
+    source_path = make_file(pathlib.Path(tmpdir) / "session-abc.aiff", 16)
+    target_path = pathlib.Path(tmpdir) / "target.aiff"
+    render_cache.store("session-abc.aiff", source_path)
+    assert render_cache.fetch("session-abc.aiff", target_path)
+    for path in (source_path, target_path, render_cache.root_path / "session-abc.aiff"):
+        assert path.stat().st_nlink == 1
+    target_path.write_bytes(b"edited")
+    assert (render_cache.root_path / "session-abc.aiff").read_bytes() == b"\x00" * 16
+
+
+def test_shared_index(render_cache, tmpdir):
+    source_path = make_file(pathlib.Path(tmpdir) / "session-abc.aiff", 16)
+    render_cache.store("session-abc.aiff", source_path)
+    other_render_cache = supriya.nonrealtime.RenderCache(render_cache.root_path)
+    assert len(other_render_cache) == 1
+    assert other_render_cache.fetch(
+        "session-abc.aiff", pathlib.Path(tmpdir) / "target.aiff"
+    )
+    other_render_cache.clear()
+    assert "session-abc.aiff" not in render_cache
+
+
+def test_missing_file(render_cache, tmpdir):
+    source_path = make_file(pathlib.Path(tmpdir) / "session-abc.aiff", 16)
+    render_cache.store("session-abc.aiff", source_path)
+    os.unlink(str(render_cache.root_path / "session-abc.aiff"))
+    assert not render_cache.fetch(
+        "session-abc.aiff", pathlib.Path(tmpdir) / "target.aiff"
+    )
+    assert len(render_cache) == 0
+
+
+def test_least_recently_used_eviction(tmpdir):
+    render_cache = supriya.nonrealtime.RenderCache(
+        pathlib.Path(tmpdir) / "cache", maximum_size=40
+    )
+    for name in ("a", "b", "c"):
+        source_path = make_file(pathlib.Path(tmpdir) / name, 16)
+        render_cache.store(name, source_path)
+        time.sleep(0.01)
+        if name == "b":
+            assert render_cache.fetch("a", pathlib.Path(tmpdir) / "target")
+    assert "a" in render_cache
+    assert "b" not in render_cache
+    assert "c" in render_cache
+    statistics = render_cache.statistics
+    assert statistics.eviction_count == 1
+    assert statistics.total_size == 32
+
+
+def test_maximum_entry_count(tmpdir):
+    render_cache = supriya.nonrealtime.RenderCache(
+        pathlib.Path(tmpdir) / "cache", maximum_entry_count=2
+    )
+    for name in ("a", "b", "c"):
+        render_cache.store(name, make_file(pathlib.Path(tmpdir) / name, 1))
+        time.sleep(0.01)
+    assert len(render_cache) == 2
+    assert "a" not in render_cache
+
+
+def mock_scsynth(command, session_duration, progress=True):
+    pathlib.Path(command.split()[4]).write_bytes(b"audio")
+    return 0
+
+
+def test_session_renderer(nonrealtime_paths):
+    render_cache = supriya.nonrealtime.RenderCache(
+        nonrealtime_paths.test_directory_path / "cache"
+    )
+    mock_path = supriya.nonrealtime.SessionRenderer.__module__
+    mock_path += "._stream_subprocess"
+    transcripts = []
+    for name in ("one", "two"):
+        render_directory_path = nonrealtime_paths.render_directory_path / name
+        render_directory_path.mkdir()
+        renderer = supriya.nonrealtime.SessionRenderer(
+            pytest.helpers.make_test_session(),
+            render_directory_path=render_directory_path,
+        )
+        with mock.patch(mock_path) as call_mock:
+            call_mock.side_effect = mock_scsynth
+            exit_code, transcript, output_file_path = renderer.render(
+                render_cache=render_cache
+            )
+        assert exit_code == 0
+        assert output_file_path.read_bytes() == b"audio"
+        transcripts.append(transcript)
+    assert call_mock.call_count == 0
+    assert transcripts[1][-1].endswith("Output found in render cache.")
+    assert render_cache.statistics.hit_count == 1
+    assert render_cache.statistics.miss_count == 1
+
+
+def test_session_renderer_input_file(nonrealtime_paths):
+    render_cache = supriya.nonrealtime.RenderCache(
+        nonrealtime_paths.test_directory_path / "cache"
+    )
+    input_file_path = nonrealtime_paths.test_directory_path / "input.aiff"
+    mock_path = supriya.nonrealtime.SessionRenderer.__module__
+    mock_path += "._stream_subprocess"
+    call_counts = []
+    for name, input_contents in (("one", b"a"), ("two", b"a"), ("three", b"b")):
+        input_file_path.write_bytes(input_contents)
+        render_directory_path = nonrealtime_paths.render_directory_path / name
+        render_directory_path.mkdir()
+        session = supriya.nonrealtime.Session(input_=input_file_path)
+        with session.at(0):
+            session.add_synth(duration=1)
+        renderer = supriya.nonrealtime.SessionRenderer(
+            session, render_directory_path=render_directory_path
+        )
+        with mock.patch(mock_path) as call_mock:
+            call_mock.side_effect = mock_scsynth
+            renderer.render(render_cache=render_cache)
+        call_counts.append(call_mock.call_count)
+    assert call_counts == [1, 0, 1]
+    assert render_cache.statistics.hit_count == 1
+    assert render_cache.statistics.store_count == 2
@@ -0,0 +1,93 @@
+import pathlib
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+import supriya.nonrealtime
+
+
+def make_fanned_session():
+    session_one = pytest.helpers.make_test_session(multiplier=0.25)
+    session_two = pytest.helpers.make_test_session(multiplier=0.5)
+    session_three = pytest.helpers.make_test_session(multiplier=0.75)
+    outer_session = supriya.nonrealtime.Session(name="outer-session")
+    diskin_synthdef = pytest.helpers.build_diskin_synthdef(channel_count=8)
+    with outer_session.at(0):
+        for session in (session_one, session_two, session_three):
+            buffer_ = outer_session.cue_soundfile(session, duration=10)
+            outer_session.add_synth(
+                synthdef=diskin_synthdef, buffer_id=buffer_, duration=10
+            )
+    return outer_session
+
+
+class MockScsynth:
+    def __init__(self):
+        self.active_count = 0
+        self.commands = []
+        self.lock = threading.Lock()
+        self.maximum_active_count = 0
+
+    def __call__(self, command, session_duration, progress=True):
+        with self.lock:
+            self.active_count += 1
+            self.maximum_active_count = max(
+                self.maximum_active_count, self.active_count
+            )
+            self.commands.append(command)
+        time.sleep(0.1)
+        pathlib.Path(command.split()[4]).write_bytes(b"")
+        with self.lock:
+            self.active_count -= 1
+        return 0
+
+
+def render(render_directory_path, concurrency):
+    render_directory_path.mkdir()
+    renderer = supriya.nonrealtime.SessionRenderer(
+        make_fanned_session(), render_directory_path=render_directory_path
+    )
+    mock_scsynth = MockScsynth()
+    mock_path = supriya.nonrealtime.SessionRenderer.__module__
+    mock_path += "._stream_subprocess"
+    with mock.patch(mock_path, side_effect=mock_scsynth):
+        exit_code, transcript, output_file_path = renderer.render(
+            concurrency=concurrency
+        )
+    return exit_code, transcript, output_file_path, mock_scsynth
+
+
+def test_parallel_transcript_matches_serial(nonrealtime_paths):
+    serial_results = render(nonrealtime_paths.render_directory_path / "serial", None)
+    parallel_results = render(
+        nonrealtime_paths.render_directory_path / "parallel", concurrency=4
+    )
+    assert serial_results[0] == parallel_results[0] == 0
+    assert serial_results[1] == parallel_results[1]
+    assert serial_results[2].name == parallel_results[2].name
+    assert serial_results[3].maximum_active_count == 1
+    assert parallel_results[3].maximum_active_count == 3
+    # The outer session renders last, after its inputs.
+    serial_commands = serial_results[3].commands
+    parallel_commands = parallel_results[3].commands
+    assert sorted(serial_commands[:3]) == sorted(parallel_commands[:3])
+    assert serial_commands[-1] == parallel_commands[-1]
+
+
+def test_parallel_failure(nonrealtime_paths):
+    renderer = supriya.nonrealtime.SessionRenderer(
+        make_fanned_session(),
+        render_directory_path=nonrealtime_paths.render_directory_path,
+    )
+    mock_path = supriya.nonrealtime.SessionRenderer.__module__
+    mock_path += "._stream_subprocess"
+    with pytest.raises(supriya.exceptions.NonrealtimeRenderError), mock.patch(
+        mock_path
+    ) as call_mock:
+        call_mock.return_value = 1
+        renderer.render(concurrency=4)
+    assert call_mock.call_count == 3
+    assert renderer.transcript[-1] == "    SuperCollider errored!"
+    assert renderer.transcript.count("    SuperCollider errored!") == 3
@@ -0,0 +1,120 @@
+import pathlib
+import tracemalloc
+from unittest import mock
+
+import pytest
+
+import supriya.assets.synthdefs
+import supriya.nonrealtime
+
+
+def make_fanned_session():
+    session_one = pytest.helpers.make_test_session(multiplier=0.25)
+    session_two = pytest.helpers.make_test_session(multiplier=0.5)
+    outer_session = supriya.nonrealtime.Session(name="outer-session")
+    diskin_synthdef = pytest.helpers.build_diskin_synthdef(channel_count=8)
+    with outer_session.at(0):
+        for session in (session_one, session_two):
+            buffer_ = outer_session.cue_soundfile(session, duration=10)
+            outer_session.add_synth(
+                synthdef=diskin_synthdef, buffer_id=buffer_, duration=10
+            )
+    return outer_session
+
+
+def make_long_session(synth_count):
+    session = supriya.nonrealtime.Session()
+    for i in range(synth_count):
+        with session.at(i * 0.25):
+            session.add_synth(
+                synthdef=supriya.assets.synthdefs.default, duration=1, frequency=110 + i
+            )
+    return session
+
+
+def mock_scsynth(command, session_duration, progress=True):
+    pathlib.Path(command.split()[4]).write_bytes(b"")
+    return 0
+
+
+def render(session, render_directory_path, stream):
+    render_directory_path.mkdir(exist_ok=True)
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session, render_directory_path=render_directory_path
+    )
+    mock_path = supriya.nonrealtime.SessionRenderer.__module__
+    mock_path += "._stream_subprocess"
+    with mock.patch(mock_path, side_effect=mock_scsynth):
+        return renderer.render(stream=stream)
+
+
+def test_stream_matches_buffered(nonrealtime_paths):
+    session = make_fanned_session()
+    buffered_path = nonrealtime_paths.render_directory_path / "buffered"
+    streamed_path = nonrealtime_paths.render_directory_path / "streamed"
+    buffered_results = render(session, buffered_path, stream=False)
+    streamed_results = render(session, streamed_path, stream=True)
+    assert buffered_results[0] == streamed_results[0] == 0
+    assert buffered_results[1] == streamed_results[1]
+    assert buffered_results[2].name == streamed_results[2].name
+    buffered_osc_paths = sorted(buffered_path.glob("*.osc"))
+    streamed_osc_paths = sorted(streamed_path.glob("*.osc"))
+    assert len(streamed_osc_paths) == 3
+    assert [path.name for path in buffered_osc_paths] == [
+        path.name for path in streamed_osc_paths
+    ]
+    for buffered_osc_path, streamed_osc_path in zip(
+        buffered_osc_paths, streamed_osc_paths
+    ):
+        assert buffered_osc_path.read_bytes() == streamed_osc_path.read_bytes()
+    assert not list(streamed_path.glob(".session-*"))
+
+
+def test_stream_existing_score(nonrealtime_paths):
+    session = make_fanned_session()
+    render_directory_path = nonrealtime_paths.render_directory_path
+    render(session, render_directory_path, stream=True)
+    exit_code, transcript, _ = render(session, render_directory_path, stream=True)
+    assert not exit_code
+    assert (
+        sum("File already exists." in line for line in transcript)
+        == sum(line.startswith("Writing session-") for line in transcript)
+        == 3
+    )
+    assert not list(render_directory_path.glob(".session-*"))
+
+
+def test_stream_memory(nonrealtime_paths):
+    session = make_long_session(2000)
+    peaks = {}
+    for stream in (False, True):
+        renderer = supriya.nonrealtime.SessionRenderer(
+            session, render_directory_path=nonrealtime_paths.render_directory_path
+        )
+        renderer._stream = stream
+        tracemalloc.start()
+        try:
+            renderer._collect_prerender_tuples(session)
+            peaks[stream] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+            renderer._remove_streamed_files()
+    print("peak memory: buffered {}, streamed {}".format(peaks[False], peaks[True]))
+    assert peaks[True] < peaks[False] / 2
+
+
+def test_reused_renderer(nonrealtime_paths):
+    session = make_long_session(8)
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session, render_directory_path=nonrealtime_paths.render_directory_path
+    )
+    mock_path = supriya.nonrealtime.SessionRenderer.__module__
+    mock_path += "._stream_subprocess"
+    with mock.patch(mock_path, side_effect=mock_scsynth):
+        results = [
+            renderer.render(duration=duration, stream=stream)
+            for duration, stream in [(None, True), (None, True), (1, False)]
+        ]
+    assert [result[0] for result in results] == [0, 0, 0]
+    assert results[0][2] == results[1][2] != results[2][2]
+    assert any("File already exists." in line for line in results[1][1])
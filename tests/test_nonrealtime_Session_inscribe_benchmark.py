@@ -0,0 +1,46 @@
+import pytest
+import uqbar.io
+
+import supriya.nonrealtime
+import supriya.patterns
+
+
+def assert_node_trees_are_consistent(session):
+    """
+    Re-derives every state's node tree from scratch, in order, and compares
+    against the incrementally propagated node trees.
+    """
+    previous_state = session.states[session.offsets[0]]
+    for offset in session.offsets[1:]:
+        state = session.states[offset]
+        nodes_to_children, nodes_to_parents = supriya.nonrealtime.State._apply_transitions(
+            state.transitions,
+            previous_state.nodes_to_children,
+            previous_state.nodes_to_parents,
+            state.stop_nodes,
+        )
+        assert state.nodes_to_children == nodes_to_children
+        assert state.nodes_to_parents == nodes_to_parents
+        previous_state = state
+
+
+@pytest.mark.parametrize("event_count", [100, 1000, 10000])
+def test_inscribe(event_count):
+    pattern = supriya.patterns.Pbind(
+        delta=0.125,
+        duration=supriya.patterns.Pseq([0.25, 0.5, 1.0, 2.0], None),
+        frequency=supriya.patterns.Pseq([220, 330, 440], None),
+    )
+    session = supriya.nonrealtime.Session()
+    with session.at(0):
+        group = session.add_group(duration=event_count * 0.125 + 2)
+    with uqbar.io.Timer() as timer:
+        with session.at(0):
+            group.inscribe(pattern, duration=event_count * 0.125)
+    print(
+        "{} events: {:.3f}s, {} states".format(
+            event_count, timer.elapsed_time, len(session.offsets)
+        )
+    )
+    assert event_count - 16 < len(session.nodes) - 1 <= event_count
+    assert_node_trees_are_consistent(session)
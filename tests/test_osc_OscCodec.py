@@ -0,0 +1,172 @@
+import enum
+import struct
+import time
+
+import pytest
+
+import supriya.osc
+from supriya.osc import OscBundle, OscCodec, OscMessage
+
+
+def pad(datagram):
+    return datagram + b"\x00" * (-len(datagram) % 4)
+
+
+def encode_reference_value(value):
+    """
+    Encodes `value` one argument at a time, as a reference for the codec.
+    """
+    if hasattr(value, "to_datagram"):
+        value = bytearray(value.to_datagram())
+    elif isinstance(value, enum.Enum):
+        value = value.value
+    if isinstance(value, bytearray):
+        return "b", pad(struct.pack(">i", len(value)) + value)
+    elif isinstance(value, str):
+        return "s", pad(value.encode("utf-8") + b"\x00")
+    elif isinstance(value, bool):
+        return "T" if value else "F", b""
+    elif isinstance(value, float):
+        return "f", struct.pack(">f", value)
+    elif isinstance(value, int):
+        return "i", struct.pack(">i", value)
+    elif value is None:
+        return "N", b""
+    type_tags, encoded_value = "[", b""
+    for x in value:
+        sub_type_tags, sub_encoded_value = encode_reference_value(x)
+        type_tags += sub_type_tags
+        encoded_value += sub_encoded_value
+    return type_tags + "]", encoded_value
+
+
+def encode_reference_message(osc_message):
+    type_tags, encoded_contents = ",", b""
+    for argument in osc_message.contents:
+        sub_type_tags, encoded_value = encode_reference_value(argument)
+        type_tags += sub_type_tags
+        encoded_contents += encoded_value
+    return (
+        encode_reference_value(osc_message.address)[1]
+        + encode_reference_value(type_tags)[1]
+        + encoded_contents
+    )
+
+
+class Color(enum.IntEnum):
+    RED = 1
+    BLUE = 2
+
+
+osc_messages = [
+    OscMessage("/g_new", 0, 0),
+    OscMessage(2),
+    OscMessage("/status"),
+    OscMessage("/n_set", 1000, "frequency", 443.0, "amplitude", 0.25),
+    OscMessage("/s_new", "default", 1001, 0, 1, "out", 0, "amplitude", 0.5),
+    OscMessage("/c_setn", 0, 8, *[float(x) for x in range(8)]),
+    OscMessage("/ffff", False, True, None, "", "abc", "abcd"),
+    OscMessage("/foo", ["a", "b", ["c", 1, 2.5]], 3),
+    OscMessage("/enum", Color.BLUE, 1.5),
+    OscMessage("/d_recv", bytearray(b"SCgf\x00\x00\x00\x02\x00\x01abc")),
+    OscMessage(
+        "/foo",
+        1,
+        OscBundle(
+            contents=(
+                OscMessage("/bar", "baz", 3.0),
+                OscMessage("/ffff", False, True, None),
+            )
+        ),
+        OscMessage("/nested", 4),
+    ),
+]
+
+
+@pytest.mark.parametrize("osc_message", osc_messages)
+def test_encode_message(osc_message):
+    assert osc_message.to_datagram() == encode_reference_message(osc_message)
+
+
+def test_encode_message_bytes():
+    assert OscMessage("/g_new", 0, 0).to_datagram() == (
+        b"/g_new\x00\x00,ii\x00" b"\x00\x00\x00\x00" b"\x00\x00\x00\x00"
+    )
+    assert OscMessage("/ffff", False, True, None, 1.5, "abcd").to_datagram() == (
+        b"/ffff\x00\x00\x00,FTNfs\x00\x00" b"?\xc0\x00\x00" b"abcd\x00\x00\x00\x00"
+    )
+
+
+@pytest.mark.parametrize(
+    "osc_message", [x for x in osc_messages if isinstance(x.address, str)]
+)
+def test_decode_message(osc_message):
+    datagram = encode_reference_message(osc_message)
+    assert OscCodec.decode_message(datagram) == osc_message
+    assert OscCodec.decode_message(bytearray(datagram)) == osc_message
+    assert OscCodec.decode_message(memoryview(datagram)) == osc_message
+
+
+def test_bundle_round_trip():
+    OscCodec._structs.clear()
+    osc_bundle = OscBundle(
+        timestamp=1401557034.5,
+        contents=(
+            OscBundle(contents=(OscMessage("/one", 1), OscMessage("/two", 2.0))),
+            *[x for x in osc_messages if isinstance(x.address, str)],
+        ),
+    )
+    datagram = osc_bundle.to_datagram()
+    assert OscBundle.datagram_is_bundle(datagram)
+    assert OscBundle.from_datagram(datagram) == osc_bundle
+    buffer_ = bytearray(len(datagram) + 64)
+    buffer_[: len(datagram)] = datagram
+    assert OscCodec.decode_bundle(memoryview(buffer_), len(datagram)) == osc_bundle
+    assert OscCodec.decode_bundle(memoryview(datagram)[: len(datagram)]) == osc_bundle
+    # Structs are cached per message, never per bundle.
+    assert all(x.size < len(datagram) for x in OscCodec._structs.values())
+    assert OscBundle(contents=osc_messages).to_datagram(realtime=False)[8:16] == (
+        b"\x00\x00\x00\x00\x00\x00\x00\x01"
+    )
+
+
+def test_unencodable():
+    with pytest.raises(TypeError):
+        OscMessage("/foo", object()).to_datagram()
+
+
+def test_benchmark():
+    iterations = 2000
+    osc_message = OscMessage(
+        "/s_new",
+        "default",
+        1001,
+        0,
+        1,
+        "amplitude",
+        0.25,
+        "frequency",
+        440.0,
+        "pan",
+        0.0,
+        "out",
+        0,
+    )
+    datagram = encode_reference_message(osc_message)
+    encode_times = {}
+    for name, encode in [
+        ("reference", encode_reference_message),
+        ("codec", OscMessage.to_datagram),
+    ]:
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            encode(osc_message)
+        encode_times[name] = time.perf_counter() - start_time
+        print("{}: {:.0f} encodes/s".format(name, iterations / encode_times[name]))
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        OscCodec.decode_message(datagram)
+    decode_time = time.perf_counter() - start_time
+    print("codec: {:.0f} decodes/s".format(iterations / decode_time))
+    assert encode_times["codec"] < encode_times["reference"]
+    assert supriya.osc.OscMessage.from_datagram(datagram) == osc_message
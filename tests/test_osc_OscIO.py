@@ -0,0 +1,114 @@
+import configparser
+import socket
+import time
+
+import pytest
+
+import supriya
+import supriya.osc
+import supriya.realtime
+
+
+@pytest.fixture
+def peer():
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    peer.settimeout(1)
+    yield peer
+    peer.close()
+
+
+def wait_for(predicate, timeout=2):
+    start_time = time.time()
+    while not predicate() and time.time() - start_time < timeout:
+        time.sleep(0.01)
+
+
+def test_pooled_receiver(peer):
+    osc_io = supriya.osc.OscIO(port=peer.getsockname()[1], worker_count=4)
+    addresses = ("/n_go", "/done", "/n_end", "/synced")
+    received = []
+    for address_ in addresses:
+        osc_io.register(pattern=address_, procedure=received.append)
+    osc_io.boot()
+    try:
+        osc_io.send(supriya.osc.OscMessage("/notify", 1))
+        datagram, address = peer.recvfrom(1024)
+        assert supriya.osc.OscMessage.from_datagram(datagram) == (
+            supriya.osc.OscMessage("/notify", 1)
+        )
+        for node_id in range(1000, 1050):
+            for address_ in addresses:
+                message = supriya.osc.OscMessage(address_, node_id, 1, -1, -1, 0)
+                peer.sendto(message.to_datagram(), address)
+        wait_for(lambda: len(received) == 200)
+    finally:
+        osc_io.quit()
+    assert [(x.address, x.contents[0]) for x in received] == [
+        (address_, node_id) for node_id in range(1000, 1050) for address_ in addresses
+    ]
+    assert osc_io.dropped_count == 0
+    assert not osc_io.is_running
+
+
+def test_pooled_receiver_drops_meter_replies(peer):
+    osc_io = supriya.osc.OscIO(port=peer.getsockname()[1], worker_count=2, queue_size=1)
+    meter_replies, received = [], []
+
+    def procedure(message):
+        time.sleep(0.05)
+        meter_replies.append(message)
+
+    osc_io.register(pattern="/meter.inputs", procedure=procedure, droppable=True)
+    osc_io.register(pattern="/reply", procedure=received.append)
+    osc_io.register(pattern="/synced", procedure=received.append)
+    assert osc_io.droppable_addresses == {"/meter.inputs"}
+    osc_io.boot()
+    try:
+        osc_io.send(supriya.osc.OscMessage("/notify", 1))
+        _, address = peer.recvfrom(1024)
+        for i in range(50):
+            message = supriya.osc.OscMessage("/meter.inputs", 1000, i, 0.5, 0.25)
+            peer.sendto(message.to_datagram(), address)
+            if i % 10 == 0:
+                message = supriya.osc.OscMessage("/reply", 1000, i, 0.5)
+                peer.sendto(message.to_datagram(), address)
+        peer.sendto(supriya.osc.OscMessage("/synced", 1).to_datagram(), address)
+        wait_for(lambda: any(x.address == "/synced" for x in received), timeout=5)
+        wait_for(lambda: len(meter_replies) + osc_io.dropped_count == 50)
+        assert osc_io.receiver.received_count == 56
+    finally:
+        osc_io.quit()
+    # Trigger replies are never dropped, and meter replies stay in order.
+    assert [x.contents[1] for x in received[:-1]] == [0, 10, 20, 30, 40]
+    assert received[-1] == supriya.osc.OscMessage("/synced", 1)
+    assert osc_io.receiver is None
+    assert osc_io.dropped_count > 0
+    assert len(meter_replies) + osc_io.dropped_count == 50
+    indices = [x.contents[1] for x in meter_replies]
+    assert indices == sorted(indices)
+
+
+def test_from_config(monkeypatch):
+    monkeypatch.setattr(supriya, "config", configparser.ConfigParser())
+    osc_io = supriya.osc.OscIO.from_config()
+    assert osc_io.worker_count is None
+    assert osc_io.queue_size == 1024
+    supriya.config.read_dict(
+        {"core": {"osc_worker_count": "2", "osc_queue_size": "16"}}
+    )
+    osc_io = supriya.osc.OscIO.from_config()
+    assert osc_io.worker_count == 2
+    assert osc_io.queue_size == 16
+    osc_io = supriya.osc.OscIO.from_config(worker_count=3)
+    assert osc_io.worker_count == 3
+    assert osc_io.queue_size == 16
+
+
+def test_server_options():
+    server = supriya.realtime.Server(port=57999, osc_worker_count=2, osc_queue_size=8)
+    try:
+        assert server.osc_io.worker_count == 2
+        assert server.osc_io.queue_size == 8
+    finally:
+        supriya.realtime.Server._servers.pop((server.ip_address, server.port))
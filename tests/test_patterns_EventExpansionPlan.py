@@ -0,0 +1,149 @@
+import collections
+import uuid
+
+import pytest
+import uqbar.io
+
+import supriya.assets.synthdefs
+import supriya.patterns
+
+synth_uuid = uuid.uuid4()
+group_uuid = uuid.uuid4()
+
+uuids = {synth_uuid: {1001: None, 1000: None}, group_uuid: ("a", "b", "c")}
+
+
+def reference_expand(settings, synthdef, uuids, synth_parameters_only=False):
+    settings = settings.copy()
+    for key, value in settings.items():
+        if isinstance(value, uuid.UUID) and value in uuids:
+            value = uuids[value]
+            if isinstance(value, dict):
+                value = sorted(value)[0]
+            if not isinstance(value, collections.Sequence):
+                value = [value]
+            settings[key] = value
+    maximum_length = 1
+    unexpanded_settings = {}
+    for key, value in settings.items():
+        if isinstance(value, collections.Sequence):
+            maximum_length = max(len(value), maximum_length)
+            unexpanded_settings[key] = value
+        else:
+            unexpanded_settings[key] = [value]
+    expanded_settings = []
+    for i in range(maximum_length):
+        settings = {}
+        for key, value in unexpanded_settings.items():
+            settings[key] = value[i % len(value)]
+        expanded_settings.append(settings)
+    if synth_parameters_only:
+        parameter_names = synthdef.metadata.parameter_names
+        for i, dictionary in enumerate(expanded_settings):
+            expanded_settings[i] = {
+                key: value
+                for key, value in dictionary.items()
+                if key in parameter_names
+            }
+    return expanded_settings
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {},
+        {"amplitude": 0.5, "frequency": 440},
+        {"amplitude": 0.5, "foo": "bar", "frequency": [440, 550, 660]},
+        {"amplitude": [0.1, 0.2], "frequency": (440, 550, 660), "pan": [-1]},
+        {"add_action": None, "out": synth_uuid, "target_node": group_uuid},
+        {"frequency": 440, "out": uuid.uuid4()},
+    ],
+)
+@pytest.mark.parametrize("synth_parameters_only", [True, False])
+def test_expand(settings, synth_parameters_only):
+    synthdef = supriya.assets.synthdefs.default
+    event = supriya.patterns.NullEvent()
+    expected = reference_expand(
+        settings, synthdef, uuids, synth_parameters_only=synth_parameters_only
+    )
+    actual = event._expand(
+        settings, synthdef, uuids, synth_parameters_only=synth_parameters_only
+    )
+    assert actual == expected
+    assert [list(x) for x in actual] == [list(x) for x in expected]
+    plan = supriya.patterns.EventExpansionPlan.from_settings(settings, synthdef)
+    rows = plan.expand(settings, uuids)
+    expected = reference_expand(settings, synthdef, uuids)
+    assert len(rows) == len(expected)
+    for row, dictionary in zip(rows, expected):
+        assert row == tuple(dictionary.values())
+        assert plan.get_parameters(row) == tuple(
+            sorted(
+                (key, value)
+                for key, value in dictionary.items()
+                if key in synthdef.metadata.parameter_names
+            )
+        )
+        assert plan.get_add_action(row) == dictionary.get("add_action")
+        assert plan.get_target_node(row) == dictionary.get("target_node")
+
+
+def test_from_settings():
+    synthdef = supriya.assets.synthdefs.default
+    plan = supriya.patterns.EventExpansionPlan.from_settings(
+        {"frequency": 440, "amplitude": 0.5}, synthdef
+    )
+    assert plan.keys == ("frequency", "amplitude")
+    assert plan.parameter_names == ("amplitude", "frequency")
+    assert plan.synthdef is synthdef
+    assert plan is supriya.patterns.EventExpansionPlan.from_settings(
+        {"frequency": [220, 330], "amplitude": 0.25}, synthdef
+    )
+    assert plan is not supriya.patterns.EventExpansionPlan.from_settings(
+        {"amplitude": 0.25, "frequency": [220, 330]}, synthdef
+    )
+    assert plan is not supriya.patterns.EventExpansionPlan.from_settings(
+        {"frequency": 440, "amplitude": 0.5}, supriya.assets.synthdefs.test
+    )
+
+
+def test_benchmark():
+    synthdef = supriya.assets.synthdefs.default
+    events = [
+        supriya.patterns.NoteEvent(
+            amplitude=0.1,
+            duration=0.5,
+            foo=1,
+            frequency=[440 + i, 550 + i],
+            pan=-0.5,
+            synthdef=synthdef,
+        )
+        for i in range(5000)
+    ]
+    timer = uqbar.io.Timer()
+    with timer:
+        for event in events:
+            for dictionary in reference_expand(event.settings, synthdef, {}):
+                add_action = dictionary.pop("add_action")
+                target_node = dictionary.pop("target_node")
+                {
+                    key: value
+                    for key, value in dictionary.items()
+                    if key in synthdef.metadata.parameter_names
+                }
+    reference_time = timer.elapsed_time
+    with timer:
+        for event in events:
+            plan = supriya.patterns.EventExpansionPlan.from_settings(
+                event.settings, synthdef
+            )
+            for row in plan.expand(event.settings, {}):
+                add_action = plan.get_add_action(row)
+                target_node = plan.get_target_node(row)
+                plan.get_parameters(row)
+    print(
+        "{} events expanded: reference {:.3f}s, planned {:.3f}s".format(
+            len(events), reference_time, timer.elapsed_time
+        )
+    )
+    assert add_action is None and target_node is None
@@ -0,0 +1,76 @@
+import itertools
+import random
+
+import numpy
+import pytest
+import uqbar.io
+
+import supriya.patterns
+
+
+patterns = [
+    supriya.patterns.Pseq([1, 2, 3], repetitions=None),
+    supriya.patterns.Pseq([1, 2.5, 3], repetitions=4),
+    supriya.patterns.Pwhite(),
+    supriya.patterns.Pwhite(10, -10, repetitions=20),
+    supriya.patterns.Prand([1, 2, 3, 4], repetitions=None),
+    supriya.patterns.Prand([0.5, 1], repetitions=30),
+    supriya.patterns.Pwhite() * supriya.patterns.Pwhite(),
+    supriya.patterns.Pwhite(0, 10, repetitions=15) + supriya.patterns.Prand([1, -1]),
+    (
+        supriya.patterns.Pseq([1, 2, 3], repetitions=None)
+        * supriya.patterns.Prand([1, -1], repetitions=None)
+        - supriya.patterns.Pwhite(0, 3)
+    ),
+    supriya.patterns.Pseq([2, 3], None) ** supriya.patterns.Pseq([-1, 2], None),
+    supriya.patterns.Pbinop(supriya.patterns.Pwhite(1, 10), "//", 3),
+    supriya.patterns.Pbinop(100, "/", supriya.patterns.Pwhite(1, 10)),
+    supriya.patterns.Pwhite() + supriya.patterns.Pseed(supriya.patterns.Pwhite()),
+    supriya.patterns.Pseq([supriya.patterns.Pwhite(repetitions=3), 1], None),
+    supriya.patterns.Pwhite([0, 1], 2),
+]
+
+
+@pytest.mark.parametrize("pattern", patterns)
+@pytest.mark.parametrize("seed", [None, 0, 23])
+@pytest.mark.parametrize("count", [0, 1, 1000])
+def test_take(pattern, seed, count):
+    if seed is not None:
+        pattern = supriya.patterns.Pseed(pattern, seed=seed)
+    random.seed(0)
+    expected = list(itertools.islice(pattern, count))
+    expected_state = random.getstate()
+    random.seed(0)
+    actual = pattern.take(count)
+    assert isinstance(actual, numpy.ndarray)
+    assert len(actual) == len(expected)
+    assert (actual == numpy.array(expected)).all()
+    if seed is not None:
+        assert (pattern.take(count) == actual).all()
+    elif count <= len(expected):
+        assert random.getstate() == expected_state
+
+
+@pytest.mark.parametrize("seeded", [False, True])
+def test_benchmark(seeded):
+    pattern = (
+        supriya.patterns.Pwhite(0, 12)
+        + supriya.patterns.Pseq([48, 52, 55], None)
+        + supriya.patterns.Prand([0, 12, 24], None)
+    ) * 2
+    if seeded:
+        pattern = supriya.patterns.Pseed(pattern)
+    count = 100000
+    with uqbar.io.Timer() as timer:
+        expected = list(itertools.islice(pattern, count))
+    iteration_time = timer.elapsed_time
+    with uqbar.io.Timer() as timer:
+        actual = pattern.take(count)
+    take_time = timer.elapsed_time
+    print(
+        "seeded: {}, iterate {:.4f}s, take {:.4f}s".format(
+            seeded, iteration_time, take_time
+        )
+    )
+    if seeded:
+        assert (actual == expected).all()
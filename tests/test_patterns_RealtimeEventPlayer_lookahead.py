@@ -0,0 +1,187 @@
+import time
+import types
+
+import uqbar.io
+
+import supriya.assets.synthdefs
+import supriya.commands
+import supriya.patterns
+import supriya.realtime
+
+
+def make_server(latency=0.1):
+    server = types.SimpleNamespace(
+        audio_bus_allocator=supriya.realtime.BlockAllocator(),
+        control_bus_allocator=supriya.realtime.BlockAllocator(),
+        is_running=True,
+        latency=latency,
+        node_id_allocator=supriya.realtime.NodeIdAllocator(),
+        sent=[],
+    )
+    server.send_message = lambda message, datagram=None: server.sent.append(
+        (message, datagram)
+    )
+    return server
+
+
+def make_pattern(repetitions=1):
+    return supriya.patterns.Pbus(
+        supriya.patterns.Pbind(
+            delta=0.25,
+            duration=supriya.patterns.Pseq([0.5, 1.0], None),
+            frequency=supriya.patterns.Pseq([440, 550, 660], repetitions),
+            synthdef=supriya.assets.synthdefs.default,
+        )
+    )
+
+
+def play(player, timestamp, communicate=True):
+    results, delta = [], True
+    while delta is not None:
+        result = player(timestamp, timestamp, communicate=communicate)
+        if not communicate:
+            result, delta = result
+            results.append((result.to_list(True), delta))
+        else:
+            delta = result
+        if delta is not None:
+            timestamp += delta
+    return results
+
+
+def test_equivalence():
+    timestamp = time.time()
+    pattern = make_pattern()
+    expected = play(
+        supriya.patterns.RealtimeEventPlayer(pattern, server=make_server()),
+        timestamp,
+        communicate=False,
+    )
+    actual = play(
+        supriya.patterns.RealtimeEventPlayer(
+            pattern, server=make_server(), lookahead=1.0, queue_size=4
+        ),
+        timestamp,
+        communicate=False,
+    )
+    assert actual == expected
+
+
+def test_send():
+    timestamp = time.time() - 10.0
+    server = make_server()
+    player = supriya.patterns.RealtimeEventPlayer(
+        make_pattern(), server=server, lookahead=1.0
+    )
+    play(player, timestamp)
+    expected_server = make_server()
+    play(
+        supriya.patterns.RealtimeEventPlayer(make_pattern(), server=expected_server),
+        timestamp,
+    )
+    assert len(server.sent) == len(expected_server.sent)
+    for (bundle, datagram), (expected_bundle, _) in zip(
+        server.sent, expected_server.sent
+    ):
+        assert datagram == bundle.to_datagram()
+        assert abs(bundle.timestamp - expected_bundle.timestamp) < 1e-6
+        assert [x.to_list() for x in bundle.contents] == [
+            x.to_list() for x in expected_bundle.contents
+        ]
+    assert server.sent[0][0].timestamp == timestamp + 0.1
+    # Every bundle is sent well after its timestamp, and only the first one
+    # had to wait for the rendering thread.
+    statistics = player.statistics
+    assert statistics.bundle_count == len(server.sent)
+    assert statistics.late_count == len(server.sent)
+    assert statistics.maximum_lateness >= statistics.mean_lateness > 9.0
+    assert statistics.retimed_count == 0
+    assert statistics.underrun_count <= 1
+    player.reset_statistics()
+    assert player.statistics.bundle_count == 0
+
+
+def test_retimed():
+    timestamp = time.time()
+    server = make_server()
+    player = supriya.patterns.RealtimeEventPlayer(
+        make_pattern(), server=server, lookahead=1.0
+    )
+    delta = player(timestamp, timestamp)
+    player(timestamp, timestamp + delta * 2)
+    assert player.statistics.retimed_count == 1
+    bundle, datagram = server.sent[-1]
+    assert datagram is None
+    assert bundle.timestamp == timestamp + delta * 2 + 0.1
+    player.stop()
+
+
+def test_stop():
+    timestamp = time.time()
+    server = make_server()
+    pattern = supriya.patterns.Pbind(
+        delta=0.25, duration=0.5, frequency=supriya.patterns.Pseq([440, 550], None)
+    )
+    player = supriya.patterns.RealtimeEventPlayer(
+        pattern, server=server, lookahead=5.0, queue_size=8
+    )
+    player(timestamp, timestamp)
+    while not player._lookahead_queue.full():
+        time.sleep(0.01)
+    started_node_ids = [
+        request.node_id
+        for request in server.sent[0][0].contents
+        if isinstance(request, supriya.commands.SynthNewRequest)
+    ]
+    assert len(started_node_ids) == 1
+    rendered_node_ids = player._lookahead_unsent_node_ids.copy()
+    assert len(rendered_node_ids) >= 8
+    player.stop()
+    assert player._lookahead_thread is None
+    assert player._lookahead_queue.empty()
+    bundle, datagram = server.sent[-1]
+    assert datagram is None
+    # The synth actually sent is freed, but not those pre-rendered since.
+    (request,) = bundle.contents
+    assert isinstance(request, supriya.commands.NodeFreeRequest)
+    assert request.node_ids[0] == started_node_ids[0]
+    assert not rendered_node_ids.intersection(request.node_ids)
+
+
+def test_benchmark():
+    pattern = supriya.patterns.Ppar(
+        [
+            supriya.patterns.Pbind(
+                amplitude=0.1,
+                delta=0.01,
+                duration=0.05,
+                frequency=supriya.patterns.Pseq(range(220 + i, 880, 8)),
+                synthdef=supriya.assets.synthdefs.default,
+            )
+            for i in range(8)
+        ]
+    )
+    timestamp = time.time() + 60.0
+    timer = uqbar.io.Timer()
+    with timer:
+        play(
+            supriya.patterns.RealtimeEventPlayer(pattern, server=make_server()),
+            timestamp,
+        )
+    reference_time = timer.elapsed_time
+    server = make_server()
+    player = supriya.patterns.RealtimeEventPlayer(
+        pattern, server=server, lookahead=120.0, queue_size=1000
+    )
+    player._start_rendering(timestamp)
+    while player._lookahead_thread.is_alive():
+        time.sleep(0.01)
+    with timer:
+        play(player, timestamp)
+    print(
+        "{} bundles: sent on the clock thread in {:.3f}s synchronously, "
+        "{:.3f}s pre-rendered".format(
+            len(server.sent), reference_time, timer.elapsed_time
+        )
+    )
+    assert player.statistics.retimed_count == 0
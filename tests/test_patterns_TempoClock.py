@@ -0,0 +1,137 @@
+import time
+import uuid
+
+import supriya.patterns
+
+
+class Event:
+    def __init__(self, manifest, delta=None, save_execution_time=False):
+        self.count = 0
+        self.delta = delta
+        self.manifest = manifest
+        self.save_execution_time = save_execution_time
+
+    def __call__(self, execution_time, scheduled_time):
+        self.count += 1
+        if self.save_execution_time:
+            self.manifest.append((execution_time, scheduled_time))
+        else:
+            self.manifest.append(scheduled_time)
+        if self.count == 4:
+            return
+        if self.delta:
+            return self.delta
+        return 0.1 * self.count
+
+
+def test_01():
+    """
+    Incremental deltas.
+    """
+    manifest = []
+    event = Event(manifest)
+    clock = supriya.patterns.TempoClock()
+    now = clock.schedule(event)
+    time.sleep(1.0)
+    clock.stop()
+    assert [round(_ - now, 6) for _ in manifest] == [0.0, 0.1, 0.3, 0.6]
+
+
+def test_02():
+    """
+    Interleaved (preempting) events.
+    """
+    manifest = []
+    event_a = Event(manifest, delta=0.25)
+    event_b = Event(manifest, delta=0.1)
+    clock = supriya.patterns.TempoClock(batch_window=0.0)
+    now = clock.schedule(event_a)
+    clock.schedule(event_b, now + 0.1, absolute=True)
+    time.sleep(1.0)
+    clock.stop()
+    assert [round(_ - now, 6) for _ in manifest] == [
+        0.0,
+        0.1,
+        0.2,
+        0.25,
+        0.3,
+        0.4,
+        0.5,
+        0.75,
+    ]
+
+
+def test_03():
+    """
+    Beat-based scheduling follows the tempo.
+    """
+    manifest = []
+    event = Event(manifest, delta=1)
+    clock = supriya.patterns.TempoClock(tempo=240)
+    beat = clock.schedule_beats(event, 1)
+    time.sleep(1.5)
+    clock.stop()
+    assert [round(clock.time_to_beats(_) - beat, 6) for _ in manifest] == [
+        1.0,
+        2.0,
+        3.0,
+        4.0,
+    ]
+    assert round(manifest[-1] - manifest[0], 6) == 0.75
+
+
+def test_04():
+    """
+    Changing the tempo reschedules beat-based procedures.
+    """
+    manifest = []
+    event = Event(manifest, delta=1)
+    clock = supriya.patterns.TempoClock(tempo=60)
+    clock.schedule_beats(event, 1)
+    clock.tempo = 600
+    time.sleep(0.5)
+    clock.stop()
+    assert len(manifest) == 4
+    assert round(manifest[-1] - manifest[0], 6) == 0.3
+
+
+def test_05():
+    """
+    Canceling and resetting.
+    """
+    manifest = []
+    registry_key = uuid.uuid4()
+    event_a = Event(manifest, delta=0.25)
+    event_b = Event(manifest, delta=0.25)
+    clock = supriya.patterns.TempoClock()
+    now = clock.schedule(event_a, registry_key=registry_key)
+    clock.schedule(event_b, now + 0.1, absolute=True)
+    time.sleep(0.4)
+    clock.cancel(registry_key)
+    time.sleep(0.1)
+    clock.reset()
+    time.sleep(0.4)
+    clock.stop()
+    assert [round(_ - now, 6) for _ in manifest] == [0.0, 0.1, 0.25, 0.35]
+
+
+def test_06():
+    """
+    Procedures due within the batch window execute together, and lateness
+    is tracked.
+    """
+    manifest = []
+    event_a = Event(manifest, delta=0.2, save_execution_time=True)
+    event_b = Event(manifest, delta=0.2, save_execution_time=True)
+    clock = supriya.patterns.TempoClock(batch_window=0.05)
+    now = clock.schedule(event_a, 0.1)
+    clock.schedule(event_b, now + 0.12, absolute=True)
+    time.sleep(1.0)
+    clock.stop()
+    assert len(manifest) == 8
+    for (execution_a, _), (execution_b, _) in zip(manifest[::2], manifest[1::2]):
+        assert abs(execution_b - execution_a) < 0.01
+    statistics = clock.statistics
+    assert statistics.event_count == 8
+    assert statistics.late_count <= statistics.event_count
+    assert statistics.maximum_lateness < 0.05
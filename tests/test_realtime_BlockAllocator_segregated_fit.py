@@ -0,0 +1,139 @@
+import random
+import time
+
+import pytest
+
+import supriya.realtime
+
+
+def test_01():
+
+    allocator = supriya.realtime.BlockAllocator(
+        heap_minimum=0, heap_maximum=16, strategy="segregated-fit"
+    )
+
+    assert allocator.allocate(4) == 0
+    assert allocator.allocate(4) == 4
+    assert allocator.allocate(4) == 8
+    assert allocator.allocate(4) == 12
+    assert allocator.allocate(4) is None
+
+    allocator.free(0)
+    allocator.free(4)
+    allocator.free(8)
+    allocator.free(12)
+
+    assert allocator.allocate(20) is None
+    assert allocator.report_fragmentation().free_block_count == 1
+
+    assert allocator.allocate_at(4, 2) == 4
+    assert allocator.allocate_at(5, 2) is None
+    assert allocator.allocate(4) == 0
+    assert allocator.allocate(4) == 6
+
+    allocator.free(4)
+
+    assert allocator.allocate(1) == 4
+    assert allocator.allocate(1) == 5
+
+
+def test_02():
+    """
+    Blocks in the floor size class are used when nothing larger is free.
+    """
+    allocator = supriya.realtime.BlockAllocator(
+        heap_maximum=12, strategy="segregated-fit"
+    )
+    assert allocator.allocate(5) == 0
+    assert allocator.allocate(1) == 5
+    assert allocator.allocate(6) == 6
+    allocator.free(0)
+    assert allocator.allocate(7) is None
+    assert allocator.allocate(5) == 0
+
+
+def test_03():
+    """
+    Unbounded heaps.
+    """
+    allocator = supriya.realtime.BlockAllocator(strategy="segregated-fit")
+    assert allocator.allocate(1000) == 0
+    assert allocator.allocate(1) == 1000
+    allocator.free(0)
+    assert allocator.allocate(2000) == 1001
+    assert allocator.allocate(10) == 0
+    assert allocator.allocate_at(5000, 10) == 5000
+
+
+@pytest.mark.parametrize("strategy", ["first-fit", "segregated-fit"])
+def test_random_churn(strategy):
+    """
+    Allocated blocks never overlap, and freeing everything coalesces the heap
+    back into a single block.
+    """
+    random_ = random.Random(0)
+    allocator = supriya.realtime.BlockAllocator(
+        heap_minimum=16, heap_maximum=1024, strategy=strategy
+    )
+    used_blocks = {}
+    for _ in range(2000):
+        if used_blocks and random_.random() < 0.5:
+            block_id = random_.choice(sorted(used_blocks))
+            allocator.free(block_id)
+            del used_blocks[block_id]
+            continue
+        size = random_.choice([1, 2, 2, 4, 8, 16, 3, 5])
+        block_id = allocator.allocate(size)
+        if block_id is None:
+            continue
+        assert 16 <= block_id and block_id + size <= 1024
+        for other_id, other_size in used_blocks.items():
+            assert block_id + size <= other_id or other_id + other_size <= block_id
+        used_blocks[block_id] = size
+    report = allocator.report_fragmentation()
+    assert report.used_block_count == len(used_blocks)
+    assert report.used_size == sum(used_blocks.values())
+    assert report.free_size + report.used_size == 1024 - 16
+    for block_id in used_blocks:
+        allocator.free(block_id)
+    assert allocator.report_fragmentation() == (
+        supriya.realtime.BlockAllocator.FragmentationReport(
+            free_block_count=1,
+            free_size=1024 - 16,
+            largest_free_block_size=1024 - 16,
+            used_block_count=0,
+            used_size=0,
+            fragmentation=0.0,
+        )
+    )
+
+
+def test_benchmark():
+    """
+    Churns bus group and buffer group sized allocations, the way pattern
+    players do, keeping a few thousand allocations live.
+    """
+    for strategy in ("first-fit", "segregated-fit"):
+        random_ = random.Random(0)
+        allocator = supriya.realtime.BlockAllocator(
+            heap_maximum=16384, strategy=strategy
+        )
+        live_ids = []
+        start_time = time.perf_counter()
+        for i in range(6000):
+            block_id = allocator.allocate(random_.choice([1, 2, 2, 4, 8, 16, 32]))
+            if block_id is not None:
+                live_ids.append(block_id)
+            if 2000 < len(live_ids):
+                allocator.free(live_ids.pop(random_.randrange(len(live_ids))))
+        elapsed_time = time.perf_counter() - start_time
+        report = allocator.report_fragmentation()
+        print(
+            "{}: {:.0f} operations/s, {} free blocks, {:.2f} fragmentation".format(
+                strategy,
+                (6000 + len(live_ids)) / elapsed_time,
+                report.free_block_count,
+                report.fragmentation,
+            )
+        )
+        assert report.used_block_count == len(live_ids)
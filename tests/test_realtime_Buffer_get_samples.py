@@ -0,0 +1,113 @@
+import array
+
+import numpy
+import pytest
+import uqbar.io
+
+import supriya.exceptions
+import supriya.realtime
+
+
+def test_float_wav(tmp_path):
+    samples = numpy.linspace(-1, 1, 64, dtype=numpy.float32)
+    file_path = str(tmp_path / "test.wav")
+    supriya.realtime.Buffer._write_float_wav(file_path, samples, 2, 44100)
+    file_samples, channel_count = supriya.realtime.Buffer._read_float_wav(file_path)
+    assert channel_count == 2
+    assert isinstance(file_samples, numpy.memmap)
+    assert (file_samples == samples).all()
+
+
+def test_iterate_chunks():
+    assert list(supriya.realtime.Buffer._iterate_chunks(3, 10, 4)) == [
+        (3, 4),
+        (7, 4),
+        (11, 2),
+    ]
+
+
+@pytest.mark.parametrize("via_file", [False, True])
+def test_round_trip(server, via_file):
+    buffer_ = supriya.realtime.Buffer().allocate(channel_count=2, frame_count=10000)
+    samples = numpy.random.RandomState(0).uniform(-1, 1, 20000).astype("float32")
+    buffer_.set_samples(samples, via_file=via_file)
+    assert (buffer_.get_samples(via_file=via_file) == samples).all()
+    assert (
+        buffer_.get_samples(start=100, count=5000, via_file=via_file)
+        == samples[100:5100]
+    ).all()
+    buffer_.set_samples(samples[:1000].reshape(500, 2), start=2000, via_file=via_file)
+    expected = samples.copy()
+    expected[2000:3000] = samples[:1000]
+    assert (buffer_.get_samples(via_file=via_file) == expected).all()
+    buffer_.free()
+
+
+def test_out(server):
+    buffer_ = supriya.realtime.Buffer().allocate(frame_count=5000)
+    buffer_.set_samples(numpy.arange(5000, dtype=numpy.float32))
+    out = array.array("f", [0.0] * 4000)
+    assert buffer_.get_samples(start=1000, out=out, chunk_size=100) is out
+    assert out == array.array("f", range(1000, 5000))
+    out = numpy.zeros(6000, dtype=numpy.float64)
+    buffer_.get_samples(out=out, count=5000)
+    assert (out[:5000] == numpy.arange(5000)).all()
+    assert not out[5000:].any()
+    buffer_.free()
+
+
+def test_errors(server):
+    buffer_ = supriya.realtime.Buffer().allocate(frame_count=8)
+    with pytest.raises(IndexError):
+        buffer_.get_samples(start=4, count=8)
+    with pytest.raises(IndexError):
+        buffer_.set_samples([0.0] * 9)
+    with pytest.raises(ValueError):
+        buffer_.get_samples(count=8, out=numpy.zeros(4))
+    buffer_.free()
+    with pytest.raises(supriya.exceptions.BufferNotAllocated):
+        buffer_.get_samples()
+    with pytest.raises(supriya.exceptions.BufferNotAllocated):
+        buffer_.set_samples([0.0])
+
+
+def test_buffer_group(server):
+    buffer_group = supriya.realtime.BufferGroup(buffer_count=3)
+    buffer_group.allocate(frame_count=5000)
+    buffer_group.set_samples(
+        [numpy.full(5000, i, dtype=numpy.float32) for i in range(3)]
+    )
+    for i, samples in enumerate(buffer_group.get_samples()):
+        assert (samples == i).all()
+    buffer_group.free()
+
+
+@pytest.mark.timeout(120)
+@pytest.mark.parametrize("via_file", [False, True])
+def test_benchmark(server, via_file):
+    sample_count = 44100 * 10
+    buffer_ = supriya.realtime.Buffer().allocate(frame_count=sample_count)
+    samples = numpy.random.RandomState(0).uniform(-1, 1, sample_count)
+    with uqbar.io.Timer() as timer:
+        buffer_.set_samples(samples, via_file=via_file)
+    set_time = timer.elapsed_time
+    with uqbar.io.Timer() as timer:
+        result = buffer_.get_samples(via_file=via_file)
+    get_time = timer.elapsed_time
+    chunk_size = supriya.realtime.Buffer._default_chunk_size
+    with uqbar.io.Timer() as timer:
+        for index in range(0, sample_count, chunk_size):
+            buffer_.get_contiguous([(index, min(chunk_size, sample_count - index))])
+    baseline_time = timer.elapsed_time
+    print(
+        "{} samples, via file: {}: set {:.0f}/s, get {:.0f}/s, "
+        "get_contiguous() {:.0f}/s".format(
+            sample_count,
+            via_file,
+            sample_count / set_time,
+            sample_count / get_time,
+            sample_count / baseline_time,
+        )
+    )
+    assert (result == samples.astype("float32")).all()
+    buffer_.free()
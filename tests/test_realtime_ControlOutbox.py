@@ -0,0 +1,135 @@
+import time
+
+import pytest
+import uqbar.io
+
+import supriya.assets.synthdefs
+import supriya.commands
+import supriya.osc
+import supriya.realtime
+
+
+def get_sent_messages(transcript):
+    return [message for label, message in transcript if label == "S"]
+
+
+@pytest.fixture
+def outbox(server):
+    outbox = server.control_outbox
+    outbox.reset_metrics()
+    yield outbox
+    outbox.disable()
+
+
+def test_build_requests():
+    outbox = supriya.realtime.ControlOutbox(supriya.realtime.Server())
+    requests = outbox._build_requests(
+        {1000: {"amplitude": 0.5, "frequency": 443.0}, 1001: {"gate": 0.0}},
+        {3: 0.3, 0: 0.0, 1: 0.1, 5: 0.5},
+    )
+    assert [request.to_osc() for request in requests] == [
+        supriya.osc.OscMessage(15, 1000, "amplitude", 0.5, "frequency", 443.0),
+        supriya.osc.OscMessage(15, 1001, "gate", 0.0),
+        supriya.osc.OscMessage(26, 0, 2, 0.0, 0.1, 3, 1, 0.3, 5, 1, 0.5),
+    ]
+
+
+def test_disabled(server, outbox):
+    synth = supriya.realtime.Synth().allocate()
+    with server.osc_io.capture() as transcript:
+        synth["frequency"] = 443
+    assert get_sent_messages(transcript) == [
+        supriya.osc.OscBundle(
+            contents=(
+                supriya.osc.OscMessage(15, 1000, "frequency", 443.0),
+                supriya.osc.OscMessage(52, 0),
+            )
+        )
+    ]
+    assert not outbox.enqueued_message_count
+
+
+def test_coalescing(server, outbox):
+    outbox.enable(window=10)
+    synth_a = supriya.realtime.Synth().allocate()
+    synth_b = supriya.realtime.Synth().allocate()
+    bus_group = supriya.realtime.BusGroup.control(4).allocate()
+    with server.osc_io.capture() as transcript:
+        for i in range(10):
+            synth_a["frequency"] = 440 + i
+            synth_a.controls["amplitude"].set(i / 10)
+            synth_b["frequency", "amplitude"] = 220 + i, 0.5
+            bus_group[0].set(i)
+            bus_group[2:].set((i, -i))
+        assert not get_sent_messages(transcript)
+        assert synth_a["frequency"] == 449.0
+        assert bus_group[3].value == -9.0
+        outbox.flush()
+    assert get_sent_messages(transcript) == [
+        supriya.osc.OscBundle(
+            contents=(
+                supriya.osc.OscMessage(
+                    15, synth_a.node_id, "amplitude", 0.9, "frequency", 449.0
+                ),
+                supriya.osc.OscMessage(
+                    15, synth_b.node_id, "amplitude", 0.5, "frequency", 229.0
+                ),
+                supriya.osc.OscMessage(
+                    26, bus_group.bus_id, 1, 9.0, bus_group.bus_id + 2, 2, 9.0, -9.0
+                ),
+            )
+        )
+    ]
+    assert outbox.enqueued_message_count == 50
+    assert outbox.coalesced_message_count == 47
+    assert outbox.sent_message_count == 3
+    assert outbox.sent_bundle_count == 1
+
+
+def test_window(server, outbox):
+    outbox.enable(window=0.05)
+    synth = supriya.realtime.Synth().allocate()
+    with server.osc_io.capture() as transcript:
+        synth["frequency"] = 443
+        synth["frequency"] = 444
+        assert not get_sent_messages(transcript)
+        time.sleep(0.2)
+    assert get_sent_messages(transcript) == [
+        supriya.osc.OscMessage(15, 1000, "frequency", 444.0)
+    ]
+
+
+def test_ordering(server, outbox):
+    outbox.enable(window=10)
+    synth = supriya.realtime.Synth().allocate()
+    with server.osc_io.capture() as transcript:
+        synth["frequency"] = 443
+        synth.free()
+    assert get_sent_messages(transcript) == [
+        supriya.osc.OscMessage(15, 1000, "frequency", 443.0),
+        supriya.osc.OscMessage(11, 1000),
+    ]
+
+
+@pytest.mark.timeout(60)
+def test_benchmark(server, outbox):
+    synth = supriya.realtime.Synth(synthdef=supriya.assets.synthdefs.default)
+    synth.allocate()
+    for enabled in (False, True):
+        if enabled:
+            outbox.enable()
+        outbox.reset_metrics()
+        with server.osc_io.capture() as transcript:
+            with uqbar.io.Timer() as timer:
+                for i in range(1000):
+                    synth["frequency"] = 440 + i
+                outbox.flush()
+        print(
+            "enabled: {}, {:.4f}s, {} messages sent, {} coalesced".format(
+                enabled,
+                timer.elapsed_time,
+                len(get_sent_messages(transcript)),
+                outbox.coalesced_message_count,
+            )
+        )
+        assert synth["frequency"] == 1439.0
@@ -0,0 +1,159 @@
+import os
+import pathlib
+
+import numpy
+import pytest
+import uqbar.io
+
+import supriya.soundfiles
+
+try:
+    import wavefile  # type: ignore
+except ImportError:
+    pass
+
+
+formats = [
+    ("wav", "PCM_U8"),
+    ("wav", "PCM_16"),
+    ("wav", "PCM_24"),
+    ("wav", "PCM_32"),
+    ("wav", "FLOAT"),
+    ("wav", "DOUBLE"),
+    ("wavex", "PCM_24"),
+    ("aiff", "PCM_S8"),
+    ("aiff", "PCM_16"),
+    ("aiff", "PCM_24"),
+    ("aiff", "PCM_32"),
+    ("aiff", "FLOAT"),
+    ("aiff", "DOUBLE"),
+    ("flac", "PCM_16"),
+]
+
+
+def write_soundfile(file_path, header_format, sample_format, frame_count=1001):
+    samples = (
+        numpy.random.RandomState(0)
+        .uniform(-1, 1, (3, frame_count))
+        .astype(numpy.float32)
+    )
+    format_ = getattr(wavefile.Format, header_format.upper()) | getattr(
+        wavefile.Format, sample_format
+    )
+    with wavefile.WaveWriter(
+        str(file_path), channels=3, samplerate=48000, format=format_
+    ) as writer:
+        writer.write(samples)
+    with wavefile.WaveReader(str(file_path)) as reader:
+        buffer_ = reader.buffer(reader.frames)
+        frame_count = reader.read(buffer_)
+    return buffer_[:, :frame_count].transpose()
+
+
+@pytest.mark.parametrize("header_format, sample_format", formats)
+def test_read(tmpdir, header_format, sample_format):
+    file_path = pathlib.Path(tmpdir) / "test.{}".format(header_format)
+    expected = write_soundfile(file_path, header_format, sample_format)
+    soundfile = supriya.soundfiles.SoundFile(file_path)
+    assert soundfile.is_memory_mapped == (header_format != "flac")
+    assert len(soundfile) == len(expected)
+    actual = soundfile[:]
+    assert actual.dtype == numpy.float32
+    assert (actual == expected).all()
+    assert (soundfile[::-3] == expected[::-3]).all()
+    assert (soundfile[-100:5:-7, 1] == expected[-100:5:-7, 1]).all()
+    assert (soundfile[-1] == expected[-1]).all()
+    assert soundfile.at_frame(17) == expected[17].tolist()
+    assert soundfile.at_percent(1) == expected[-1].tolist()
+    assert (soundfile.slice_seconds(0.001, 0.002) == expected[48:96]).all()
+    with pytest.raises(IndexError):
+        soundfile[len(expected)]
+
+
+def test_read_blocks(tmpdir, monkeypatch):
+    file_path = pathlib.Path(tmpdir) / "test.flac"
+    expected = write_soundfile(file_path, "flac", "PCM_16")
+    soundfile = supriya.soundfiles.SoundFile(file_path)
+    monkeypatch.setattr(type(soundfile), "_read_block_size", 64)
+    assert not soundfile.is_memory_mapped
+    assert (soundfile[:] == expected).all()
+    assert (soundfile[3:900:5] == expected[3:900:5]).all()
+    assert (soundfile[10::100] == expected[10::100]).all()
+    assert (soundfile[-1:0:-63, 2] == expected[-1:0:-63, 2]).all()
+
+
+@pytest.mark.parametrize("header_format, sample_format", formats[1:2] + formats[-1:])
+def test_overview(tmpdir, header_format, sample_format):
+    file_path = pathlib.Path(tmpdir) / "test.{}".format(header_format)
+    frames = write_soundfile(file_path, header_format, sample_format, 100000)
+    soundfile = supriya.soundfiles.SoundFile(file_path)
+    overview = soundfile.overview
+    assert os.path.exists(overview.cache_file_path)
+    assert overview.level_count == 6
+    for width, start_frame, stop_frame in [
+        (25, 0, 102400),
+        (16, 1024, 17408),
+        (10, 500, 530),
+        (7, 0, 100000),
+    ]:
+        stop_frame = min(stop_frame, len(frames))
+        minima, maxima, rms = overview.query(width, start_frame, stop_frame)
+        assert minima.shape == maxima.shape == rms.shape == (width, 3)
+        pixel_size = (stop_frame - start_frame) / width
+        if pixel_size % 256 and 256 < pixel_size:
+            # Pixels snap to overview blocks
+            assert (minima <= frames[start_frame:stop_frame].max(axis=0)).all()
+            continue
+        for i in range(width):
+            pixel = frames[
+                start_frame
+                + int(i * pixel_size) : start_frame
+                + int((i + 1) * pixel_size)
+            ]
+            assert (minima[i] == pixel.min(axis=0)).all()
+            assert (maxima[i] == pixel.max(axis=0)).all()
+            assert numpy.allclose(
+                rms[i], numpy.sqrt(numpy.square(pixel, dtype="f8").mean(axis=0))
+            )
+    cached_overview = supriya.soundfiles.SoundFileOverview(soundfile)
+    for expected, actual in zip(overview.query(100), cached_overview.query(100)):
+        assert (expected == actual).all()
+    write_soundfile(file_path, header_format, sample_format, 50000)
+    soundfile = supriya.soundfiles.SoundFile(file_path)
+    minima, maxima, rms = soundfile.overview.query(1)
+    assert (minima[0] == soundfile[:].min(axis=0)).all()
+
+
+def test_benchmark(tmpdir):
+    file_path = pathlib.Path(tmpdir) / "test.wav"
+    write_soundfile(file_path, "wav", "PCM_24", 44100 * 60)
+    soundfile = supriya.soundfiles.SoundFile(file_path)
+    frames = range(0, soundfile.frame_count, soundfile.frame_count // 1000)
+    with uqbar.io.Timer() as timer:
+        expected = []
+        for frame in frames:
+            with wavefile.WaveReader(soundfile.file_path) as reader:
+                reader.seek(frame)
+                expected.append(next(reader.read_iter(size=1)).transpose().tolist()[0])
+    reopen_time = timer.elapsed_time
+    with uqbar.io.Timer() as timer:
+        actual = [soundfile.at_frame(frame) for frame in frames]
+    mapped_time = timer.elapsed_time
+    with uqbar.io.Timer() as timer:
+        sliced = soundfile[:: soundfile.frame_count // 1000]
+    sliced_time = timer.elapsed_time
+    with uqbar.io.Timer() as timer:
+        overview = supriya.soundfiles.SoundFileOverview(soundfile)
+    build_time = timer.elapsed_time
+    with uqbar.io.Timer() as timer:
+        for _ in range(100):
+            supriya.soundfiles.SoundFileOverview(soundfile).query(1000)
+    query_time = timer.elapsed_time / 100
+    print(
+        "1000 frames: reopen {:.4f}s, at_frame {:.4f}s, slice {:.4f}s; "
+        "overview: build {:.4f}s, cached query {:.4f}s".format(
+            reopen_time, mapped_time, sliced_time, build_time, query_time
+        )
+    )
+    assert actual == expected == sliced[: len(expected)].tolist()
+    assert overview.query(1000)[0].shape == (1000, 3)
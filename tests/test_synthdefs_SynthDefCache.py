@@ -0,0 +1,89 @@
+import pathlib
+
+import pytest
+
+import supriya.assets.synthdefs
+import supriya.synthdefs
+import supriya.ugens
+
+
+@pytest.fixture
+def synthdef_cache(tmpdir):
+    return supriya.synthdefs.SynthDefCache(pathlib.Path(tmpdir))
+
+
+def make_builder(frequency=440, multiplier=0.5):
+    with supriya.synthdefs.SynthDefBuilder(
+        frequency=frequency, gate=1, out=0
+    ) as builder:
+        source = supriya.ugens.SinOsc.ar(frequency=builder["frequency"])
+        source *= supriya.ugens.Linen.kr(gate=builder["gate"], done_action=2)
+        supriya.ugens.Out.ar(bus=builder["out"], source=source * multiplier)
+    return builder
+
+
+def test_hit(synthdef_cache):
+    synthdef_one = make_builder().build(cache=synthdef_cache)
+    assert (synthdef_cache.hit_count, synthdef_cache.miss_count) == (0, 1)
+    synthdef_two = make_builder().build(cache=synthdef_cache)
+    assert (synthdef_cache.hit_count, synthdef_cache.miss_count) == (1, 1)
+    assert synthdef_two is not synthdef_one
+    assert synthdef_two == synthdef_one
+    assert str(synthdef_two) == str(synthdef_one)
+    assert synthdef_two.parameters == synthdef_one.parameters
+    assert synthdef_two.anonymous_name == synthdef_one.anonymous_name
+    key = synthdef_cache.hash_builder(make_builder())
+    scsyndef_path = synthdef_cache.root_path / "{}.scsyndef".format(key)
+    assert scsyndef_path.read_bytes() == synthdef_one.compile()
+    assert [path.name for path in synthdef_cache.root_path.iterdir()] == [
+        scsyndef_path.name
+    ]
+
+
+def test_corrupt_entry(synthdef_cache):
+    make_builder().build(cache=synthdef_cache)
+    key = synthdef_cache.hash_builder(make_builder())
+    (synthdef_cache.root_path / "{}.scsyndef".format(key)).write_bytes(b"junk")
+    assert synthdef_cache.get(key) is None
+    assert make_builder().build(cache=synthdef_cache) == make_builder().build(
+        cache=False
+    )
+
+
+def test_shared_across_instances(synthdef_cache):
+    synthdef = make_builder().build(name="test", cache=synthdef_cache)
+    other_synthdef_cache = supriya.synthdefs.SynthDefCache(synthdef_cache.root_path)
+    assert make_builder().build(name="test", cache=other_synthdef_cache) == synthdef
+    assert other_synthdef_cache.hit_count == 1
+    other_synthdef_cache.clear()
+    make_builder().build(name="test", cache=synthdef_cache)
+    assert synthdef_cache.miss_count == 2
+
+
+def test_keys(synthdef_cache):
+    key = synthdef_cache.hash_builder(make_builder())
+    assert key == synthdef_cache.hash_builder(make_builder())
+    assert key != synthdef_cache.hash_builder(make_builder(), name="foo")
+    assert key != synthdef_cache.hash_builder(make_builder(), optimize=False)
+    assert key != synthdef_cache.hash_builder(make_builder(frequency=443))
+    assert key != synthdef_cache.hash_builder(make_builder(multiplier=0.25))
+
+
+def test_untokenizable(synthdef_cache):
+    with pytest.raises(TypeError):
+        synthdef_cache._tokenize(object(), {})
+    builder = make_builder()
+    builder._parameters["frequency"]._value = object()
+    assert synthdef_cache.hash_builder(builder) is None
+
+
+def test_bypass(synthdef_cache):
+    make_builder().build(cache=synthdef_cache)
+    make_builder().build(cache=False)
+    assert synthdef_cache.hit_count == 0
+
+
+def test_anonymous_name():
+    synthdef = supriya.assets.synthdefs.default
+    anonymous_name = synthdef.anonymous_name
+    assert synthdef.anonymous_name is anonymous_name
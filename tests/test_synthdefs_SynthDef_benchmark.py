@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+import supriya.synthdefs
+import supriya.ugens
+
+
+def build_graph(ugen_count):
+    with supriya.synthdefs.SynthDefBuilder(frequency=440, out=0) as builder:
+        sources = [
+            supriya.ugens.SinOsc.ar(frequency=builder["frequency"] * (i + 1))
+            for i in range(max(1, ugen_count // 3))
+        ]
+        supriya.ugens.Out.ar(bus=builder["out"], source=supriya.ugens.Mix.new(sources))
+    return builder
+
+
+@pytest.mark.parametrize("ugen_count", [10, 100, 1000, 10000])
+def test_benchmark(ugen_count):
+    start_time = time.perf_counter()
+    builder = build_graph(ugen_count)
+    graph_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    synthdef = builder.build()
+    build_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    compiled_synthdef = synthdef.compile()
+    compile_time = time.perf_counter() - start_time
+    print(
+        "{} ugens: graph {:.3f}s, build {:.3f}s, compile {:.3f}s".format(
+            len(synthdef.ugens), graph_time, build_time, compile_time
+        )
+    )
+    # Each SinOsc branch multiplies the frequency, and is summed by Mix.
+    assert len(synthdef.ugens) >= ugen_count * 2 // 3
+    decompiled_synthdef = supriya.synthdefs.SynthDefDecompiler.decompile_synthdef(
+        compiled_synthdef
+    )
+    assert decompiled_synthdef.compile() == compiled_synthdef
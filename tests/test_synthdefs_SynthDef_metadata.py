@@ -0,0 +1,116 @@
+import hashlib
+import types
+
+import pytest
+import uqbar.io
+
+import supriya.assets.synthdefs
+import supriya.patterns
+import supriya.realtime
+import supriya.synthdefs
+import supriya.ugens
+
+
+def build_synthdef():
+    with supriya.synthdefs.SynthDefBuilder(
+        amplitude=0.1, frequency=440, gate=1, out=0, pan=0
+    ) as builder:
+        envelope = supriya.ugens.EnvGen.kr(
+            done_action=2,
+            envelope=supriya.synthdefs.Envelope.asr(),
+            gate=builder["gate"],
+        )
+        source = (
+            supriya.ugens.SinOsc.ar(frequency=builder["frequency"])
+            * builder["amplitude"]
+            * envelope
+        )
+        supriya.ugens.Out.ar(
+            bus=builder["out"],
+            source=supriya.ugens.Pan2.ar(source=source, position=builder["pan"]),
+        )
+    return builder.build()
+
+
+@pytest.mark.parametrize(
+    "synthdef",
+    [
+        supriya.assets.synthdefs.default,
+        supriya.assets.synthdefs.test,
+        supriya.assets.synthdefs.system_link_audio_2,
+        build_synthdef(),
+    ],
+)
+def test_metadata(synthdef):
+    metadata = synthdef.metadata
+    assert isinstance(metadata, supriya.synthdefs.SynthDef.Metadata)
+    assert metadata is synthdef.metadata
+    md5 = hashlib.md5()
+    md5.update(synthdef._compiled_ugen_graph)
+    assert metadata.anonymous_name == synthdef.anonymous_name == md5.hexdigest()
+    assert metadata.actual_name == (synthdef.name or md5.hexdigest())
+    parameter_names = {parameter.name for _, parameter in synthdef.indexed_parameters}
+    assert metadata.parameter_names == parameter_names
+    assert isinstance(metadata.parameter_names, frozenset)
+    assert metadata.has_gate is ("gate" in parameter_names)
+    assert list(metadata.done_actions) == synthdef.done_actions
+    assert synthdef.audio_output_channel_count == metadata.audio_output_channel_count
+    with pytest.raises(AttributeError):
+        metadata.has_gate = False
+
+
+def test_ambiguous_channel_counts():
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        supriya.ugens.Out.ar(source=supriya.ugens.In.ar(bus=0, channel_count=2))
+        supriya.ugens.Out.ar(bus=2, source=supriya.ugens.In.ar(bus=4))
+    synthdef = builder.build()
+    assert synthdef.metadata.audio_input_channel_count is None
+    assert synthdef.metadata.audio_output_channel_count is None
+    assert synthdef.metadata.control_output_channel_count == 0
+    with pytest.raises(ValueError):
+        synthdef.audio_input_channel_count
+    with pytest.raises(ValueError):
+        synthdef.audio_output_channel_count
+
+
+def test_benchmark():
+    synthdef = build_synthdef()
+    timer = uqbar.io.Timer()
+    with timer:
+        for _ in range(10000):
+            parameter_names = [
+                parameter.name for _, parameter in synthdef.indexed_parameters
+            ]
+            "frequency" in parameter_names
+            "gate" in parameter_names
+    reference_time = timer.elapsed_time
+    with timer:
+        for _ in range(10000):
+            "frequency" in synthdef.metadata.parameter_names
+            synthdef.metadata.has_gate
+    print(
+        "10000 lookups: rebuilt {:.3f}s, precomputed {:.3f}s".format(
+            reference_time, timer.elapsed_time
+        )
+    )
+    events = [
+        supriya.patterns.NoteEvent(
+            amplitude=0.1,
+            duration=0.5,
+            foo=1,
+            frequency=[440 + i, 550 + i],
+            pan=-0.5,
+            synthdef=synthdef,
+        )
+        for i in range(1000)
+    ]
+    server = types.SimpleNamespace(node_id_allocator=supriya.realtime.NodeIdAllocator())
+    uuids = {}
+    with timer:
+        for i, event in enumerate(events):
+            for event_product in event._perform_realtime(
+                index=i, server=server, timestamp=i, uuids=uuids
+            ):
+                for request in event_product.requests:
+                    request.to_datagram()
+    print("1000 events expanded: {:.3f}s".format(timer.elapsed_time))
@@ -0,0 +1,70 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+
+def run_python(code, lazy_imports):
+    environment = os.environ.copy()
+    environment["SUPRIYA_LAZY_IMPORTS"] = "1" if lazy_imports else "0"
+    return subprocess.check_output(
+        [sys.executable, "-c", code],
+        cwd=str(pathlib.Path(__file__).parent.parent),
+        env=environment,
+        universal_newlines=True,
+    ).strip()
+
+
+def test_import_benchmark():
+    code = (
+        "import time; start_time = time.perf_counter(); import supriya; "
+        "print(time.perf_counter() - start_time)"
+    )
+    elapsed_times = {}
+    for lazy_imports in (False, True):
+        run_python(code, lazy_imports)  # Warm up any bytecode caches.
+        elapsed_times[lazy_imports] = min(
+            float(run_python(code, lazy_imports)) for _ in range(3)
+        )
+        print(
+            "lazy_imports={}: {:.3f}s".format(lazy_imports, elapsed_times[lazy_imports])
+        )
+    assert elapsed_times[True] < elapsed_times[False]
+
+
+def test_nothing_loaded_eagerly():
+    code = (
+        "import sys, supriya; "
+        "print(sorted(name for name in sys.modules "
+        "if name.startswith('supriya.ugens.')))"
+    )
+    assert run_python(code, True) == "[]"
+    assert run_python(code, False) != "[]"
+    # Nor are the bundled SynthDefs, or the ugens they are built from.
+    code = (
+        "import sys, supriya.assets.synthdefs; "
+        "print(sorted(name for name in sys.modules "
+        "if name.startswith(('supriya.assets.synthdefs.', 'supriya.ugens.'))))"
+    )
+    assert run_python(code, True) == "[]"
+    assert run_python(code, False) != "[]"
+
+
+def test_member_access():
+    code = (
+        "import supriya.ugens, supriya.ugens.UGen; "
+        "print(supriya.ugens.UGen.__name__, supriya.ugens.SinOsc.__name__, "
+        "'SinOsc' in dir(supriya.ugens), hasattr(supriya.ugens, 'Foo'))"
+    )
+    assert run_python(code, True) == "UGen SinOsc True False"
+
+
+def test_compiled_synthdefs_match():
+    code = (
+        "import supriya.assets.synthdefs, supriya.synthdefs; "
+        "print(supriya.assets.synthdefs.default.compile().hex()); "
+        "print(supriya.assets.synthdefs.system_link_audio_2.compile().hex()); "
+        "print(len([name for name in dir(supriya.assets.synthdefs) "
+        "if name.startswith('system_')]))"
+    )
+    assert run_python(code, True) == run_python(code, False)
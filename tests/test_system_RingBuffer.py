@@ -0,0 +1,104 @@
+import threading
+
+import numpy
+import pytest
+import uqbar.io
+
+import supriya.osc
+import supriya.realtime
+import supriya.system
+
+
+def test_wraparound():
+    ring_buffer = supriya.system.RingBuffer(capacity=5, width=2)
+    assert ring_buffer.latest().shape == (0, 2)
+    for i in range(13):
+        ring_buffer.append((i, i * 10))
+        expected = [[j, j * 10] for j in range(max(0, i - 4), i + 1)]
+        assert ring_buffer.latest().tolist() == expected
+        assert ring_buffer.latest(3).tolist() == expected[-3:]
+        assert ring_buffer.latest(0).shape == (0, 2)
+    assert len(ring_buffer) == 5
+    assert ring_buffer.write_count == 13
+    ring_buffer.clear()
+    assert len(ring_buffer) == 0
+    assert ring_buffer.latest().shape == (0, 2)
+
+
+@pytest.mark.parametrize(
+    "peak_hold, expected",
+    [(False, [[2, -3], [5, 0], [8, -3]]), (True, [[2, -3], [5, 0], [8, -1]])],
+)
+def test_decimation(peak_hold, expected):
+    ring_buffer = supriya.system.RingBuffer(
+        capacity=8, decimation=3, peak_hold=peak_hold, width=2
+    )
+    write_counts = []
+    for i in range(10):
+        ring_buffer.append((i, -abs(i - 5)))
+        write_counts.append(ring_buffer.write_count)
+    assert write_counts == [0, 0, 1, 1, 1, 2, 2, 2, 3, 3]
+    assert ring_buffer.latest().tolist() == expected
+
+
+def test_threads():
+    ring_buffer = supriya.system.RingBuffer(capacity=64, width=4)
+
+    def write():
+        for i in range(2000):
+            ring_buffer.append((i, i, i, i))
+
+    threads = [threading.Thread(target=write) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        rows = ring_buffer.latest(16)
+        # Rows are never torn between concurrent writes.
+        assert (rows == rows[:, :1]).all()
+    for thread in threads:
+        thread.join()
+    assert ring_buffer.write_count == 8000
+
+
+def test_server_meters():
+    meters = supriya.realtime.ServerMeters(supriya.realtime.Server())
+    meters._input_meter_history = supriya.system.RingBuffer(width=4)
+    meters._output_meter_history = supriya.system.RingBuffer(
+        decimation=2, peak_hold=True, width=4
+    )
+    for i in range(6):
+        message = supriya.osc.OscMessage("/meter.inputs", 1000, -1, i, 0.5, 0.25, i)
+        meters._handle_input_levels(message)
+        message = supriya.osc.OscMessage("/meter.outputs", 1001, -1, i, 0.5, 6 - i, i)
+        meters._handle_output_levels(message)
+    assert meters.to_dict()["server_meters"]["input_meter_levels"] == [
+        dict(peak=5, rms=0.5),
+        dict(peak=0.25, rms=5),
+    ]
+    peaks, rms = meters.get_input_meter_history(count=2)
+    assert peaks.tolist() == [[4, 0.25], [5, 0.25]]
+    assert rms.tolist() == [[0.5, 4], [0.5, 5]]
+    peaks, rms = meters.get_output_meter_history()
+    assert peaks.tolist() == [[1, 6], [3, 4], [5, 2]]
+    assert rms.tolist() == [[0.5, 1], [0.5, 3], [0.5, 5]]
+
+
+def test_benchmark():
+    channel_count, packet_count = 8, 20000
+    message = supriya.osc.OscMessage(
+        "/meter.outputs", 1000, -1, *[0.5] * (channel_count * 2)
+    )
+    meters = supriya.realtime.ServerMeters(supriya.realtime.Server())
+    meters._input_meter_history = supriya.system.RingBuffer(width=channel_count * 2)
+    meters._output_meter_history = supriya.system.RingBuffer(width=channel_count * 2)
+    timer = uqbar.io.Timer()
+    with timer:
+        for _ in range(packet_count):
+            meters._handle_output_levels(message)
+    print("{} meter packets: {:.3f}s".format(packet_count, timer.elapsed_time))
+    with timer:
+        for _ in range(100):
+            peaks, rms = meters.get_output_meter_history(count=1000)
+    print("100 pulls of 1000 levels: {:.3f}s".format(timer.elapsed_time))
+    assert peaks.shape == rms.shape == (1000, channel_count)
+    assert numpy.all(peaks == 0.5)
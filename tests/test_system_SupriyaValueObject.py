@@ -0,0 +1,157 @@
+import copy
+
+import pytest
+import uqbar.io
+import uqbar.objects
+
+import supriya.commands
+import supriya.osc
+import supriya.patterns
+from supriya import utils
+
+
+def reference_eq(one, two):
+    one_values = type(one), uqbar.objects.get_vars(one)
+    try:
+        two_values = type(two), uqbar.objects.get_vars(two)
+    except AttributeError:
+        two_values = type(two), two
+    return one_values == two_values
+
+
+def reference_hash(object_):
+    args, var_args, kwargs = uqbar.objects.get_vars(object_)
+    hash_values = [type(object_)]
+    hash_values.append(tuple(args.items()))
+    hash_values.append(tuple(var_args))
+    hash_values.append(tuple(sorted(kwargs.items())))
+    return hash(tuple(hash_values))
+
+
+def make_objects():
+    return [
+        supriya.osc.OscMessage("/n_set", 1000, "frequency", 440.0),
+        supriya.osc.OscMessage("/n_set", 1000, "frequency", 443.0),
+        supriya.osc.OscMessage("/n_set", 1000, "frequency", 440.0),
+        supriya.osc.OscBundle(
+            timestamp=1.5, contents=[supriya.osc.OscMessage("/n_free", 1000)]
+        ),
+        supriya.osc.OscBundle(contents=[supriya.osc.OscMessage("/n_free", 1000)]),
+        supriya.commands.SynthNewRequest(
+            node_id=1000, synthdef="default", target_node_id=1, frequency=440
+        ),
+        supriya.commands.SynthNewRequest(
+            node_id=1000, synthdef="default", target_node_id=1, frequency=440
+        ),
+        supriya.commands.SynthNewRequest(
+            node_id=1000, synthdef="default", target_node_id=1, amplitude=0.5
+        ),
+        supriya.commands.NodeFreeRequest(node_ids=[1000, 1001]),
+        supriya.commands.GroupNewRequest(
+            items=[
+                supriya.commands.GroupNewRequest.Item(node_id=1001, target_node_id=1)
+            ]
+        ),
+        supriya.patterns.NoteEvent(duration=1, frequency=[440, 550]),
+        supriya.patterns.NoteEvent(duration=1, frequency=[440, 550]),
+        supriya.patterns.NoteEvent(duration=1, frequency=[440, 660]),
+        supriya.patterns.NullEvent(delta=0.25),
+        supriya.patterns.Pseq([1, 2, 3], repetitions=2),
+        supriya.patterns.Pseq([1, 2, 3], repetitions=None),
+        supriya.patterns.Pbind(
+            frequency=supriya.patterns.Pseq([440, 660]), duration=0.5
+        ),
+        supriya.patterns.Pbind(
+            frequency=supriya.patterns.Pseq([440, 660]), duration=0.5
+        ),
+        supriya.patterns.Pchain(
+            [supriya.patterns.Pbind(amplitude=0.5), supriya.patterns.Pbind(duration=1)]
+        ),
+    ]
+
+
+def test_get_vars():
+    for object_ in make_objects():
+        args, var_args, kwargs = utils.get_vars(object_)
+        expected_args, expected_var_args, expected_kwargs = uqbar.objects.get_vars(
+            object_
+        )
+        assert list(args.items()) == list(expected_args.items())
+        assert var_args == expected_var_args
+        assert kwargs == expected_kwargs
+
+
+def test_eq_and_hash():
+    objects = make_objects()
+    for one in objects:
+        for two in objects + [None, 1, "foo"]:
+            assert (one == two) is reference_eq(one, two)
+        try:
+            expected = reference_hash(one)
+        except TypeError:
+            with pytest.raises(TypeError):
+                hash(one)
+        else:
+            assert hash(one) == expected
+
+
+@pytest.mark.parametrize(
+    "object_, args, kwargs",
+    [
+        (supriya.osc.OscMessage("/n_set", 1000), ("amplitude", 0.5), {}),
+        (supriya.patterns.NoteEvent(duration=1), (), {"frequency": 550}),
+        (
+            supriya.commands.SynthNewRequest(node_id=1000, synthdef="default"),
+            (),
+            {"node_id": 1001, "frequency": 220},
+        ),
+        (
+            supriya.patterns.Pbind(
+                pattern=supriya.patterns.Pbind(duration=1), amplitude=0.5
+            ),
+            (),
+            {"pattern__duration": 2},
+        ),
+    ],
+)
+def test_new(object_, args, kwargs):
+    expected = uqbar.objects.new(object_, *args, **dict(kwargs))
+    actual = utils.new(object_, *args, **dict(kwargs))
+    assert type(actual) is type(expected)
+    assert repr(actual) == repr(expected)
+    assert repr(copy.copy(object_)) == repr(object_)
+
+
+def test_benchmark():
+    objects = make_objects()
+    timer = uqbar.io.Timer()
+    with timer:
+        for _ in range(100):
+            for one in objects:
+                for two in objects:
+                    reference_eq(one, two)
+    reference_time = timer.elapsed_time
+    with timer:
+        for _ in range(100):
+            for one in objects:
+                for two in objects:
+                    one == two
+    print(
+        "{} comparisons: reference {:.3f}s, cached {:.3f}s".format(
+            100 * len(objects) ** 2, reference_time, timer.elapsed_time
+        )
+    )
+    with timer:
+        for _ in range(1000):
+            for object_ in objects:
+                uqbar.objects.new(object_)
+    reference_time = timer.elapsed_time
+    with timer:
+        for _ in range(1000):
+            for object_ in objects:
+                utils.new(object_)
+    print(
+        "{} copies: reference {:.3f}s, cached {:.3f}s".format(
+            1000 * len(objects), reference_time, timer.elapsed_time
+        )
+    )
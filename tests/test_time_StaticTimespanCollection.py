@@ -0,0 +1,137 @@
+import random
+
+import pytest
+from abjad import Timespan
+
+import supriya.time
+
+
+def make_random_timespans(count=10, range_=10, degenerate=False, random_=random):
+    timespans = []
+    for _ in range(count):
+        if degenerate:
+            start_offset, stop_offset = sorted(random_.randrange(range_) for _ in "ab")
+        else:
+            start_offset, stop_offset = sorted(random_.sample(range(range_), 2))
+        timespans.append(Timespan(start_offset, stop_offset))
+    return timespans
+
+
+def make_timespan_collections(timespans):
+    return (
+        supriya.time.TimespanCollection(timespans),
+        supriya.time.StaticTimespanCollection(timespans),
+    )
+
+
+def test_read_only():
+    timespan_collection = supriya.time.StaticTimespanCollection([Timespan(0, 1)])
+    with pytest.raises(TypeError):
+        timespan_collection.insert(Timespan(1, 2))
+    with pytest.raises(TypeError):
+        timespan_collection.remove(Timespan(0, 1))
+    with pytest.raises(TypeError):
+        timespan_collection[0] = Timespan(1, 2)
+    assert timespan_collection[:] == [Timespan(0, 1)]
+
+
+def test_empty():
+    expected, actual = make_timespan_collections([])
+    assert len(actual) == 0
+    assert actual[:] == []
+    assert actual.find_intersection(0) == []
+    assert actual.find_intersections([0, Timespan(0, 1)]) == [[], []]
+    assert actual.get_start_offset_after(0) is None
+    assert actual.get_start_offset_before(0) is None
+    for name in (
+        "earliest_start_offset",
+        "earliest_stop_offset",
+        "latest_start_offset",
+        "latest_stop_offset",
+    ):
+        assert getattr(actual, name) == getattr(expected, name)
+
+
+@pytest.mark.parametrize("degenerate", [True, False])
+def test_equivalence(degenerate):
+    for _ in range(100):
+        timespans = make_random_timespans(count=15, range_=15, degenerate=degenerate)
+        expected, actual = make_timespan_collections(timespans)
+        assert len(actual) == len(expected)
+        assert list(actual) == list(expected)
+        assert actual[3] == expected[3]
+        assert actual[-1] == expected[-1]
+        assert actual[2:7] == expected[2:7]
+        for timespan in timespans:
+            assert timespan in actual
+            assert actual.index(timespan) == expected.index(timespan)
+        assert Timespan(-1, 100) not in actual
+        with pytest.raises(ValueError):
+            actual.index(Timespan(-1, 100))
+        for name in (
+            "earliest_start_offset",
+            "earliest_stop_offset",
+            "latest_start_offset",
+            "latest_stop_offset",
+        ):
+            assert getattr(actual, name) == getattr(expected, name)
+        offsets = [x / 2 for x in range(-2, 33)]
+        for offset in offsets:
+            assert actual.find_intersection(offset) == expected.find_intersection(
+                offset
+            )
+            assert actual.find_timespans_starting_at(
+                offset
+            ) == expected.find_timespans_starting_at(offset)
+            assert actual.find_timespans_stopping_at(
+                offset
+            ) == expected.find_timespans_stopping_at(offset)
+            assert actual.get_start_offset_after(
+                offset
+            ) == expected.get_start_offset_after(offset)
+            assert actual.get_start_offset_before(
+                offset
+            ) == expected.get_start_offset_before(offset)
+        for actual_simultaneity, expected_simultaneity in zip(
+            actual.get_simultaneities_at(offsets),
+            expected.get_simultaneities_at(offsets),
+        ):
+            assert actual_simultaneity.timespan_collection is actual
+            assert (
+                actual_simultaneity.start_timespans
+                == expected_simultaneity.start_timespans
+            )
+            assert (
+                actual_simultaneity.stop_timespans
+                == expected_simultaneity.stop_timespans
+            )
+            assert (
+                actual_simultaneity.overlap_timespans
+                == expected_simultaneity.overlap_timespans
+            )
+        assert [x.start_offset for x in actual.iterate_simultaneities()] == [
+            x.start_offset for x in expected.iterate_simultaneities()
+        ]
+
+
+@pytest.mark.parametrize(
+    "timespans",
+    [
+        [Timespan(0, 15)],
+        [Timespan(0, 5), Timespan(5, 10), Timespan(10, 15)],
+        [Timespan(0, 15), Timespan(3, 12), Timespan(6, 9), Timespan(6, 9)],
+        [Timespan(0, 1), Timespan(0, 2), Timespan(1, 2), Timespan(13, 14)],
+    ]
+    + [
+        make_random_timespans(count=15, range_=15, random_=random.Random(seed))
+        for seed in range(4)
+    ],
+)
+def test_find_intersection_sweep(timespans):
+    expected, actual = make_timespan_collections(timespans)
+    for start_offset in range(-1, 16):
+        for stop_offset in range(start_offset, 17):
+            timespan = Timespan(start_offset, stop_offset)
+            assert actual.find_intersection(timespan) == expected.find_intersection(
+                timespan
+            )
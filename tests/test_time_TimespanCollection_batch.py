@@ -0,0 +1,122 @@
+import random
+
+import pytest
+import uqbar.io
+from abjad import Timespan
+
+import supriya.time
+
+
+def make_random_timespans(count=10, range_=10, degenerate=False):
+    timespans = []
+    for _ in range(count):
+        if degenerate:
+            start_offset, stop_offset = sorted(random.randrange(range_) for _ in "ab")
+        else:
+            start_offset, stop_offset = sorted(random.sample(range(range_), 2))
+        timespans.append(Timespan(start_offset, stop_offset))
+    return timespans
+
+
+def make_queries(count=10, range_=10):
+    queries = [random.randrange(-1, range_ + 1) for _ in range(count)]
+    queries.extend(random.randrange(range_) + 0.5 for _ in range(count))
+    for _ in range(count):
+        start_offset, stop_offset = sorted(
+            random.randrange(-1, range_ + 1) for _ in "ab"
+        )
+        queries.append(Timespan(start_offset, stop_offset))
+    random.shuffle(queries)
+    return queries
+
+
+@pytest.mark.parametrize("accelerated", [True, False])
+def test_insert_bulk(accelerated):
+    for _ in range(100):
+        timespans = make_random_timespans(count=random.randrange(30), degenerate=True)
+        split = random.randrange(len(timespans) + 1)
+        expected = supriya.time.TimespanCollection(accelerated=accelerated)
+        for timespan in timespans:
+            expected.insert(timespan)
+        actual = supriya.time.TimespanCollection(
+            timespans[:split], accelerated=accelerated
+        )
+        actual.insert(timespans[split:])
+        assert actual[:] == expected[:]
+        assert actual.earliest_stop_offset == expected.earliest_stop_offset
+        assert actual.latest_stop_offset == expected.latest_stop_offset
+        for timespan in timespans:
+            assert actual.index(timespan) == expected.index(timespan)
+        if actual._root_node is not None:
+            assert actual._root_node.height <= len(timespans).bit_length()
+
+
+@pytest.mark.parametrize("accelerated", [True, False])
+def test_find_intersections(accelerated):
+    for _ in range(100):
+        timespans = make_random_timespans(count=15, range_=15)
+        timespan_collection = supriya.time.TimespanCollection(
+            timespans, accelerated=accelerated
+        )
+        queries = make_queries(range_=15)
+        actual = timespan_collection.find_intersections(queries)
+        expected = [timespan_collection.find_intersection(query) for query in queries]
+        assert actual == expected
+
+
+@pytest.mark.parametrize("accelerated", [True, False])
+def test_get_simultaneities_at(accelerated):
+    for _ in range(100):
+        timespans = make_random_timespans(count=15, range_=15, degenerate=True)
+        timespan_collection = supriya.time.TimespanCollection(
+            timespans, accelerated=accelerated
+        )
+        offsets = [random.randrange(-1, 16) for _ in range(20)]
+        actual = timespan_collection.get_simultaneities_at(offsets)
+        for simultaneity, offset in zip(actual, offsets):
+            expected = timespan_collection.get_simultaneity_at(offset)
+            assert simultaneity.timespan_collection is timespan_collection
+            assert simultaneity.start_offset == expected.start_offset
+            assert simultaneity.start_timespans == expected.start_timespans
+            assert simultaneity.stop_timespans == expected.stop_timespans
+            assert simultaneity.overlap_timespans == expected.overlap_timespans
+
+
+@pytest.mark.timeout(120)
+@pytest.mark.parametrize("accelerated", [True, False])
+def test_benchmark(accelerated):
+    random.seed(0)
+    timespans = []
+    for _ in range(2000):
+        start_offset = random.randrange(10000)
+        timespans.append(Timespan(start_offset, start_offset + random.randrange(1, 50)))
+    timespans.sort()
+    offsets = [random.randrange(10000) for _ in range(10000)]
+    with uqbar.io.Timer() as timer:
+        expected_collection = supriya.time.TimespanCollection(accelerated=accelerated)
+        for timespan in timespans:
+            expected_collection.insert(timespan)
+    insert_time = timer.elapsed_time
+    with uqbar.io.Timer() as timer:
+        timespan_collection = supriya.time.TimespanCollection(
+            timespans, accelerated=accelerated
+        )
+    bulk_time = timer.elapsed_time
+    with uqbar.io.Timer() as timer:
+        expected = [timespan_collection.find_intersection(x) for x in offsets]
+    query_time = timer.elapsed_time
+    with uqbar.io.Timer() as timer:
+        actual = timespan_collection.find_intersections(offsets)
+    batch_time = timer.elapsed_time
+    with uqbar.io.Timer() as timer:
+        static_collection = supriya.time.StaticTimespanCollection(timespans)
+        static = static_collection.find_intersections(offsets)
+    static_time = timer.elapsed_time
+    print(
+        "accelerated: {}, insert {:.4f}s, bulk {:.4f}s, "
+        "query {:.4f}s, batch {:.4f}s, static {:.4f}s".format(
+            accelerated, insert_time, bulk_time, query_time, batch_time, static_time
+        )
+    )
+    assert expected_collection[:] == timespan_collection[:]
+    assert actual == expected == static